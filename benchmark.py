@@ -26,10 +26,13 @@ import time
 from pcollections import drivers
 from pcollections import backends
 from pcollections import collections
+from pcollections import codecs
 
 
 _REDIS_DB = 9
 _ITR = 100000
+_BULK = 10000
+_BULK_ITR = 100
 
 
 if __name__ == '__main__':
@@ -97,5 +100,39 @@ if __name__ == '__main__':
     iops = itr/dur
     print("iops ({} iterations) = {}".format(itr, iops))
 
+    print("Testing Collections List Extend...")
+    l = collections.MutableList("test_list_col", create=[])
+    seq = [str(i) for i in range(_BULK)]
+    start = time.perf_counter()
+    for i in range(_BULK_ITR):
+        l.extend(seq)
+    end = time.perf_counter()
+    assert(len(l) == (_BULK * _BULK_ITR))
+    dur = end - start
+    iops = (_BULK * _BULK_ITR)/dur
+    print("items/s ({} x {} items) = {}".format(_BULK_ITR, _BULK, iops))
+
+    print("Testing Collections JSON Dictionary Update...")
+    d = collections.MutableDictionary("test_dict_col", create={}, codec=codecs.JsonCodec())
+    val = {str(i): [i, {"v": str(i)}] for i in range(_BULK)}
+    start = time.perf_counter()
+    for i in range(_BULK_ITR):
+        d.update(val)
+    end = time.perf_counter()
+    assert(len(d) == _BULK)
+    dur = end - start
+    iops = (_BULK * _BULK_ITR)/dur
+    print("items/s ({} x {} items) = {}".format(_BULK_ITR, _BULK, iops))
+
+    print("Testing Collections JSON Dictionary Set...")
+    start = time.perf_counter()
+    for i in range(_BULK_ITR):
+        d.set_val(val)
+    end = time.perf_counter()
+    assert(len(d) == _BULK)
+    dur = end - start
+    iops = (_BULK * _BULK_ITR)/dur
+    print("items/s ({} x {} items) = {}".format(_BULK_ITR, _BULK, iops))
+
     # Clear DB
     driver.redis.flushdb()
@@ -145,8 +145,45 @@ class MutableString(abc_base.String, MutableSequence):
 class MutableList(abc_base.List, MutableSequence):
     pass
 
+class MutableArray(abc_base.Array, MutableSequence):
+    pass
+
 class MutableSet(abc_base.Set, MutableBaseSet):
     pass
 
 class MutableDictionary(abc_base.Dictionary, MutableMapping):
     pass
+
+class MutableCounter(abc_base.Counter, MutableMapping):
+
+    @abc.abstractmethod
+    def incr(self, key, amount=1):
+        """Add amount to Count of key, Returning the New Count"""
+        pass
+
+    @abc.abstractmethod
+    def subtract(self, *args, **kwargs):
+        """Subtract Counts from Iterable or Mapping"""
+        pass
+
+class AtomicInteger(abc_base.Integer, abc_base.Mutable):
+
+    @abc.abstractmethod
+    def incr(self, amount=1):
+        """Add amount, Returning the New Value"""
+        pass
+
+    @abc.abstractmethod
+    def decr(self, amount=1):
+        """Subtract amount, Returning the New Value"""
+        pass
+
+    def __iadd__(self, other):
+        """+="""
+        self.incr(other)
+        return self
+
+    def __isub__(self, other):
+        """-="""
+        self.decr(other)
+        return self
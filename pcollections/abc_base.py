@@ -24,6 +24,7 @@ from future.utils import python_2_unicode_compatible
 from builtins import *
 
 import abc
+import array
 import collections
 
 from . import exceptions
@@ -132,6 +133,10 @@ class Persistent(with_metaclass(abc.ABCMeta, object)):
 
     def get_val(self):
         """Get value as Python types"""
+        return self._get_val()
+
+    def _get_val(self):
+        """Get value as python types"""
         return self._decode_val_obj(self._get_val_raw())
 
     @abc.abstractmethod
@@ -161,7 +166,7 @@ class Persistent(with_metaclass(abc.ABCMeta, object)):
 
     def __str__(self):
         """Return String Representation"""
-        return str(self.get_val())
+        return str(self._get_val())
 
     def __repr__(self):
         """Return Unique Representation"""
@@ -169,7 +174,7 @@ class Persistent(with_metaclass(abc.ABCMeta, object)):
 
     def __bool__(self):
         """Test Bool"""
-        return bool(self.get_val())
+        return bool(self._get_val())
 
 class Mutable(Persistent):
 
@@ -182,14 +187,14 @@ class Equality(Persistent):
     def __eq__(self, other):
         """Test Equality"""
         if (type(other) == type(self)):
-            return (self.get_val() == other.get_val())
+            return (self._get_val() == other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def __ne__(self, other):
         """Test Unequality"""
         if (type(other) == type(self)):
-            return (self.get_val() != other.get_val())
+            return (self._get_val() != other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
@@ -198,28 +203,28 @@ class Comparable(Equality):
     def __lt__(self, other):
         """Test Less Than"""
         if (type(other) == type(self)):
-            return (self.get_val() < other.get_val())
+            return (self._get_val() < other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def __le__(self, other):
         """Test Less Than Equal"""
         if (type(other) == type(self)):
-            return (self.get_val() <= other.get_val())
+            return (self._get_val() <= other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def __gt__(self, other):
         """Test Greater Than"""
         if (type(other) == type(self)):
-            return (self.get_val() > other.get_val())
+            return (self._get_val() > other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def __ge__(self, other):
         """Test Greater Than Equal"""
         if (type(other) == type(self)):
-            return (self.get_val() >= other.get_val())
+            return (self._get_val() >= other._get_val())
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
@@ -227,26 +232,35 @@ class Container(Persistent, collections.Container):
 
     def __contains__(self, itm):
         """Contains Seq Item"""
-        return itm in self.get_val()
+        return itm in self._get_val()
 
 class Iterable(Persistent, collections.Iterable):
 
     def __iter__(self):
         """Iterate Across Seq"""
-        for itm in self.get_val():
+        for itm in self._get_val():
             yield itm
 
 class Sized(Persistent, collections.Sized):
 
     def __len__(self):
         """Get Len of Set"""
-        return len(self.get_val())
+        return len(self._get_val())
 
 class Sequence(Container, Iterable, Sized, collections.Sequence):
 
     def __getitem__(self, idx):
         """Get Seq Item"""
-        return self.get_val()[idx]
+        return self._get_val()[idx]
+
+    def index(self, itm, *args):
+        """Get Index of Seq Item"""
+        return self._get_val().index(itm, *args)
+
+    def __reversed__(self):
+        """Iterate Across Seq in Reverse"""
+        for itm in reversed(self._get_val()):
+            yield itm
 
 class MutableSequence(Sequence, Mutable, collections.MutableSequence):
 
@@ -270,70 +284,70 @@ class BaseSet(Comparable, Container, Iterable, Sized, collections.Set):
     def __and__(self, other):
         """Return Intersection"""
         if (type(other) == type(self)):
-            return (self.get_val() & other.get_val())
+            return (self._get_val() & other._get_val())
         else:
             raise TypeError("Can only and {}".format(type(self)))
 
     def __or__(self, other):
         """Return Union"""
         if (type(other) == type(self)):
-            return (self.get_val() | other.get_val())
+            return (self._get_val() | other._get_val())
         else:
             raise TypeError("Can only or {}".format(type(self)))
 
     def __xor__(self, other):
         """Return Symmetric Difference"""
         if (type(other) == type(self)):
-            return (self.get_val() ^ other.get_val())
+            return (self._get_val() ^ other._get_val())
         else:
             raise TypeError("Can only xor {}".format(type(self)))
 
     def __sub__(self, other):
         """Return Difference"""
         if (type(other) == type(self)):
-            return (self.get_val() - other.get_val())
+            return (self._get_val() - other._get_val())
         else:
             raise TypeError("Can only sub {}".format(type(self)))
 
     def issubset(self, other):
         """Test Subset"""
         if (type(other) == type(self)):
-            return (self.get_val().issubset(other.get_val()))
+            return (self._get_val().issubset(other._get_val()))
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def issuperset(self, other):
         """Test Superset"""
         if (type(other) == type(self)):
-            return (self.get_val().issuperset(other.get_val()))
+            return (self._get_val().issuperset(other._get_val()))
         else:
             raise TypeError("Can only compare {}".format(type(self)))
 
     def intersection(self, other):
         """Return Intersection"""
         if (type(other) == type(self)):
-            return (self.get_val().intersection(other.get_val()))
+            return (self._get_val().intersection(other._get_val()))
         else:
             raise TypeError("Can only intersect {}".format(type(self)))
 
     def union(self, other):
         """Return Union"""
         if (type(other) == type(self)):
-            return (self.get_val().union(other.get_val()))
+            return (self._get_val().union(other._get_val()))
         else:
             raise TypeError("Can only union {}".format(type(self)))
 
     def difference(self, other):
         """Return Difference"""
         if (type(other) == type(self)):
-            return (self.get_val().difference(other.get_val()))
+            return (self._get_val().difference(other._get_val()))
         else:
             raise TypeError("Can only difference {}".format(type(self)))
 
     def symmetric_difference(self, other):
         """Return Symmetric Difference"""
         if (type(other) == type(self)):
-            return (self.get_val().symmetric_difference(other.get_val()))
+            return (self._get_val().symmetric_difference(other._get_val()))
         else:
             raise TypeError("Can only symmetric_difference {}".format(type(self)))
 
@@ -353,7 +367,7 @@ class Mapping(Equality, Container, Iterable, Sized, collections.Mapping):
 
     def __getitem__(self, key):
         """Get Mapping Item"""
-        return self.get_val()[key]
+        return self._get_val()[key]
 
 class MutableMapping(Mapping, Mutable, collections.MutableMapping):
 
@@ -377,8 +391,17 @@ class MutableString(String, MutableSequence):
     def __setitem__(self, idx, item):
         """Set Seq Item"""
 
+        # Set slice as a list of characters
+        if isinstance(idx, slice):
+            if not (isinstance(item, str) or isinstance(item, native_str)):
+                raise TypeError("can only assign str to a slice")
+            chars = list(self._get_val())
+            chars[idx] = list(item)
+            self.set_val("".join(chars))
+            return
+
         # Get string
-        val_in = self.get_val()
+        val_in = self._get_val()
         length = len(val_in)
 
         # Check bounds
@@ -399,8 +422,15 @@ class MutableString(String, MutableSequence):
     def __delitem__(self, idx):
         """Del Seq Item"""
 
+        # Del slice as a list of characters
+        if isinstance(idx, slice):
+            chars = list(self._get_val())
+            del(chars[idx])
+            self.set_val("".join(chars))
+            return
+
         # Get string
-        val_in = self.get_val()
+        val_in = self._get_val()
         length = len(val_in)
 
         # Check bounds
@@ -421,7 +451,7 @@ class MutableString(String, MutableSequence):
         """Insert Seq Item"""
 
         # Get String
-        val_in = self.get_val()
+        val_in = self._get_val()
 
         # No bounds check: slicing works without it
 
@@ -439,21 +469,49 @@ class MutableList(List, MutableSequence):
     def __setitem__(self, idx, itm):
         """Set Seq Item"""
 
-        val = self.get_val()
+        val = self._get_val()
+        val[idx] = itm
+        self.set_val(val)
+
+    def __delitem__(self, idx):
+        """Del Seq Item"""
+
+        val = self._get_val()
+        del(val[idx])
+        self.set_val(val)
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        val = self._get_val()
+        val.insert(idx, itm)
+        self.set_val(val)
+
+class Array(Sequence):
+    pass
+
+class MutableArray(Array, MutableSequence):
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        val = self._get_val()
+        if isinstance(idx, slice):
+            itm = array.array(val.typecode, itm)
         val[idx] = itm
         self.set_val(val)
 
     def __delitem__(self, idx):
         """Del Seq Item"""
 
-        val = self.get_val()
+        val = self._get_val()
         del(val[idx])
         self.set_val(val)
 
     def insert(self, idx, itm):
         """Insert Seq Item"""
 
-        val = self.get_val()
+        val = self._get_val()
         val.insert(idx, itm)
         self.set_val(val)
 
@@ -466,11 +524,10 @@ class MutableSet(Set, MutableBaseSet):
         """Add Item to Set"""
 
         # Validate Input
-        if not (isinstance(itm, str) or isinstance(itm, native_str)):
-            raise TypeError("{} not supported in set".format(type(itm)))
+        self._encode_val_item(itm, test=True)
 
         # R/U/W
-        val = self.get_val()
+        val = self._get_val()
         val.add(itm)
         self.set_val(val)
 
@@ -478,14 +535,84 @@ class MutableSet(Set, MutableBaseSet):
         """Remove Item from Set if Present"""
 
         # Validate Input
-        if not (isinstance(itm, str) or isinstance(itm, native_str)):
-            raise TypeError("{} not supported in set".format(type(itm)))
+        self._encode_val_item(itm, test=True)
 
         # R/U/W
-        val = self.get_val()
+        val = self._get_val()
         val.discard(itm)
         self.set_val(val)
 
+    def add_many(self, itms):
+        """Add Items to Set, Returning Count Added"""
+
+        # R/U/W
+        val = self._get_val()
+        length = len(val)
+        val |= set(itms)
+        self.set_val(val)
+        return len(val) - length
+
+    def discard_many(self, itms):
+        """Remove Items from Set if Present, Returning Count Removed"""
+
+        # R/U/W
+        val = self._get_val()
+        length = len(val)
+        val -= set(itms)
+        self.set_val(val)
+        return length - len(val)
+
+    def pop_n(self, count):
+        """Pop up to count Items from Set"""
+
+        # Validate Input
+        if count < 0:
+            raise ValueError("count must not be negative")
+
+        # R/U/W
+        val = self._get_val()
+        ret = set()
+        while val and (len(ret) < count):
+            ret.add(val.pop())
+        self.set_val(val)
+        return ret
+
+    def __ior__(self, other):
+        """Unary or"""
+
+        # R/U/W
+        val = self._get_val()
+        val |= set(other)
+        self.set_val(val)
+        return self
+
+    def __iand__(self, other):
+        """Unary and"""
+
+        # R/U/W
+        val = self._get_val()
+        val &= set(other)
+        self.set_val(val)
+        return self
+
+    def __ixor__(self, other):
+        """Unary xor"""
+
+        # R/U/W
+        val = self._get_val()
+        val ^= set(other)
+        self.set_val(val)
+        return self
+
+    def __isub__(self, other):
+        """Unary subtract"""
+
+        # R/U/W
+        val = self._get_val()
+        val -= set(other)
+        self.set_val(val)
+        return self
+
 class Dictionary(Mapping):
     pass
 
@@ -494,13 +621,127 @@ class MutableDictionary(Dictionary, MutableMapping):
     def __setitem__(self, key, itm):
         """Set Mapping Item"""
 
-        val = self.get_val()
+        val = self._get_val()
         val[key] = itm
         self.set_val(val)
 
     def __delitem__(self, key):
         """Delete Mapping Item"""
 
-        val = self.get_val()
+        val = self._get_val()
         del(val[key])
         self.set_val(val)
+
+    def update(self, *args, **kwargs):
+        """Update Dictionary"""
+
+        val = self._get_val()
+        val.update(*args, **kwargs)
+        self.set_val(val)
+        return self
+
+    def delete_many(self, keys):
+        """Delete Keys if Present, Returning Count Deleted"""
+
+        val = self._get_val()
+        length = len(val)
+        for key in keys:
+            val.pop(key, None)
+        self.set_val(val)
+        return length - len(val)
+
+class Counter(Dictionary):
+
+    def get(self, key, default=None):
+        """Get Count of Item or default"""
+        return self._get_val().get(key, default)
+
+    def most_common(self, n=None):
+        """Return List of the n Most Common Items and their Counts"""
+        return self._get_val().most_common(n)
+
+    def elements(self):
+        """Iterate Across Items, Repeating Each as Many Times as its Count"""
+        return self._get_val().elements()
+
+    def total(self):
+        """Get Sum of Counts"""
+        return sum(self._get_val().values())
+
+class MutableCounter(Counter, MutableDictionary):
+
+    def incr(self, key, amount=1):
+        """Add amount to Count of key, Returning the New Count"""
+
+        val = self._get_val()
+        val[key] += amount
+        self.set_val(val)
+        return val[key]
+
+    def update(self, *args, **kwargs):
+        """Add Counts from Iterable or Mapping"""
+
+        val = self._get_val()
+        val.update(*args, **kwargs)
+        self.set_val(val)
+        return self
+
+    def subtract(self, *args, **kwargs):
+        """Subtract Counts from Iterable or Mapping"""
+
+        val = self._get_val()
+        val.subtract(*args, **kwargs)
+        self.set_val(val)
+        return self
+
+    def setdefault(self, key, default=None):
+        """Return Count of Item or Set to Default"""
+
+        val = self._get_val()
+        ret = val.setdefault(key, default)
+        self.set_val(val)
+        return ret
+
+    def pop(self, key, *args):
+        """Remove Item and Return its Count, or Default if Missing"""
+
+        val = self._get_val()
+        ret = val.pop(key, *args)
+        self.set_val(val)
+        return ret
+
+class Integer(Comparable):
+
+    def __int__(self):
+        """Get Value as int"""
+        return self._get_val()
+
+    def __index__(self):
+        """Get Value as Index"""
+        return self._get_val()
+
+class AtomicInteger(Integer, Mutable):
+
+    def incr(self, amount=1):
+        """Add amount, Returning the New Value"""
+
+        self._encode_val_item(amount, test=True)
+        val = self._get_val() + amount
+        self.set_val(val)
+        return val
+
+    def decr(self, amount=1):
+        """Subtract amount, Returning the New Value"""
+
+        self._encode_val_item(amount, test=True)
+        return self.incr(-amount)
+
+    def __iadd__(self, other):
+        """+="""
+        self.incr(other)
+        return self
+
+    def __isub__(self, other):
+        """-="""
+        self.decr(other)
+        return self
@@ -27,6 +27,7 @@ import abc
 from . import drivers
 from . import be_redis_base
 from . import be_redis_atomic
+from . import be_redis_script
 
 
 ### Abstract Classes ###
@@ -59,6 +60,18 @@ class Backend(with_metaclass(abc.ABCMeta, object)):
     def module(self):
         return self._module
 
+    ## Batches ##
+
+    def batch(self, size=None):
+        """Return Context that Batches Calls on this Backend"""
+        raise TypeError("{} does not support batches".format(type(self).__name__))
+
+    ## Buffers ##
+
+    def buffered(self, obj, interval=1.0, size=1000):
+        """Return Write-Behind Wrapper for obj"""
+        raise TypeError("{} does not support buffers".format(type(self).__name__))
+
 
 ### Classes ###
 
@@ -87,3 +100,34 @@ class RedisAtomicBackend(Backend):
 
         # Call Parent
         super().__init__(be_redis_atomic, driver)
+
+    ## Buffers ##
+
+    def buffered(self, obj, interval=1.0, size=1000):
+        """Return Write-Behind Wrapper for a MutableDictionary or MutableSet"""
+        return self.module.buffered(obj, interval=interval, size=size)
+
+class RedisScriptBackend(Backend):
+
+    ## Methods ##
+
+    def __init__(self, driver):
+
+        # Check Input
+        if not isinstance(driver, drivers.RedisDriver):
+            raise TypeError("driver must be instance of RedisDriver")
+
+        # Call Parent
+        super().__init__(be_redis_script, driver)
+
+    ## Batches ##
+
+    def batch(self, size=None):
+        """Return Context that Batches Script Calls into MULTI/EXEC Pipelines"""
+        return self.module.Batch(self.driver, size=size)
+
+    ## Buffers ##
+
+    def buffered(self, obj, interval=1.0, size=1000):
+        """Return Write-Behind Wrapper for a MutableDictionary or MutableSet"""
+        return self.module.buffered(obj, interval=interval, size=size)
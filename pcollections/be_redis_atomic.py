@@ -15,13 +15,321 @@ from __future__ import absolute_import
 from future import standard_library
 standard_library.install_aliases()
 from future.utils import native_str
+from future.utils import viewitems
+from future.utils import with_metaclass
 from builtins import *
 
+import abc
+import atexit
+import collections
+import threading
+import uuid
+import weakref
+
+import redis
+
 from . import exceptions
 from . import be_redis_base
 from . import abc_atomic
 
 
+### Constants ###
+
+_PREFIX_SENTINEL = "_pcollections_sentinel"
+_BULK_CHUNK = 1000
+_BUFFER_INTERVAL = 1.0
+_BUFFER_SIZE = 1000
+_BUFFERS = weakref.WeakSet()
+_ERR_DNE = "PCOL_DNE"
+_ERR_INDEX = "PCOL_INDEX"
+
+
+### Lua Scripts ###
+
+# Replace bytes [start, stop) of the string at key with rep and return the
+# removed bytes. Same-width edits are a SETRANGE in place and growing edits
+# only rewrite the tail; Redis has no truncate, so shrinking edits rebuild
+# the value server-side.
+_LUA_SPLICE = """
+local function splice(key, start, stop, rep)
+    local len = redis.call('STRLEN', key)
+    local removed = ''
+    if stop > start then
+        removed = redis.call('GETRANGE', key, start, stop - 1)
+    end
+    if string.len(rep) == (stop - start) then
+        if stop > start then
+            redis.call('SETRANGE', key, start, rep)
+        end
+        return removed
+    end
+    local tail = ''
+    if stop < len then
+        tail = redis.call('GETRANGE', key, stop, -1)
+    end
+    if (start + string.len(rep) + string.len(tail)) >= len then
+        if (string.len(rep) + string.len(tail)) > 0 then
+            redis.call('SETRANGE', key, start, rep .. tail)
+        end
+    else
+        local head = ''
+        if start > 0 then
+            head = redis.call('GETRANGE', key, 0, start - 1)
+        end
+        redis.call('SET', key, head .. rep .. tail)
+    end
+    return removed
+end
+"""
+
+_LUA_STRING_REMOVE = _LUA_SPLICE + """
+local val = redis.call('GET', KEYS[1]) or ''
+local idx = string.find(val, ARGV[1], 1, true)
+if not idx then
+    return false
+end
+return splice(KEYS[1], idx - 1, idx - 1 + string.len(ARGV[1]), '')
+"""
+
+# Replace characters [ARGV[1], ARGV[2]) with ARGV[3] using slice semantics
+_LUA_STRING_SLICE_SPLICE = (be_redis_base._LUA_UTF8 + be_redis_base._LUA_SLICE +
+                            _LUA_SPLICE + """
+local val = redis.call('GET', KEYS[1]) or ''
+local len = utf8_len(val)
+local start, stop = bounds(len, ARGV[1], ARGV[2])
+if len ~= string.len(val) then
+    start = utf8_offset(val, start) - 1
+    stop = utf8_offset(val, stop) - 1
+end
+return splice(KEYS[1], start, stop, ARGV[3])
+""")
+
+# Replace items [ARGV[1], ARGV[2]) with ARGV[3..] using slice semantics.
+# Same-size edits are LSETs in place and prefix deletes are an LTRIM;
+# everything else trims at start and re-pushes the new items and tail.
+_LUA_LIST_SPLICE = be_redis_base._LUA_PUSH + be_redis_base._LUA_SLICE + """
+local len = redis.call('LLEN', KEYS[1])
+local start, stop = bounds(len, ARGV[1], ARGV[2])
+local count = #ARGV - 2
+if count == (stop - start) then
+    for i = 1, count do
+        redis.call('LSET', KEYS[1], start + i - 1, ARGV[i + 2])
+    end
+    return len
+end
+local tail = {}
+if stop < len then
+    if count == 0 and start == 0 then
+        redis.call('LTRIM', KEYS[1], stop, -1)
+        return len - stop
+    end
+    tail = redis.call('LRANGE', KEYS[1], stop, -1)
+end
+if start == 0 then
+    redis.call('DEL', KEYS[1])
+else
+    redis.call('LTRIM', KEYS[1], 0, start - 1)
+end
+push('RPUSH', KEYS[1], ARGV, 3, #ARGV)
+push('RPUSH', KEYS[1], tail, 1, #tail)
+return len - (stop - start) + count
+"""
+
+_LUA_SET_TOGGLE = """
+for i = 1, #ARGV do
+    if redis.call('SISMEMBER', KEYS[1], ARGV[i]) == 1 then
+        redis.call('SREM', KEYS[1], ARGV[i])
+    else
+        redis.call('SADD', KEYS[1], ARGV[i])
+    end
+end
+return redis.call('SCARD', KEYS[1])
+"""
+
+# Add counts ARGV[i + 1] to fields ARGV[i] of the hash at key and return the
+# new counts. Integer counts stay exact via HINCRBY until a float is added.
+_LUA_HINCR = """
+local function hincr(key, first)
+    local out = {}
+    for i = first, #ARGV, 2 do
+        local cur = redis.call('HGET', key, ARGV[i])
+        if string.match(ARGV[i + 1], '^-?%d+$') and ((not cur) or string.match(cur, '^-?%d+$')) then
+            out[#out + 1] = redis.call('HINCRBY', key, ARGV[i], ARGV[i + 1])
+        else
+            out[#out + 1] = redis.call('HINCRBYFLOAT', key, ARGV[i], ARGV[i + 1])
+        end
+    end
+    return out
+end
+"""
+
+# Unwatched scripts are called with KEYS[1] set to the object's existence
+# marker and KEYS[2] set to its data key. They check existence and bump the
+# version themselves, so they need no WATCH and never conflict.
+_LUA_UNWATCHED_CHECK = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return redis.error_reply('PCOL_DNE')
+end
+"""
+
+_LUA_COUNTER_INCR = _LUA_HINCR + _LUA_UNWATCHED_CHECK + """
+local out = hincr(KEYS[2], 1)
+redis.call('INCR', KEYS[1])
+return out
+"""
+
+_LUA_INTEGER_INCRBY = _LUA_UNWATCHED_CHECK + """
+local val = redis.call('INCRBY', KEYS[2], ARGV[1])
+redis.call('INCR', KEYS[1])
+return val
+"""
+
+_LUA_INTEGER_DECRBY = _LUA_UNWATCHED_CHECK + """
+local val = redis.call('DECRBY', KEYS[2], ARGV[1])
+redis.call('INCR', KEYS[1])
+return val
+"""
+
+# Byte range of character idx, which may be negative, or nil if out of range
+_LUA_STRING_CHAR = be_redis_base._LUA_UTF8 + """
+local function char_range(val, idx)
+    local len = utf8_len(val)
+    if idx >= len or idx < -len then
+        return nil
+    end
+    if idx < 0 then
+        idx = len + idx
+    end
+    if len == string.len(val) then
+        return idx, idx + 1
+    end
+    return utf8_offset(val, idx) - 1, utf8_offset(val, idx + 1) - 1
+end
+"""
+
+_LUA_STRING_SETITEM = _LUA_STRING_CHAR + _LUA_SPLICE + _LUA_UNWATCHED_CHECK + """
+local idx = tonumber(ARGV[1])
+local start, stop = char_range(redis.call('GET', KEYS[2]) or '', idx)
+if not start then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+splice(KEYS[2], start, stop, ARGV[2])
+return redis.call('INCR', KEYS[1])
+"""
+
+_LUA_STRING_INSERT = be_redis_base._LUA_UTF8 + _LUA_SPLICE + _LUA_UNWATCHED_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local len = utf8_len(val)
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = math.max(len + idx, 0)
+end
+if idx >= len then
+    redis.call('APPEND', KEYS[2], ARGV[2])
+elseif len == string.len(val) then
+    splice(KEYS[2], idx, idx, ARGV[2])
+else
+    local pos = utf8_offset(val, idx) - 1
+    splice(KEYS[2], pos, pos, ARGV[2])
+end
+return redis.call('INCR', KEYS[1])
+"""
+
+_LUA_STRING_POP = _LUA_STRING_CHAR + _LUA_SPLICE + _LUA_UNWATCHED_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local idx = -1
+if ARGV[1] ~= '' then
+    idx = tonumber(ARGV[1])
+end
+local start, stop = char_range(val, idx)
+if not start then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+local removed = splice(KEYS[2], start, stop, '')
+redis.call('INCR', KEYS[1])
+return removed
+"""
+
+
+### Functions ###
+
+def _sentinel():
+    """Return Unique Placeholder Value"""
+    return "{:s}:{:s}".format(_PREFIX_SENTINEL, uuid.uuid4().hex)
+
+def _chunks(seq, size=_BULK_CHUNK):
+    """Split Sequence into Lists of at Most size Items"""
+    seq = list(seq)
+    return [seq[i:(i+size)] for i in range(0, len(seq), size)]
+
+def _run_unwatched(obj, source, *arg_lists):
+    """
+    Run Unwatched Script Once per Arg List, Returning the Replies
+
+    A single call is one EVALSHA; several are sent as one MULTI/EXEC, so
+    they still apply together.
+    """
+
+    # Run Calls
+    script = obj.driver.script(source)
+    keys = [obj._exists_key, obj._redis_key]
+    try:
+        if len(arg_lists) == 1:
+            rets = [script(keys=keys, args=arg_lists[0])]
+        else:
+            pipe = obj.driver.redis.pipeline(transaction=True)
+            for args in arg_lists:
+                script(keys=keys, args=args, client=pipe)
+            rets = pipe.execute(raise_on_error=False)
+    except redis.exceptions.ResponseError as err:
+        rets = [err]
+    finally:
+        obj._invalidate()
+
+    # Raise First Failure
+    for ret in rets:
+        if isinstance(ret, redis.exceptions.ResponseError):
+            code, _, msg = str(ret).partition(" ")
+            if code == _ERR_DNE:
+                raise exceptions.ObjectDNE(obj)
+            elif code == _ERR_INDEX:
+                raise IndexError(msg)
+            raise ret
+
+    # Return Replies
+    return rets
+
+open_many = be_redis_base.open_many
+create_many = be_redis_base.create_many
+get_many = be_redis_base.get_many
+
+def buffered(obj, interval=_BUFFER_INTERVAL, size=_BUFFER_SIZE):
+    """Return Write-Behind Wrapper for a MutableDictionary or MutableSet"""
+
+    if isinstance(obj, MutableCounter):
+        raise TypeError("MutableCounter can not be buffered")
+    elif isinstance(obj, MutableDictionary):
+        return BufferedMutableDictionary(obj, interval=interval, size=size)
+    elif isinstance(obj, MutableSet):
+        return BufferedMutableSet(obj, interval=interval, size=size)
+    else:
+        raise TypeError("only MutableDictionary and MutableSet can be buffered")
+
+def _flush_buffers():
+    """Close Open Buffers at Exit, Raising the First Failure"""
+
+    err = None
+    for buf in list(_BUFFERS):
+        try:
+            buf.close()
+        except Exception as exc:
+            err = err or exc
+    if err is not None:
+        raise err
+
+atexit.register(_flush_buffers)
+
+
 ### Objects ###
 
 class String(be_redis_base.String):
@@ -29,82 +337,124 @@ class String(be_redis_base.String):
 
 class MutableString(String, abc_atomic.MutableString):
 
-    def __setitem__(self, idx, itm):
-        """Set Seq Item"""
+    def _rewrite(self, func):
+        """Apply func to List of Characters and Rewrite Value, Returning func's Result"""
 
-        # Check Input
-        itm = self._encode_val_item(itm, test=True)
-        if len(itm) != 1:
-            raise ValueError("'{:s}' must be a single charecter".format(itm))
+        # Results of the last attempt
+        ret = []
 
         # Transaction
-        def atomic_setitem(pipe):
+        def atomic_rewrite(pipe):
 
             # Check Exists
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Check Index
-            length = pipe.strlen(self._redis_key)
-            if (idx >= length) or (idx < -length):
-                raise IndexError("{:d} out of range".format(idx))
+            # Read and Apply
+            chars = list(self._decode_val_obj(pipe.get(self._redis_key) or b""))
+            ret[:] = [func(chars)]
 
-            # Normalize Index
-            if (idx >= 0):
-                idx_norm = idx
-            else:
-                idx_norm = length + idx
-
-            # Set Item
-            out = self._encode_val_item(itm)
+            # Write
+            out = self._encode_val_obj("".join(chars))
             pipe.multi()
-            pipe.setrange(self._redis_key, idx_norm, out)
+            pipe.set(self._redis_key, out)
 
         # Execute Transaction
-        self._transact(atomic_setitem)
+        self._transact(atomic_rewrite)
+        return ret[0]
 
-    def insert(self, idx, itm):
-        """Insert Seq Item"""
+    def _splice(self, idx, seq=None):
+        """Replace Seq Slice with seq, or Delete it if seq is None"""
 
         # Validate Input
-        itm = self._encode_val_item(itm, test=True)
-        if len(itm) != 1:
-            raise ValueError("'{:s}' must be a single charecter".format(itm))
+        if seq is None:
+            seq = ""
+            seq_out = b""
+            delete = True
+        else:
+            seq_out = self._encode_val_item(seq)
+            delete = False
+
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            if delete:
+                return self._rewrite(lambda chars: chars.__delitem__(idx))
+            else:
+                return self._rewrite(lambda chars: chars.__setitem__(idx, list(seq)))
 
         # Transaction
-        def atomic_insert(pipe):
+        def atomic_splice(pipe):
 
             # Check Exists
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Get Ranges
-            length = pipe.strlen(self._redis_key)
-            if (idx == 0) or (idx <= -length):
-                start = str()
-            else:
-                start = self._decode_val_obj(pipe.getrange(self._redis_key, 0, (idx-1)))
-            if (idx >= length):
-                end = str()
+            # Contiguous slices are spliced server-side
+            if be_redis_base._is_simple_slice(idx):
+                args = be_redis_base._slice_args(idx) + (seq_out,)
+                pipe.multi()
+                self._script_direct(pipe, _LUA_STRING_SLICE_SPLICE, *args)
+                return
+
+            # Extended slices follow list semantics on the characters
+            chars = list(self._decode_val_obj(pipe.get(self._redis_key) or b""))
+            if delete:
+                del(chars[idx])
             else:
-                end = self._decode_val_obj(pipe.getrange(self._redis_key, idx, length))
-
-            # Set New Val
-            out = self._encode_val_obj(start + itm + end)
+                chars[idx] = list(seq)
+            out = self._encode_val_obj("".join(chars))
             pipe.multi()
             pipe.set(self._redis_key, out)
 
         # Execute Transaction
-        self._transact(atomic_insert)
+        self._transact(atomic_splice)
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        # Set Slice
+        if isinstance(idx, slice):
+            return self._splice(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.__setitem__(idx, itm))
+
+        # Set Item
+        _run_unwatched(self, _LUA_STRING_SETITEM, [idx, out])
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.insert(idx, itm))
+
+        # Insert Item
+        _run_unwatched(self, _LUA_STRING_INSERT, [idx, out])
 
     def append(self, itm):
         """Append Seq Item"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
         if len(itm) != 1:
             raise ValueError("'{:s}' must be a single charecter".format(itm))
 
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.append(itm))
+
         # Transaction
         def atomic_append(pipe):
 
@@ -113,7 +463,6 @@ class MutableString(String, abc_atomic.MutableString):
                 raise exceptions.ObjectDNE(self)
 
             # Append
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.append(self._redis_key, out)
 
@@ -123,6 +472,10 @@ class MutableString(String, abc_atomic.MutableString):
     def reverse(self):
         """Reverse Seq"""
 
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.reverse())
+
         # Transaction
         def atomic_reverse(pipe):
 
@@ -147,8 +500,12 @@ class MutableString(String, abc_atomic.MutableString):
     def extend(self, seq):
         """Append Seq with another Seq"""
 
-        # Validate Input
-        seq = self._encode_val_obj(seq, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
+
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.extend(seq))
 
         # Transaction
         def atomic_extend(pipe):
@@ -158,12 +515,11 @@ class MutableString(String, abc_atomic.MutableString):
                 raise exceptions.ObjectDNE(self)
 
             # Extend
-            out = self._encode_val_obj(seq)
             pipe.multi()
             pipe.append(self._redis_key, out)
 
         # Execute Transaction
-        if len(seq):
+        if len(out):
             self._transact(atomic_extend)
         else:
             pass
@@ -171,52 +527,40 @@ class MutableString(String, abc_atomic.MutableString):
     def pop(self, pop_idx=None):
         """Pop Seq Item"""
 
-        # Transaction
-        def atomic_pop(pipe):
-
-            # Check Exists
-            if not self._exists_direct(pipe):
-                raise exceptions.ObjectDNE(self)
-
-            # Check Index
-            length = pipe.strlen(self._redis_key)
+        # Compressed Strings are Rewritten
+        if self._compressed:
             if pop_idx is None:
-                idx = (length-1)
+                return self._rewrite(lambda chars: chars.pop())
             else:
-                idx = pop_idx
-            if (idx >= length) or (idx < -length):
-                raise IndexError("{:d} out of range".format(idx))
+                return self._rewrite(lambda chars: chars.pop(pop_idx))
 
-            # Get Ranges
-            if (idx == 0) or (idx == -length):
-                start = str()
-            else:
-                start = self._decode_val_obj(pipe.getrange(self._redis_key,
-                                                           0, (idx-1)))
-            if (idx == (length-1)) or (idx == -1):
-                end = str()
-            else:
-                end = self._decode_val_obj(pipe.getrange(self._redis_key,
-                                                         (idx+1), length))
+        # Pop Item
+        arg = "" if pop_idx is None else pop_idx
+        ret = _run_unwatched(self, _LUA_STRING_POP, [arg])
+        return self._decode_val_item(ret[0])
 
-            # Set New Val
-            out = self._encode_val_obj(start + end)
-            pipe.multi()
-            pipe.getrange(self._redis_key, idx, idx)
-            pipe.set(self._redis_key, out)
+    def __delitem__(self, idx):
+        """Del Seq Item"""
 
-        # Execute Transaction
-        ret = self._transact(atomic_pop)
-        return self._decode_val_item(ret[0])
+        # Del Slice
+        if isinstance(idx, slice):
+            return self._splice(idx)
+
+        # Call Parent
+        return super(MutableString, self).__delitem__(idx)
 
     def remove(self, itm):
         """Remove itm from Seq"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
         if len(itm) != 1:
             raise ValueError("'{:s}' must be a single charecter".format(itm))
 
+        # Compressed Strings are Rewritten
+        if self._compressed:
+            return self._rewrite(lambda chars: chars.remove(itm))
+
         # Transaction
         def atomic_remove(pipe):
 
@@ -224,39 +568,68 @@ class MutableString(String, abc_atomic.MutableString):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Get idx
-            seq = self._decode_val_obj(pipe.get(self._redis_key))
-            idx = seq.index(itm)
-
-            # Get Ranges
-            length = pipe.strlen(self._redis_key)
-            if (idx == 0):
-                start = str()
-            else:
-                start = self._decode_val_obj(pipe.getrange(self._redis_key, 0, (idx-1)))
-            if (idx == (length-1)):
-                end = str()
-            else:
-                end = self._decode_val_obj(pipe.getrange(self._redis_key, (idx+1), length))
-
-            # Set New Val
-            out = self._encode_val_obj(start + end)
+            # Splice Out First Match
             pipe.multi()
-            pipe.set(self._redis_key, out)
+            self._script_direct(pipe, _LUA_STRING_REMOVE, out)
 
         # Execute Transaction
-        self._transact(atomic_remove)
+        ret = self._transact(atomic_remove)
+
+        # Check result
+        if ret[0] is None:
+            raise ValueError("substring not found")
 
 class List(be_redis_base.List):
     pass
 
 class MutableList(List, abc_atomic.MutableList):
 
+    def _splice(self, idx, seq=None):
+        """Replace Seq Slice with seq, or Delete it if seq is None"""
+
+        # Validate Input
+        if seq is None:
+            seq_out = []
+            delete = True
+        else:
+            seq_out = self._encode_val_obj(list(seq))
+            delete = False
+
+        # Transaction
+        def atomic_splice(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Contiguous slices are spliced server-side
+            if be_redis_base._is_simple_slice(idx):
+                args = be_redis_base._slice_args(idx) + tuple(seq_out)
+                pipe.multi()
+                self._script_direct(pipe, _LUA_LIST_SPLICE, *args)
+                return
+
+            # Extended slices are read, updated and rewritten as raw items
+            out = pipe.lrange(self._redis_key, 0, -1)
+            if delete:
+                del(out[idx])
+            else:
+                out[idx] = seq_out
+            pipe.multi()
+            self._set_val_direct(pipe, out)
+
+        # Execute Transaction
+        self._transact(atomic_splice)
+
     def __setitem__(self, idx, itm):
         """Set Seq Item"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Set Slice
+        if isinstance(idx, slice):
+            return self._splice(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_setitem(pipe):
@@ -277,7 +650,6 @@ class MutableList(List, abc_atomic.MutableList):
                 idx_norm = length + idx
 
             # Set Item
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.lset(self._redis_key, idx_norm, out)
 
@@ -287,8 +659,8 @@ class MutableList(List, abc_atomic.MutableList):
     def insert(self, idx, itm):
         """Insert Seq Item"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_insert(pipe):
@@ -297,22 +669,29 @@ class MutableList(List, abc_atomic.MutableList):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Get Ranges
+            # Normalize Index
             length = pipe.llen(self._redis_key)
-            if (idx == 0) or (idx <= -length):
-                start = list()
+            if (idx >= 0):
+                idx_norm = idx
             else:
-                start = self._decode_val_obj(pipe.lrange(self._redis_key, 0, (idx-1)))
-            if (idx >= length):
-                end = list()
+                idx_norm = max(length + idx, 0)
+
+            # Insert Item
+            if (idx_norm >= length):
+                pipe.multi()
+                pipe.rpush(self._redis_key, out)
+            elif (idx_norm == 0):
+                pipe.multi()
+                pipe.lpush(self._redis_key, out)
             else:
-                end = self._decode_val_obj(pipe.lrange(self._redis_key, idx, length))
-
-            # Set New Val
-            out = self._encode_val_obj(start + [itm] + end)
-            pipe.multi()
-            pipe.delete(self._redis_key)
-            pipe.rpush(self._redis_key, *out)
+                # Swap the pivot for a unique sentinel, insert before
+                # the sentinel, then restore the pivot in its place
+                pivot = pipe.lindex(self._redis_key, idx_norm)
+                sentinel = _sentinel()
+                pipe.multi()
+                pipe.lset(self._redis_key, idx_norm, sentinel)
+                pipe.linsert(self._redis_key, "BEFORE", sentinel, out)
+                pipe.lset(self._redis_key, (idx_norm+1), pivot)
 
         # Execute Transaction
         self._transact(atomic_insert)
@@ -320,8 +699,8 @@ class MutableList(List, abc_atomic.MutableList):
     def append(self, itm):
         """Append Seq Item"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_append(pipe):
@@ -331,7 +710,6 @@ class MutableList(List, abc_atomic.MutableList):
                 raise exceptions.ObjectDNE(self)
 
             # Append
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.rpush(self._redis_key, out)
 
@@ -366,8 +744,8 @@ class MutableList(List, abc_atomic.MutableList):
     def extend(self, seq):
         """Append Seq wuth another Seq"""
 
-        # Validate Input
-        seq = self._encode_val_obj(seq, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
 
         # Transaction
         def atomic_extend(pipe):
@@ -377,12 +755,11 @@ class MutableList(List, abc_atomic.MutableList):
                 raise exceptions.ObjectDNE(self)
 
             # Extend
-            out = self._encode_val_obj(seq)
             pipe.multi()
             pipe.rpush(self._redis_key, *out)
 
         # Execute Transaction
-        if len(seq):
+        if len(out):
             self._transact(atomic_extend)
         else:
             pass
@@ -406,32 +783,44 @@ class MutableList(List, abc_atomic.MutableList):
             if (idx >= length) or (idx < -length):
                 raise IndexError("{:d} out of range".format(idx))
 
-            # Get Ranges
-            if (idx == 0) or (idx == -length):
-                start = list()
-            else:
-                start = self._decode_val_obj(pipe.lrange(self._redis_key, 0, (idx-1)))
-            if (idx == (length-1)) or (idx == -1):
-                end = list()
+            # Normalize Index
+            if (idx >= 0):
+                idx_norm = idx
             else:
-                end = self._decode_val_obj(pipe.lrange(self._redis_key, (idx+1), length))
+                idx_norm = length + idx
 
-            # Set New Val
-            out = self._encode_val_obj(start + end)
+            # Pop Item
             pipe.multi()
-            pipe.lrange(self._redis_key, idx, idx)
-            pipe.delete(self._redis_key)
-            pipe.rpush(self._redis_key, *out)
+            if (idx_norm == (length-1)):
+                pipe.rpop(self._redis_key)
+            elif (idx_norm == 0):
+                pipe.lpop(self._redis_key)
+            else:
+                # Swap the item for a unique sentinel and remove it
+                sentinel = _sentinel()
+                pipe.lindex(self._redis_key, idx_norm)
+                pipe.lset(self._redis_key, idx_norm, sentinel)
+                pipe.lrem(self._redis_key, 1, sentinel)
 
         # Execute Transaction
         ret = self._transact(atomic_pop)
-        return self._decode_val_item(ret[0][0])
+        return self._decode_val_item(ret[0])
+
+    def __delitem__(self, idx):
+        """Del Seq Item"""
+
+        # Del Slice
+        if isinstance(idx, slice):
+            return self._splice(idx)
+
+        # Call Parent
+        return super(MutableList, self).__delitem__(idx)
 
     def remove(self, itm):
         """Remove itm from Seq"""
 
-        # Validate Input
-        itm = self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_remove(pipe):
@@ -441,7 +830,6 @@ class MutableList(List, abc_atomic.MutableList):
                 raise exceptions.ObjectDNE(self)
 
             # Write
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.lrem(self._redis_key, 1, out)
 
@@ -452,6 +840,167 @@ class MutableList(List, abc_atomic.MutableList):
         if (ret[0] != 1):
             raise ValueError("'{}' is not in list".format(itm))
 
+class IntArray(be_redis_base.IntArray):
+    pass
+
+class FloatArray(be_redis_base.FloatArray):
+    pass
+
+class MutableArray(be_redis_base.Array, abc_atomic.MutableArray):
+
+    def _rewrite(self, func):
+        """Apply func to Array and Rewrite Value, Returning func's Result"""
+
+        # Results of the last attempt
+        ret = []
+
+        # Transaction
+        def atomic_rewrite(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Read and Apply
+            val = self._decode_val_obj(pipe.get(self._redis_key))
+            ret[:] = [func(val)]
+
+            # Write
+            out = self._encode_val_obj(val)
+            pipe.multi()
+            pipe.set(self._redis_key, out)
+
+        # Execute Transaction
+        self._transact(atomic_rewrite)
+        return ret[0]
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        # Validate and Encode Input
+        if isinstance(idx, slice):
+            out = self._encode_val_obj(itm)
+        else:
+            out = self._encode_val_item(itm)
+
+        # Extended slices are rewritten
+        if isinstance(idx, slice) and not be_redis_base._is_simple_slice(idx):
+            vals = self._decode_val_obj(out)
+            return self._rewrite(lambda val: val.__setitem__(idx, vals))
+
+        # Transaction
+        size = self._ITEMSIZE
+        def atomic_setitem(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Get Length
+            length = pipe.strlen(self._redis_key) // size
+
+            # Set Item in Place
+            if not isinstance(idx, slice):
+                if (idx >= length) or (idx < -length):
+                    raise IndexError("{:d} out of range".format(idx))
+                idx_norm = idx if (idx >= 0) else (length + idx)
+                pipe.multi()
+                pipe.setrange(self._redis_key, (idx_norm * size), out)
+                return
+
+            # Set Equal-Length Slices in Place, Splice Others
+            start, stop, _ = idx.indices(length)
+            stop = max(start, stop)
+            if ((stop - start) * size) == len(out):
+                if len(out):
+                    pipe.multi()
+                    pipe.setrange(self._redis_key, (start * size), out)
+            else:
+                raw = pipe.get(self._redis_key) or b""
+                pipe.multi()
+                pipe.set(self._redis_key, raw[:(start * size)] + out + raw[(stop * size):])
+
+        # Execute Transaction
+        self._transact(atomic_setitem)
+
+    def __delitem__(self, idx):
+        """Del Seq Item"""
+        return self._rewrite(lambda val: val.__delitem__(idx))
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        # Validate Input
+        self._encode_val_item(itm)
+
+        # Rewrite
+        return self._rewrite(lambda val: val.insert(idx, itm))
+
+    def append(self, itm):
+        """Append Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Transaction
+        def atomic_append(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Append
+            pipe.multi()
+            pipe.append(self._redis_key, out)
+
+        # Execute Transaction
+        self._transact(atomic_append)
+
+    def reverse(self):
+        """Reverse Seq"""
+        return self._rewrite(lambda val: val.reverse())
+
+    def extend(self, seq):
+        """Append Seq with another Seq"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
+
+        # Transaction
+        def atomic_extend(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Extend
+            pipe.multi()
+            pipe.append(self._redis_key, out)
+
+        # Execute Transaction
+        if len(out):
+            self._transact(atomic_extend)
+        else:
+            pass
+
+    def pop(self, pop_idx=None):
+        """Pop Seq Item"""
+
+        if pop_idx is None:
+            return self._rewrite(lambda val: val.pop())
+        else:
+            return self._rewrite(lambda val: val.pop(pop_idx))
+
+    def remove(self, itm):
+        """Remove itm from Seq"""
+        return self._rewrite(lambda val: val.remove(itm))
+
+class MutableIntArray(IntArray, MutableArray):
+    pass
+
+class MutableFloatArray(FloatArray, MutableArray):
+    pass
+
 class Set(be_redis_base.Set):
     pass
 
@@ -460,8 +1009,8 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def add(self, itm):
         """Add Item to Set"""
 
-        # Validate Input
-        self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_add(pipe):
@@ -471,7 +1020,6 @@ class MutableSet(Set, abc_atomic.MutableSet):
                 raise exceptions.ObjectDNE(self)
 
             # Add Item
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.sadd(self._redis_key, out)
 
@@ -481,8 +1029,8 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def discard(self, itm):
         """Remove Item from Set if Present"""
 
-        # Validate Input
-        self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_discard(pipe):
@@ -492,13 +1040,82 @@ class MutableSet(Set, abc_atomic.MutableSet):
                 raise exceptions.ObjectDNE(self)
 
             # Remove Item
-            out = self._encode_val_item(itm)
             pipe.multi()
             pipe.srem(self._redis_key, out)
 
         # Execute Transaction
         self._transact(atomic_discard)
 
+    def add_many(self, itms):
+        """Add Items to Set, Returning Count Added"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(itms)
+
+        # Transaction
+        def atomic_add_many(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Add Items
+            pipe.multi()
+            for chunk in _chunks(out):
+                pipe.sadd(self._redis_key, *chunk)
+
+        # Execute Transaction
+        if len(out):
+            return sum(self._transact(atomic_add_many))
+        else:
+            return 0
+
+    def discard_many(self, itms):
+        """Remove Items from Set if Present, Returning Count Removed"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(itms)
+
+        # Transaction
+        def atomic_discard_many(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Remove Items
+            pipe.multi()
+            for chunk in _chunks(out):
+                pipe.srem(self._redis_key, *chunk)
+
+        # Execute Transaction
+        if len(out):
+            return sum(self._transact(atomic_discard_many))
+        else:
+            return 0
+
+    def pop_n(self, count):
+        """Pop up to count Items from Set"""
+
+        # Validate Input
+        if count < 0:
+            raise ValueError("count must not be negative")
+
+        # Transaction
+        def atomic_pop_n(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Pop Items
+            pipe.multi()
+            pipe.execute_command("SPOP", self._redis_key, count)
+
+        # Execute Transaction
+        ret = self._transact(atomic_pop_n)
+        return self._decode_val_obj(ret[0])
+
     def clear(self):
         """Clear Set"""
 
@@ -542,8 +1159,8 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def remove(self, itm):
         """Remove itm from Set"""
 
-        # Validate Input
-        self._encode_val_item(itm, test=True)
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
 
         # Transaction
         def atomic_remove(pipe):
@@ -553,7 +1170,6 @@ class MutableSet(Set, abc_atomic.MutableSet):
                 raise exceptions.ObjectDNE(self)
 
             # Check Item in Set
-            out = self._encode_val_item(itm)
             if not pipe.sismember(self._redis_key, out):
                 raise KeyError("{} not in set".format(itm))
 
@@ -567,8 +1183,28 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def __ior__(self, other):
         """Unary or"""
 
-        # Validate Input
-        other = self._encode_val_obj(other, test=True)
+        # Stored Set: Union Server-Side
+        if self._is_stored_set(other):
+
+            # Transaction
+            def atomic_ior_stored(pipe):
+
+                # Check Exists
+                if not self._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(self)
+                if not other._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(other)
+
+                # Union Sets
+                pipe.multi()
+                pipe.sunionstore(self._redis_key, self._redis_key, other._redis_key)
+
+            # Execute Transaction
+            self._transact(atomic_ior_stored, other._exists_key, other._redis_key)
+            return self
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(other)
 
         # Transaction
         def atomic_ior(pipe):
@@ -577,12 +1213,8 @@ class MutableSet(Set, abc_atomic.MutableSet):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Union Sets
-            val = self._decode_val_obj(pipe.smembers(self._redis_key))
-            val |= other
-            out = self._encode_val_obj(val)
+            # Add Other Items
             pipe.multi()
-            pipe.delete(self._redis_key)
             if len(out) > 0:
                 pipe.sadd(self._redis_key, *out)
 
@@ -595,8 +1227,28 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def __iand__(self, other):
         """Unary and"""
 
-        # Validate Input
-        other = self._encode_val_obj(other, test=True)
+        # Stored Set: Intersect Server-Side
+        if self._is_stored_set(other):
+
+            # Transaction
+            def atomic_iand_stored(pipe):
+
+                # Check Exists
+                if not self._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(self)
+                if not other._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(other)
+
+                # Intersect Sets
+                pipe.multi()
+                pipe.sinterstore(self._redis_key, self._redis_key, other._redis_key)
+
+            # Execute Transaction
+            self._transact(atomic_iand_stored, other._exists_key, other._redis_key)
+            return self
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(other)
 
         # Transaction
         def atomic_iand(pipe):
@@ -605,14 +1257,15 @@ class MutableSet(Set, abc_atomic.MutableSet):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Intersect Sets
-            val = self._decode_val_obj(pipe.smembers(self._redis_key))
-            val &= other
-            out = self._encode_val_obj(val)
+            # Intersect with Other Items via Temp Key
             pipe.multi()
-            pipe.delete(self._redis_key)
             if len(out) > 0:
-                pipe.sadd(self._redis_key, *out)
+                tmp_key = _sentinel()
+                pipe.sadd(tmp_key, *out)
+                pipe.sinterstore(self._redis_key, self._redis_key, tmp_key)
+                pipe.delete(tmp_key)
+            else:
+                pipe.delete(self._redis_key)
 
         # Execute Transaction
         self._transact(atomic_iand)
@@ -623,8 +1276,32 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def __ixor__(self, other):
         """Unary xor"""
 
-        # Validate Input
-        other = self._encode_val_obj(other, test=True)
+        # Stored Set: Xor Server-Side
+        if self._is_stored_set(other):
+
+            # Transaction
+            def atomic_ixor_stored(pipe):
+
+                # Check Exists
+                if not self._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(self)
+                if not other._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(other)
+
+                # Xor Sets via Temp Key
+                tmp_key = _sentinel()
+                pipe.multi()
+                pipe.sdiffstore(tmp_key, other._redis_key, self._redis_key)
+                pipe.sdiffstore(self._redis_key, self._redis_key, other._redis_key)
+                pipe.sunionstore(self._redis_key, self._redis_key, tmp_key)
+                pipe.delete(tmp_key)
+
+            # Execute Transaction
+            self._transact(atomic_ixor_stored, other._exists_key, other._redis_key)
+            return self
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(other)
 
         # Transaction
         def atomic_ixor(pipe):
@@ -633,14 +1310,10 @@ class MutableSet(Set, abc_atomic.MutableSet):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Xor Sets
-            val = self._decode_val_obj(pipe.smembers(self._redis_key))
-            val ^= other
-            out = self._encode_val_obj(val)
+            # Toggle Other Items
             pipe.multi()
-            pipe.delete(self._redis_key)
             if len(out) > 0:
-                pipe.sadd(self._redis_key, *out)
+                self._script_direct(pipe, _LUA_SET_TOGGLE, *out)
 
         # Execute Transaction
         self._transact(atomic_ixor)
@@ -651,8 +1324,28 @@ class MutableSet(Set, abc_atomic.MutableSet):
     def __isub__(self, other):
         """Unary subtract"""
 
-        # Validate Input
-        other = self._encode_val_obj(other, test=True)
+        # Stored Set: Difference Server-Side
+        if self._is_stored_set(other):
+
+            # Transaction
+            def atomic_isub_stored(pipe):
+
+                # Check Exists
+                if not self._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(self)
+                if not other._exists_direct(pipe):
+                    raise exceptions.ObjectDNE(other)
+
+                # Difference Sets
+                pipe.multi()
+                pipe.sdiffstore(self._redis_key, self._redis_key, other._redis_key)
+
+            # Execute Transaction
+            self._transact(atomic_isub_stored, other._exists_key, other._redis_key)
+            return self
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(other)
 
         # Transaction
         def atomic_isub(pipe):
@@ -661,14 +1354,10 @@ class MutableSet(Set, abc_atomic.MutableSet):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Difference Sets
-            val = self._decode_val_obj(pipe.smembers(self._redis_key))
-            val -= other
-            out = self._encode_val_obj(val)
+            # Remove Other Items
             pipe.multi()
-            pipe.delete(self._redis_key)
             if len(out) > 0:
-                pipe.sadd(self._redis_key, *out)
+                pipe.srem(self._redis_key, *out)
 
         # Execute Transaction
         self._transact(atomic_isub)
@@ -684,9 +1373,9 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
     def __setitem__(self, key, val):
         """Set Mapping Item"""
 
-        # Validate Input
-        self._encode_val_item(key, test=True)
-        self._encode_val_item(val, test=True)
+        # Validate and Encode Input
+        key_out = self._encode_val_item(key)
+        val_out = self._encode_val_mapped(val)
 
         # Transaction
         def atomic_setitem(pipe):
@@ -696,8 +1385,6 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
                 raise exceptions.ObjectDNE(self)
 
             # Set Item
-            key_out = self._encode_val_item(key)
-            val_out = self._encode_val_item(val)
             pipe.multi()
             pipe.hset(self._redis_key, key_out, val_out)
 
@@ -707,8 +1394,8 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
     def __delitem__(self, key):
         """Delete Mapping Item"""
 
-        # Validate Input
-        self._encode_val_item(key, test=True)
+        # Validate and Encode Input
+        key_out = self._encode_val_item(key)
 
         # Transaction
         def atomic_delitem(pipe):
@@ -718,7 +1405,6 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
                 raise exceptions.ObjectDNE(self)
 
             # Set Item
-            key_out = self._encode_val_item(key)
             pipe.multi()
             pipe.hdel(self._redis_key, key_out)
 
@@ -735,8 +1421,8 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
         # Validate input:
         if (len(args) < 1) or (len(args) > 2):
             raise TypeError("pop() requires either 1 or 2 args: {}".format(args))
-        self._encode_val_item(args[0], test=True)
         key = args[0]
+        key_out = self._encode_val_item(key)
         if len(args) > 1:
             default = args[1]
 
@@ -748,7 +1434,6 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
                 raise exceptions.ObjectDNE(self)
 
             # Pop Item
-            key_out = self._encode_val_item(key)
             pipe.multi()
             pipe.hget(self._redis_key, key_out)
             pipe.hdel(self._redis_key, key_out)
@@ -763,7 +1448,7 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
             else:
                 raise KeyError("'{}' not in dict".format(key))
         else:
-            return self._decode_val_item(ret[0])
+            return self._decode_val_mapped(ret[0])
 
     def popitem(self):
         """Pop Arbitrary Item"""
@@ -779,7 +1464,7 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
             dic = self._decode_val_obj(pipe.hgetall(self._redis_key))
             key, val = dic.popitem()
             key_out = self._encode_val_item(key)
-            val_out = self._encode_val_item(val)
+            val_out = self._encode_val_mapped(val)
             pipe.multi()
             pipe.echo(key_out)
             pipe.echo(val_out)
@@ -790,7 +1475,7 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
 
         # Process Return
         key_ret = self._decode_val_item(ret[0])
-        val_ret = self._decode_val_item(ret[1])
+        val_ret = self._decode_val_mapped(ret[1])
         assert ret[2] == 1
         return (key_ret, val_ret)
 
@@ -814,7 +1499,8 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
     def update(self, *args, **kwargs):
         """Update Dictionary"""
 
-        # TODO: Verify input types
+        # Validate and Encode Input
+        out = self._encode_val_obj(dict(*args, **kwargs))
 
         # Transaction
         def atomic_update(pipe):
@@ -823,14 +1509,10 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Difference Sets
-            val = self._decode_val_obj(pipe.hgetall(self._redis_key))
-            val.update(*args, **kwargs)
-            out = self._encode_val_obj(val)
+            # Set Only the Given Fields
             pipe.multi()
-            pipe.delete(self._redis_key)
-            if len(out) > 0:
-                pipe.hmset(self._redis_key, out)
+            for chunk in _chunks(viewitems(out)):
+                pipe.hmset(self._redis_key, dict(chunk))
 
         # Execute Transaction
         self._transact(atomic_update)
@@ -838,13 +1520,39 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
         # Return
         return self
 
+    def delete_many(self, keys):
+        """Delete Keys if Present, Returning Count Deleted"""
+
+        # Validate and Encode Input
+        out = self._encode_val_many(list(keys))
+
+        # Transaction
+        def atomic_delete_many(pipe):
+
+            # Check Exists
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+
+            # Delete Items
+            pipe.multi()
+            for chunk in _chunks(out):
+                pipe.hdel(self._redis_key, *chunk)
+
+        # Execute Transaction
+        if len(out):
+            return sum(self._transact(atomic_delete_many))
+        else:
+            return 0
+
     def setdefault(self, key, default=None):
         """return Key or Set to Default"""
 
-        # Validate Input
-        self._encode_val_item(key, test=True)
+        # Validate and Encode Input
+        key_out = self._encode_val_item(key)
         if default is not None:
-            self._encode_val_item(default, test=True)
+            default_out = self._encode_val_mapped(default)
+        else:
+            default_out = None
 
         # Transaction
         def atomic_setdefault(pipe):
@@ -853,20 +1561,561 @@ class MutableDictionary(Dictionary, abc_atomic.MutableDictionary):
             if not self._exists_direct(pipe):
                 raise exceptions.ObjectDNE(self)
 
-            # Validate Input
-            key_out = self._encode_val_item(key)
-            if not pipe.hexists(self._redis_key, key_out):
-                default_out = self._encode_val_item(default)
-            else:
-                default_out = None
+            # Encode a None Default Only if Needed
+            fill_out = default_out
+            if (fill_out is None) and not pipe.hexists(self._redis_key, key_out):
+                fill_out = self._encode_val_mapped(default)
 
             # Set val if not set
             pipe.multi()
-            pipe.hsetnx(self._redis_key, key_out, default_out)
+            pipe.hsetnx(self._redis_key, key_out, fill_out)
             pipe.hget(self._redis_key, key_out)
 
         # Execute Transaction
         ret = self._transact(atomic_setdefault)
 
         # Return
-        return self._decode_val_item(ret[1])
+        return self._decode_val_mapped(ret[1])
+
+class Counter(be_redis_base.Counter):
+    pass
+
+class MutableCounter(MutableDictionary, Counter, abc_atomic.MutableCounter):
+
+    def _add(self, counts):
+        """Add Counts to Items, Returning the New Counts"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(counts)
+
+        # Increment Counts Server-Side, Checking Existence Even if Empty
+        chunks = _chunks(viewitems(out)) or [[]]
+        arg_lists = [[arg for itm in chunk for arg in itm] for chunk in chunks]
+        ret = _run_unwatched(self, _LUA_COUNTER_INCR, *arg_lists)
+
+        # Return New Counts
+        return [self._decode_val_mapped(cnt) for chunk in ret for cnt in chunk]
+
+    def __delitem__(self, key):
+        """Delete Count of Item if Present"""
+
+        self.delete_many([key])
+
+    def incr(self, key, amount=1):
+        """Add amount to Count of key, Returning the New Count"""
+
+        return self._add({key: amount})[0]
+
+    def update(self, *args, **kwargs):
+        """Add Counts from Iterable or Mapping"""
+
+        # Count Input
+        counts = collections.Counter()
+        counts.update(*args, **kwargs)
+
+        # Add Counts
+        self._add(counts)
+
+        # Return
+        return self
+
+    def subtract(self, *args, **kwargs):
+        """Subtract Counts from Iterable or Mapping"""
+
+        # Count Input
+        counts = collections.Counter()
+        counts.subtract(*args, **kwargs)
+
+        # Add Negated Counts
+        self._add(counts)
+
+        # Return
+        return self
+
+class Integer(be_redis_base.Integer):
+    pass
+
+class AtomicInteger(Integer, abc_atomic.AtomicInteger):
+
+    def incr(self, amount=1):
+        """Add amount, Returning the New Value"""
+
+        # Validate Input
+        self._encode_val_item(amount, test=True)
+
+        # Increment Server-Side
+        ret = _run_unwatched(self, _LUA_INTEGER_INCRBY, [amount])
+
+        # Return New Value
+        return ret[0]
+
+    def decr(self, amount=1):
+        """Subtract amount, Returning the New Value"""
+
+        # Validate Input
+        self._encode_val_item(amount, test=True)
+
+        # Decrement Server-Side
+        ret = _run_unwatched(self, _LUA_INTEGER_DECRBY, [amount])
+
+        # Return New Value
+        return ret[0]
+
+
+### Buffered Objects ###
+
+class _Buffered(with_metaclass(abc.ABCMeta, object)):
+    """
+    Write-Behind Wrapper Base
+
+    Mutations are validated and buffered locally, then applied to the
+    wrapped object in one transaction when flushed: every interval seconds
+    (if not None), once size entries are buffered (if not None), on
+    flush(), on close() or exit from a with block, and at interpreter exit.
+    A mutation is only durable once a flush holding it returns, so a crash
+    or kill loses up to interval seconds of writes. Other handles see a
+    flush all at once, and flushes are applied in order. Reads through the
+    wrapper see its buffered writes. A failed flush keeps its mutations
+    buffered, under any newer ones, for the next flush. Background flush
+    failures are kept in error.
+    """
+
+    _OBJ_TYPE = object
+
+    def __init__(self, obj, interval=_BUFFER_INTERVAL, size=_BUFFER_SIZE):
+
+        # Check Args
+        if not isinstance(obj, self._OBJ_TYPE):
+            raise TypeError("obj must be instance of {}".format(self._OBJ_TYPE.__name__))
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive")
+        if size is not None and size < 1:
+            raise ValueError("size must be positive")
+
+        # Call Parent
+        super(_Buffered, self).__init__()
+
+        # Save Attrs
+        self._obj = obj
+        self._interval = interval
+        self._size = size
+
+        # Setup State
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = self._empty()
+        self._inflight = self._empty()
+        self._closed = threading.Event()
+        self._error = None
+        _BUFFERS.add(self)
+
+        # Start Timer
+        self._thread = None
+        if interval is not None:
+            self._thread = threading.Thread(target=self._timer, name="pcollections-buffer")
+            self._thread.daemon = True
+            self._thread.start()
+
+    ## Properties ##
+
+    @property
+    def obj(self):
+        return self._obj
+
+    @property
+    def error(self):
+        return self._error
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    @property
+    def pending(self):
+        with self._lock:
+            return self._count(self._pending)
+
+    ## Methods ##
+
+    def __len__(self):
+        """Get Len of Object with Buffered Mutations Applied (Transaction)"""
+
+        # Buffered Keys or Items, Set (or Added) then Deleted
+        with self._lock:
+            state = self._merge(self._inflight, self._pending)
+        obj = self._obj
+        adds_out = [obj._encode_val_item(itm) for itm in state[0]]
+        dels_out = [obj._encode_val_item(itm) for itm in state[1]]
+
+        # Transaction
+        def atomic_len(pipe):
+
+            # Check Exists
+            if not obj._exists_direct(pipe):
+                raise exceptions.ObjectDNE(obj)
+
+            # Get Len and Membership of Buffered Entries
+            pipe.multi()
+            obj._len_direct(pipe)
+            for itm in (adds_out + dels_out):
+                obj._contains_direct(pipe, itm)
+
+        # Execute Transaction
+        ret = obj._transact(atomic_len, readonly=True)
+
+        # Count New Adds and Present Deletes
+        found = ret[1:]
+        added = sum(1 for hit in found[:len(adds_out)] if not hit)
+        removed = sum(1 for hit in found[len(adds_out):] if hit)
+        return ret[0] + added - removed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def flush(self):
+        """Apply Buffered Mutations in One Transaction"""
+
+        with self._flush_lock:
+
+            # Swap State
+            with self._lock:
+                state = self._pending
+                self._pending = self._empty()
+                self._inflight = state
+            if not self._count(state):
+                return
+
+            # Apply State
+            try:
+                self._apply(state)
+            except Exception:
+                with self._lock:
+                    self._pending = self._merge(state, self._pending)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = self._empty()
+
+    def close(self):
+        """Stop Timer and Flush"""
+
+        self._closed.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self.flush()
+        _BUFFERS.discard(self)
+
+    def get_val(self):
+        """Get Value with Buffered Mutations Applied"""
+
+        with self._lock:
+            states = [self._inflight, self._pending]
+            states = [self._merge(self._empty(), state) for state in states]
+        val = self._obj._get_val()
+        for state in states:
+            self._overlay(val, state)
+        return val
+
+    ## Internal ##
+
+    def _mutate(self, func):
+        """Apply func to Pending State, Flushing at size"""
+
+        if self._closed.is_set():
+            raise RuntimeError("buffer is closed")
+        with self._lock:
+            func(self._pending)
+            full = (self._size is not None) and (self._count(self._pending) >= self._size)
+        if full:
+            self.flush()
+
+    def _lookup(self, func):
+        """Return func(state) from Pending then In-Flight State, or None"""
+
+        with self._lock:
+            for state in (self._pending, self._inflight):
+                ret = func(state)
+                if ret is not None:
+                    return ret
+        return None
+
+    def _timer(self):
+        """Flush Every interval Until Closed (Thread)"""
+
+        while not self._closed.wait(self._interval):
+            try:
+                self.flush()
+                self._error = None
+            except Exception as err:
+                self._error = err
+
+    @abc.abstractmethod
+    def _empty(self):
+        """Return Empty State"""
+        pass
+
+    @abc.abstractmethod
+    def _count(self, state):
+        """Return Number of Entries in State"""
+        pass
+
+    @abc.abstractmethod
+    def _merge(self, old, new):
+        """Return old State Updated by new State"""
+        pass
+
+    @abc.abstractmethod
+    def _overlay(self, val, state):
+        """Apply State to Value in Place"""
+        pass
+
+    @abc.abstractmethod
+    def _apply(self, state):
+        """Write State to Object (Transaction)"""
+        pass
+
+class BufferedMutableDictionary(_Buffered):
+    """
+    Write-Behind MutableDictionary
+
+    Sets are last-writer-wins per key. Deletes are blind: deleting a
+    missing key is not an error.
+    """
+
+    _OBJ_TYPE = MutableDictionary
+
+    def __setitem__(self, key, val):
+        """Buffer Set of Mapping Item"""
+
+        # Validate Input
+        self._obj._encode_val_item(key, test=True)
+        self._obj._encode_val_item(val, test=True)
+
+        # Buffer Set
+        def buffer_set(state):
+            state[0][key] = val
+            state[1].discard(key)
+        self._mutate(buffer_set)
+
+    def __delitem__(self, key):
+        """Buffer Delete of Mapping Item"""
+
+        # Validate Input
+        self._obj._encode_val_item(key, test=True)
+
+        # Buffer Delete
+        def buffer_del(state):
+            state[0].pop(key, None)
+            state[1].add(key)
+        self._mutate(buffer_del)
+
+    def update(self, *args, **kwargs):
+        """Buffer Update of Dictionary"""
+
+        # Validate Input
+        val = dict(*args, **kwargs)
+        self._obj._encode_val_obj(val, test=True)
+
+        # Buffer Sets
+        def buffer_update(state):
+            state[0].update(val)
+            state[1].difference_update(val)
+        self._mutate(buffer_update)
+
+    def __getitem__(self, key):
+        """Get Mapping Item, Buffered First"""
+
+        # Check Buffer
+        def lookup(state):
+            if key in state[0]:
+                return (state[0][key],)
+            elif key in state[1]:
+                return ()
+            return None
+        ret = self._lookup(lookup)
+
+        # Read Through
+        if ret is None:
+            return self._obj[key]
+        elif not ret:
+            raise KeyError(key)
+        return ret[0]
+
+    def get(self, key, default=None):
+        """Get Mapping Item or default"""
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        """Contains Key, Buffered First"""
+
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def _empty(self):
+        return (dict(), set())
+
+    def _count(self, state):
+        return len(state[0]) + len(state[1])
+
+    def _merge(self, old, new):
+        sets = dict(old[0])
+        dels = set(old[1])
+        sets.update(new[0])
+        dels.difference_update(new[0])
+        for key in new[1]:
+            sets.pop(key, None)
+            dels.add(key)
+        return (sets, dels)
+
+    def _overlay(self, val, state):
+        val.update(state[0])
+        for key in state[1]:
+            val.pop(key, None)
+
+    def _apply(self, state):
+
+        obj = self._obj
+        sets_out = obj._encode_val_obj(state[0])
+        dels_out = obj._encode_val_many(list(state[1]))
+
+        # Transaction
+        def atomic_flush(pipe):
+
+            # Check Exists
+            if not obj._exists_direct(pipe):
+                raise exceptions.ObjectDNE(obj)
+
+            # Write Sets and Deletes
+            pipe.multi()
+            for chunk in _chunks(viewitems(sets_out)):
+                pipe.hmset(obj._redis_key, dict(chunk))
+            for chunk in _chunks(dels_out):
+                pipe.hdel(obj._redis_key, *chunk)
+
+        # Execute Transaction
+        obj._transact(atomic_flush)
+
+class BufferedMutableSet(_Buffered):
+    """
+    Write-Behind MutableSet
+
+    Adds and discards of the same item cancel out, so the last one wins.
+    """
+
+    _OBJ_TYPE = MutableSet
+
+    def add(self, itm):
+        """Buffer Add of Item"""
+
+        # Validate Input
+        self._obj._encode_val_item(itm, test=True)
+
+        # Buffer Add
+        def buffer_add(state):
+            state[0].add(itm)
+            state[1].discard(itm)
+        self._mutate(buffer_add)
+
+    def discard(self, itm):
+        """Buffer Discard of Item"""
+
+        # Validate Input
+        self._obj._encode_val_item(itm, test=True)
+
+        # Buffer Discard
+        def buffer_discard(state):
+            state[0].discard(itm)
+            state[1].add(itm)
+        self._mutate(buffer_discard)
+
+    def add_many(self, itms):
+        """Buffer Add of Items"""
+
+        # Validate Input
+        itms = set(itms)
+        self._obj._encode_val_obj(itms, test=True)
+
+        # Buffer Adds
+        def buffer_add_many(state):
+            state[0].update(itms)
+            state[1].difference_update(itms)
+        self._mutate(buffer_add_many)
+
+    def discard_many(self, itms):
+        """Buffer Discard of Items"""
+
+        # Validate Input
+        itms = set(itms)
+        self._obj._encode_val_obj(itms, test=True)
+
+        # Buffer Discards
+        def buffer_discard_many(state):
+            state[0].difference_update(itms)
+            state[1].update(itms)
+        self._mutate(buffer_discard_many)
+
+    def __contains__(self, itm):
+        """Contains Item, Buffered First"""
+
+        # Check Buffer
+        def lookup(state):
+            if itm in state[0]:
+                return True
+            elif itm in state[1]:
+                return False
+            return None
+        ret = self._lookup(lookup)
+
+        # Read Through
+        if ret is None:
+            return itm in self._obj
+        return ret
+
+    def _empty(self):
+        return (set(), set())
+
+    def _count(self, state):
+        return len(state[0]) + len(state[1])
+
+    def _merge(self, old, new):
+        adds = (old[0] - new[1]) | new[0]
+        discards = (old[1] - new[0]) | new[1]
+        return (adds, discards)
+
+    def _overlay(self, val, state):
+        val.difference_update(state[1])
+        val.update(state[0])
+
+    def _apply(self, state):
+
+        obj = self._obj
+        adds_out = obj._encode_val_obj(state[0])
+        discards_out = obj._encode_val_obj(state[1])
+
+        # Transaction
+        def atomic_flush(pipe):
+
+            # Check Exists
+            if not obj._exists_direct(pipe):
+                raise exceptions.ObjectDNE(obj)
+
+            # Write Adds and Discards
+            pipe.multi()
+            for chunk in _chunks(adds_out):
+                pipe.sadd(obj._redis_key, *chunk)
+            for chunk in _chunks(discards_out):
+                pipe.srem(obj._redis_key, *chunk)
+
+        # Execute Transaction
+        obj._transact(atomic_flush)
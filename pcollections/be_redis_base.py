@@ -19,11 +19,21 @@ from future.utils import viewitems
 from builtins import *
 
 import abc
+import array
+import collections
+import sys
+from codecs import getincrementaldecoder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from . import exceptions
 from . import constants
 from . import drivers
 from . import abc_base
+from . import codecs as pcodecs
 
 
 ### Constants ###
@@ -33,7 +43,348 @@ _PREFIX_STRING = "string"
 _PREFIX_LIST = "list"
 _PREFIX_SET = "set"
 _PREFIX_DICTIONARY = "hash"
-_INDEX_KEY = "_obj_index"
+_PREFIX_INT_ARRAY = "intarray"
+_PREFIX_FLOAT_ARRAY = "floatarray"
+_PREFIX_COUNTER = "counter"
+_PREFIX_INTEGER = "integer"
+_PREFIX_EXISTS = "_obj_exists"
+_ITER_BATCH = 1000
+_LITTLE_ENDIAN = (sys.byteorder == "little")
+_DTYPE_INT = "<i8"
+_DTYPE_FLOAT = "<f8"
+_ARRAY_TOBYTES = getattr(array.array, "tobytes", getattr(array.array, "tostring", None))
+_ARRAY_FROMBYTES = getattr(array.array, "frombytes", getattr(array.array, "fromstring", None))
+_HAS_CAST = hasattr(memoryview, "cast")
+_COUNT_CODEC = pcodecs.NumberCodec()
+_INT_CODEC = pcodecs.IntCodec()
+
+
+### Lua Scripts ###
+
+# Push vals[first..last] in chunks to stay within Lua's unpack() limit
+_LUA_PUSH = """
+local function push(cmd, key, vals, first, last)
+    for i = first, last, 1000 do
+        redis.call(cmd, key, unpack(vals, i, math.min(i + 999, last)))
+    end
+end
+"""
+
+# Normalize Python slice bounds ('' for None) against len, step 1 only
+_LUA_SLICE = """
+local function bounds(len, first, last)
+    local function norm(arg, default)
+        if arg == '' then
+            return default
+        end
+        local idx = tonumber(arg)
+        if idx < 0 then
+            return math.max(len + idx, 0)
+        end
+        return math.min(idx, len)
+    end
+    local start = norm(first, 0)
+    local stop = norm(last, len)
+    return start, math.max(start, stop)
+end
+"""
+
+# Map UTF-8 character counts and indexes to byte offsets
+_LUA_UTF8 = r"""
+local function utf8_len(val)
+    local _, count = string.gsub(val, '[^\128-\191]', '')
+    return count
+end
+local function utf8_offset(val, idx)
+    local pos = 1
+    for i = 1, idx do
+        pos = string.find(val, '[^\128-\191]', pos + 1) or (string.len(val) + 1)
+    end
+    return pos
+end
+"""
+
+_LUA_STRING_LEN = _LUA_UTF8 + """
+return utf8_len(redis.call('GET', KEYS[1]) or '')
+"""
+
+# Find character ARGV[1] (may be negative), or false if out of range
+_LUA_STRING_GETITEM = _LUA_UTF8 + """
+local val = redis.call('GET', KEYS[1]) or ''
+local len = utf8_len(val)
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = len + idx
+end
+if idx < 0 or idx >= len then
+    return false
+end
+if len == string.len(val) then
+    return string.sub(val, idx + 1, idx + 1)
+end
+return string.sub(val, utf8_offset(val, idx), utf8_offset(val, idx + 1) - 1)
+"""
+
+_LUA_STRING_SLICE = _LUA_UTF8 + _LUA_SLICE + """
+local val = redis.call('GET', KEYS[1]) or ''
+local len = utf8_len(val)
+local start, stop = bounds(len, ARGV[1], ARGV[2])
+if len == string.len(val) then
+    return string.sub(val, start + 1, stop)
+end
+return string.sub(val, utf8_offset(val, start), utf8_offset(val, stop) - 1)
+"""
+
+# Plain (non-pattern) substring search
+_LUA_STRING_CONTAINS = """
+local val = redis.call('GET', KEYS[1]) or ''
+if string.find(val, ARGV[1], 1, true) then
+    return 1
+end
+return 0
+"""
+
+_LUA_ARRAY_LEN = """
+return math.floor(redis.call('STRLEN', KEYS[1]) / tonumber(ARGV[1]))
+"""
+
+# Get packed item ARGV[1] (may be negative) of size ARGV[2], or false
+_LUA_ARRAY_GETITEM = """
+local size = tonumber(ARGV[2])
+local len = math.floor(redis.call('STRLEN', KEYS[1]) / size)
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = len + idx
+end
+if idx < 0 or idx >= len then
+    return false
+end
+return redis.call('GETRANGE', KEYS[1], idx * size, (idx + 1) * size - 1)
+"""
+
+_LUA_ARRAY_SLICE = _LUA_SLICE + """
+local size = tonumber(ARGV[3])
+local len = math.floor(redis.call('STRLEN', KEYS[1]) / size)
+local start, stop = bounds(len, ARGV[1], ARGV[2])
+if start == stop then
+    return ''
+end
+return redis.call('GETRANGE', KEYS[1], start * size, stop * size - 1)
+"""
+
+# Search for packed item ARGV[1], only matching at item boundaries
+_LUA_ARRAY_CONTAINS = """
+local val = redis.call('GET', KEYS[1]) or ''
+local size = string.len(ARGV[1])
+local pos = string.find(val, ARGV[1], 1, true)
+while pos do
+    if (pos - 1) % size == 0 then
+        return 1
+    end
+    pos = string.find(val, ARGV[1], pos + 1, true)
+end
+return 0
+"""
+
+_LUA_LIST_CONTAINS = """
+if redis.call('LPOS', KEYS[1], ARGV[1]) then
+    return 1
+end
+return 0
+"""
+
+_LUA_SET_ISSUBSET = """
+if redis.call('SCARD', KEYS[1]) > redis.call('SCARD', KEYS[2]) then
+    return 0
+end
+local cursor = '0'
+repeat
+    local res = redis.call('SSCAN', KEYS[1], cursor, 'COUNT', 100)
+    cursor = res[1]
+    for _, itm in ipairs(res[2]) do
+        if redis.call('SISMEMBER', KEYS[2], itm) == 0 then
+            return 0
+        end
+    end
+until cursor == '0'
+return 1
+"""
+
+_LUA_SET_ISDISJOINT = """
+local small, large = KEYS[1], KEYS[2]
+if redis.call('SCARD', small) > redis.call('SCARD', large) then
+    small, large = large, small
+end
+local cursor = '0'
+repeat
+    local res = redis.call('SSCAN', small, cursor, 'COUNT', 100)
+    cursor = res[1]
+    for _, itm in ipairs(res[2]) do
+        if redis.call('SISMEMBER', large, itm) == 1 then
+            return 0
+        end
+    end
+until cursor == '0'
+return 1
+"""
+
+
+### Functions ###
+
+def _is_simple_slice(idx):
+    """Check if idx is a Slice with Unit Step and Integer Bounds"""
+
+    if not isinstance(idx, slice):
+        return False
+    if idx.step not in (None, 1):
+        return False
+    for bound in (idx.start, idx.stop):
+        if not ((bound is None) or isinstance(bound, int)):
+            return False
+    return True
+
+def _slice_args(idx):
+    """Convert Slice Bounds to Script Args"""
+
+    start = "" if idx.start is None else idx.start
+    stop = "" if idx.stop is None else idx.stop
+    return (start, stop)
+
+
+def _typecode_int64():
+    """Return the array typecode of signed 64-bit integers"""
+
+    # Python 2 arrays lack "q", but "l" is 64 bits on LP64 hosts
+    for code in ("q", "l"):
+        try:
+            if array.array(native_str(code)).itemsize == 8:
+                return native_str(code)
+        except ValueError:
+            pass
+    raise ImportError("array module has no 64-bit integer typecode")
+
+def _new_version(pipe):
+    """Get Starting Version from Server Clock via pipe (Immediate)"""
+
+    # Restarting from the clock keeps a recreated object from reusing the
+    # versions of the one it replaced
+    sec, usec = pipe.time()
+    return (sec * 1000000) + usec
+
+def open_many(cls, driver, keys, **kwargs):
+    """
+    Open Existing Objects of Type cls in One Round Trip
+
+    Returns an (objs, errs) tuple of dicts keyed by key, with an ObjectDNE
+    in errs for each key that does not exist.
+    """
+
+    # Build Handles
+    objs = {key: cls(driver, key, **kwargs) for key in keys}
+    if not objs:
+        return {}, {}
+
+    # Check Markers
+    markers = [obj._exists_key for obj in objs.values()]
+    found = driver.redis.mget(markers)
+
+    # Split Results
+    errs = {}
+    for obj, marker in zip(list(objs.values()), found):
+        if marker is None:
+            errs[obj.key] = exceptions.ObjectDNE(obj)
+            del(objs[obj.key])
+    return objs, errs
+
+def create_many(cls, driver, vals, **kwargs):
+    """
+    Create New Objects of Type cls from a {key: val} Dict in One Transaction
+
+    Returns an (objs, errs) tuple of dicts keyed by key, with an
+    ObjectExists in errs for each key that already exists. Those objects
+    are left untouched.
+    """
+
+    # Build Handles and Encode Vals
+    objs = {}
+    outs = {}
+    for key, val in viewitems(dict(vals)):
+        if val is None:
+            raise TypeError("val must not be None")
+        obj = cls(driver, key, **kwargs)
+        outs[key] = obj._encode_val_obj(val)
+        objs[key] = obj
+    if not objs:
+        return {}, {}
+
+    # Create Transaction
+    errs = {}
+    def atomic_create_many(pipe):
+
+        # Check Markers
+        errs.clear()
+        markers = [obj._exists_key for obj in objs.values()]
+        found = pipe.mget(markers)
+        for obj, marker in zip(list(objs.values()), found):
+            if marker is not None:
+                errs[obj.key] = exceptions.ObjectExists(obj)
+
+        # Create Missing
+        version = _new_version(pipe)
+        pipe.multi()
+        for key, obj in viewitems(objs):
+            if key not in errs:
+                obj._register(pipe, version)
+                obj._set_val_direct(pipe, outs[key])
+
+    # Execute Transaction
+    watches = []
+    for obj in objs.values():
+        watches += [obj._exists_key, obj._redis_key]
+    try:
+        driver.redis.transaction(atomic_create_many, *watches)
+    finally:
+        for obj in objs.values():
+            obj._invalidate()
+
+    # Split Results
+    for key in errs:
+        del(objs[key])
+    return objs, errs
+
+
+def get_many(driver, objs):
+    """
+    Get Values of Many Objects, of Any Type, in One Transaction
+
+    Returns values in the same order as objs. Raises ObjectDNE for the
+    first object that does not exist.
+    """
+
+    # Check Input
+    objs = list(objs)
+    for obj in objs:
+        if not (isinstance(obj, Persistent) and (obj.driver is driver)):
+            raise TypeError("{!r} is not a Redis object on this driver".format(obj))
+    if not objs:
+        return []
+
+    # Queue Reads
+    pipe = driver.redis.pipeline(transaction=True)
+    for obj in objs:
+        pipe.exists(obj._exists_key)
+        obj._get_val_direct(pipe)
+
+    # Execute Transaction
+    rets = pipe.execute()
+
+    # Decode Values
+    vals = []
+    for i, obj in enumerate(objs):
+        if not rets[2*i]:
+            raise exceptions.ObjectDNE(obj)
+        vals.append(obj._decode_val_obj(rets[(2*i)+1]))
+    return vals
 
 
 ### Base Objects ###
@@ -41,67 +392,129 @@ _INDEX_KEY = "_obj_index"
 class Persistent(abc_base.Persistent):
 
     @abc.abstractmethod
-    def __init__(self, driver, key, prefix, **kwargs):
+    def __init__(self, driver, key, prefix, cache=None, codec=None, **kwargs):
         """ Constructor"""
 
         # Check Args
         if not isinstance(driver, drivers.RedisDriver):
             raise TypeError("driver must be instance of RedisDriver")
+        if codec is None:
+            codec = pcodecs.UTF8
+        elif not isinstance(codec, pcodecs.Codec):
+            raise TypeError("codec must be instance of Codec")
 
         # Save Extra Attrs
+        self._cache = cache
+        self._codec = codec
         self._redis_key = "{:s}{:s}{!s:s}".format(prefix, _SEP_FIELD, key)
+        self._exists_key = "{:s}{:s}{:s}".format(_PREFIX_EXISTS, _SEP_FIELD, self._redis_key)
 
         # Call Parent
         super(Persistent, self).__init__(driver, key, **kwargs)
 
+    @property
+    def codec(self):
+        return self._codec
+
     def _encode_val_item(self, item_in, test=False):
         """Encode single item as bytes"""
 
-        item_out = item_in
-        if isinstance(item_in, bytes):
-            if not test:
-                item_out = item_in
-        elif isinstance(item_in, str) or isinstance(item_in, native_str):
-            if not test:
-                item_out = bytes(item_in.encode(constants.ENCODING))
-        else:
-            raise TypeError("Encoding type '{}' not supported".format(type(item_in)))
-        return item_out
+        if test:
+            self._codec.check(item_in)
+            return item_in
+        return self._codec.encode(item_in)
 
     def _decode_val_item(self, item_in, test=False):
         """Decode single item Python type"""
 
-        item_out = item_in
-        if isinstance(item_in, bytes):
-            if not test:
-                item_out = str(item_in.decode(constants.ENCODING))
-        elif isinstance(item_in, str) or isinstance(item_in, native_str):
-            if not test:
-                item_out = item_in
-        else:
-            raise TypeError("Decoding '{}' not supported".format(type(item_in)))
-        return item_out
+        if test:
+            return item_in
+        return self._codec.decode(item_in)
+
+    def _encode_val_many(self, items_in, test=False):
+        """Encode list of items as bytes"""
+
+        if test:
+            self._codec.check_many(items_in)
+            return items_in
+        return self._codec.encode_many(items_in)
+
+    def _decode_val_many(self, items_in, test=False):
+        """Decode list of items as Python types"""
+
+        if test:
+            return items_in
+        return self._codec.decode_many(items_in)
+
+    def _encode_val_obj(self, obj_in, test=False):
+        """Encode nested object items as bytes, a batch at a time"""
+        return self._map_conv_obj(obj_in, self._encode_val_many, test=test)
+
+    def _decode_val_obj(self, obj_in, test=False):
+        """Decode nested object items as Python types, a batch at a time"""
+        return self._map_conv_obj(obj_in, self._decode_val_many, test=test)
 
     def _transact(self, func, *extra_watches, **kwargs):
 
-        watches = [_INDEX_KEY, self._redis_key]
+        # Get Args
+        readonly = kwargs.pop("readonly", False)
+        versioned = kwargs.pop("versioned", not readonly)
+
+        # Bump the version in every transaction that queues writes
+        bumped = []
+        def versioned_func(pipe):
+            del(bumped[:])
+            func(pipe)
+            if versioned and pipe.explicit_transaction:
+                pipe.incr(self._exists_key)
+                bumped.append(True)
+
+        # Only watch keys belonging to this object so that transactions on
+        # unrelated objects never abort each other
+        watches = [self._exists_key, self._redis_key]
         watches += extra_watches
-        return self.driver.redis.transaction(func, *watches, **kwargs)
+        try:
+            ret = self.driver.redis.transaction(versioned_func, *watches, **kwargs)
+        finally:
+            if not readonly:
+                self._invalidate()
+
+        # Drop Version Reply
+        return ret[:-1] if bumped else ret
+
+    def _invalidate(self):
+        """Drop Cached Value"""
 
-    def _register(self, pipe):
-        """Register Object as Existing"""
+        if self._cache is not None:
+            self._cache.invalidate(self._redis_key)
 
-        pipe.sadd(_INDEX_KEY, self._redis_key)
+    def _cached(self):
+        """Return (hit, val) from Cache, with val a Copy"""
+
+        if self._cache is None:
+            return False, None
+        return self._cache.lookup(self._redis_key, self._codec)
+
+    def _register(self, pipe, version):
+        """Register Object as Existing at version"""
+
+        pipe.set(self._exists_key, version)
 
     def _unregister(self, pipe):
         """Unregister Object as Existing"""
 
-        pipe.srem(_INDEX_KEY, self._redis_key)
+        pipe.delete(self._exists_key)
 
     def _exists_direct(self, pipe):
         """Check if Object Exists via pipe"""
 
-        return bool(pipe.sismember(_INDEX_KEY, self._redis_key))
+        return bool(pipe.exists(self._exists_key))
+
+    def _script_direct(self, pipe, source, *args):
+        """Run Lua Script Against Object Key via pipe"""
+
+        script = self.driver.script(source)
+        return script(keys=[self._redis_key], args=args, client=pipe)
 
     def _init_val_raw(self, create=None, existing=None):
 
@@ -111,6 +524,10 @@ class Persistent(abc_base.Persistent):
         else:
             raise TypeError("existing must be bool or None")
 
+        # Opening without a value or an existence check needs no round trip
+        if create is None and existing is None:
+            return
+
         # Init Transaction
         def atomic_init(pipe):
 
@@ -137,8 +554,9 @@ class Persistent(abc_base.Persistent):
                 else:
                     if create is not None:
                         # Create
+                        version = _new_version(pipe)
                         pipe.multi()
-                        self._register(pipe)
+                        self._register(pipe, version)
                         self._set_val_direct(pipe, create)
                     else:
                         # Open Nonexisting
@@ -176,16 +594,82 @@ class Persistent(abc_base.Persistent):
             self._get_val_direct(pipe)
 
         # Execute Transaction
-        ret = self._transact(atomic_get)
+        ret = self._transact(atomic_get, readonly=True)
 
         # Return Raw
         return ret[0]
 
+    def _get_val(self):
+        """Get value as python types (Cached)"""
+
+        if self._cache is None:
+            return super(Persistent, self)._get_val()
+        return self._cache.fetch(self._redis_key, super(Persistent, self)._get_val,
+                                 self._codec)
+
     @abc.abstractmethod
     def _get_val_direct(self, pipe):
         """Get value via pipe"""
         pass
 
+    def version(self):
+        """Get Version, Changed by Every Mutation (Transaction)"""
+
+        ret = self._transact_read(lambda pipe: pipe.get(self._exists_key))
+        return int(ret)
+
+    def get_val_if_changed(self, version):
+        """
+        Get (version, value), with value None if still at version (Transaction)
+
+        Pass the version from an earlier call to skip transferring an
+        unchanged value. Versions restart from the server clock when an
+        object is recreated, so only compare them for equality.
+        """
+
+        # Get Transaction
+        current = []
+        def atomic_get(pipe):
+
+            del(current[:])
+            ret = pipe.get(self._exists_key)
+            if ret is None:
+                raise exceptions.ObjectDNE(self)
+            current.append(int(ret))
+            if current[0] == version:
+                return
+            pipe.multi()
+            self._get_val_direct(pipe)
+
+        # Execute Transaction
+        ret = self._transact(atomic_get, readonly=True)
+
+        # Return Version and Value
+        if not ret:
+            return current[0], None
+        return current[0], self._decode_val_obj(ret[0])
+
+    def get_val_versioned(self):
+        """Get (version, value) (Transaction)"""
+        return self.get_val_if_changed(None)
+
+    def _transact_read(self, func):
+        """Run read func against existing Object (Transaction)"""
+
+        # Read Transaction
+        def atomic_read(pipe):
+
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+            pipe.multi()
+            func(pipe)
+
+        # Execute Transaction
+        ret = self._transact(atomic_read, readonly=True)
+
+        # Return Result
+        return ret[0]
+
     def exists(self):
         """Check if Object Exists (Transaction)"""
 
@@ -196,7 +680,7 @@ class Persistent(abc_base.Persistent):
             self._exists_direct(pipe)
 
         # Check if Object Exists
-        ret = self._transact(atomic_exists)
+        ret = self._transact(atomic_exists, readonly=True)
 
         # Return Bool
         return ret[0]
@@ -217,21 +701,135 @@ class Persistent(abc_base.Persistent):
             self._unregister(pipe)
 
         # Delete Object
-        self._transact(atomic_rem)
+        self._transact(atomic_rem, versioned=False)
+
+class Collection(Persistent):
+    """Container Answering len(), in, and Iteration Server-Side"""
+
+    def __len__(self):
+        """Get Len of Object (Transaction)"""
+
+        hit, val = self._cached()
+        if hit:
+            return len(val)
+        return self._transact_read(self._len_direct)
+
+    @abc.abstractmethod
+    def _len_direct(self, pipe):
+        """Get len via pipe"""
+        pass
+
+    def __bool__(self):
+        """Test Bool"""
+        return bool(len(self))
+
+    def __iter__(self):
+        """Iterate Across Object"""
+        return self.iterate()
+
+    def iterate(self, batch=_ITER_BATCH):
+        """
+        Iterate Across Object, Reading batch Items at a Time
+
+        Each batch is its own read, so memory stays bounded, but the
+        iteration is not a snapshot: items written concurrently may be
+        missed, and SSCAN/HSCAN may return an item more than once.
+        """
+
+        if batch < 1:
+            raise ValueError("batch must be positive")
+        return (itm for chunk in self._iter_chunks(batch) for itm in chunk)
+
+    def _iter_chunks(self, batch):
+        """Yield Decoded Chunks of Object"""
+
+        cursor = 0
+        while cursor is not None:
+            ret = self._transact_read(lambda pipe: self._chunk_direct(pipe, cursor, batch))
+            cursor, chunk = self._chunk_parse(cursor, batch, ret)
+            yield chunk
+
+    @abc.abstractmethod
+    def _chunk_direct(self, pipe, cursor, batch):
+        """Get chunk at cursor via pipe"""
+        pass
+
+    @abc.abstractmethod
+    def _chunk_parse(self, cursor, batch, ret):
+        """Return next cursor (None when done) and decoded chunk"""
+        pass
+
+    def __contains__(self, itm):
+        """Contains Item (Transaction)"""
+
+        # Only encodable items can be stored, so let the parent handle the rest
+        try:
+            self._encode_val_item(itm, test=True)
+        except TypeError:
+            return super(Collection, self).__contains__(itm)
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return itm in val
+
+        # Check Membership
+        itm = self._encode_val_item(itm)
+        ret = self._transact_read(lambda pipe: self._contains_direct(pipe, itm))
+
+        # Return Bool
+        return bool(ret)
+
+    @abc.abstractmethod
+    def _contains_direct(self, pipe, itm):
+        """Check membership via pipe"""
+        pass
 
 
 ### Objects ###
 
-class String(Persistent, abc_base.String):
+class String(Collection, abc_base.String):
 
     def __init__(self, driver, key, **kwargs):
         """ Constructor"""
 
+        # Strings are sequences of characters, so they are UTF-8 unless raw
+        codec = kwargs.get("codec", None)
+        inner = codec.codec if isinstance(codec, pcodecs.ZlibCodec) else codec
+        if not (inner is None or isinstance(inner, (pcodecs.Utf8Codec, pcodecs.RawCodec))):
+            raise TypeError("String only supports Utf8Codec or RawCodec, optionally via ZlibCodec")
+
+        # Raw Strings are immutable sequences of bytes
+        self._raw = isinstance(inner, pcodecs.RawCodec)
+        if self._raw and isinstance(self, abc_base.MutableSequence):
+            raise TypeError("MutableString does not support RawCodec, use String")
+
+        # Compressed bytes do not map to characters, so work on the whole value
+        self._compressed = isinstance(codec, pcodecs.ZlibCodec)
+
         # Call Parent
         super(String, self).__init__(driver, key, _PREFIX_STRING, **kwargs)
 
     def _map_conv_obj(self, obj_in, conv_func, test=False):
-        return conv_func(obj_in, test=test)
+        return conv_func([obj_in], test=test)[0]
+
+    def __len__(self):
+        """Get Len of Object (Transaction)"""
+
+        if self._compressed:
+            return len(self._get_val())
+        return super(String, self).__len__()
+
+    def __contains__(self, itm):
+        """Contains Item (Transaction)"""
+
+        # Raw Strings contain bytes, like bytes objects
+        if self._raw and isinstance(itm, int):
+            itm = bytes(bytearray([itm]))
+
+        if self._compressed:
+            return itm in self._get_val()
+        return super(String, self).__contains__(itm)
 
     def _set_val_direct(self, pipe, val):
 
@@ -241,10 +839,110 @@ class String(Persistent, abc_base.String):
 
         pipe.get(self._redis_key)
 
+    def _len_direct(self, pipe):
+
+        if self._raw:
+            pipe.strlen(self._redis_key)
+        else:
+            self._script_direct(pipe, _LUA_STRING_LEN)
+
+    def _contains_direct(self, pipe, itm):
+
+        self._script_direct(pipe, _LUA_STRING_CONTAINS, itm)
+
+    def _iter_chunks(self, batch):
+
+        # Compressed values are read whole
+        if self._compressed:
+            yield list(self._get_val())
+            return
+
+        # Chunks are byte ranges, so carry split characters between them
+        if self._raw:
+            decode = lambda ret, done: bytearray(ret)
+        else:
+            decode = getincrementaldecoder(constants.ENCODING)().decode
+        cursor = 0
+        while cursor is not None:
+            ret = self._transact_read(lambda pipe: self._chunk_direct(pipe, cursor, batch))
+            cursor, chunk = self._chunk_parse(cursor, batch, ret)
+            yield list(decode(chunk, (cursor is None)))
+
+    def _chunk_direct(self, pipe, cursor, batch):
+
+        pipe.getrange(self._redis_key, cursor, (cursor + batch - 1))
+
+    def _chunk_parse(self, cursor, batch, ret):
+
+        # Byte ranges are decoded by _iter_chunks, since characters may span them
+        done = (len(ret) < batch)
+        return (None if done else (cursor + batch)), ret
+
+    def __getitem__(self, idx):
+        """Get Seq Item (Transaction)"""
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return self._getitem_val(val, idx)
+
+        # Compressed values are read whole
+        if self._compressed:
+            return self._getitem_val(self._get_val(), idx)
+
+        # Raw Strings index bytes directly
+        if self._raw:
+            return self._getitem_raw(idx)
+
+        # Get Substring
+        if _is_simple_slice(idx):
+            ret = self._transact_read(
+                lambda pipe: self._script_direct(pipe, _LUA_STRING_SLICE, *_slice_args(idx)))
+            return self._decode_val_item(ret)
+
+        # Only plain indexes map to a single character
+        if not isinstance(idx, int):
+            return super(String, self).__getitem__(idx)
+
+        # Get Character
+        ret = self._transact_read(
+            lambda pipe: self._script_direct(pipe, _LUA_STRING_GETITEM, idx))
+        if ret is None:
+            raise IndexError("string index out of range")
+
+        # Return Character
+        return self._decode_val_item(ret)
+
+    def _getitem_val(self, val, idx):
+        """Get Item of Fetched Value"""
+
+        # Python 2 str indexes as characters, so index raw values as bytes
+        return bytes(val)[idx] if self._raw else val[idx]
+
+    def _getitem_raw(self, idx):
+        """Get Byte or Bytes of Raw String (Transaction)"""
+
+        # Get Bytes
+        if _is_simple_slice(idx):
+            args = _slice_args(idx) + (1,)
+            return self._transact_read(
+                lambda pipe: self._script_direct(pipe, _LUA_ARRAY_SLICE, *args))
+
+        # Only plain indexes map to a single byte
+        if not isinstance(idx, int):
+            return self._get_val()[idx]
+
+        # Get Byte
+        ret = self._transact_read(
+            lambda pipe: self._script_direct(pipe, _LUA_ARRAY_GETITEM, idx, 1))
+        if ret is None:
+            raise IndexError("index out of range")
+        return bytearray(ret)[0]
+
 class MutableString(String, abc_base.MutableString):
     pass
 
-class List(Persistent, abc_base.List):
+class List(Collection, abc_base.List):
 
     def __init__(self, driver, key, **kwargs):
         """ Constructor"""
@@ -253,11 +951,7 @@ class List(Persistent, abc_base.List):
         super(List, self).__init__(driver, key, _PREFIX_LIST, **kwargs)
 
     def _map_conv_obj(self, obj_in, conv_func, test=False):
-
-        obj_out = list()
-        for item in obj_in:
-            obj_out.append(conv_func(item, test=test))
-        return obj_out
+        return list(conv_func(list(obj_in), test=test))
 
     def _set_val_direct(self, pipe, val):
 
@@ -269,10 +963,246 @@ class List(Persistent, abc_base.List):
 
         pipe.lrange(self._redis_key, 0, -1)
 
+    def _len_direct(self, pipe):
+
+        pipe.llen(self._redis_key)
+
+    def _contains_direct(self, pipe, itm):
+
+        self._script_direct(pipe, _LUA_LIST_CONTAINS, itm)
+
+    def _chunk_direct(self, pipe, cursor, batch):
+
+        pipe.lrange(self._redis_key, cursor, (cursor + batch - 1))
+
+    def _chunk_parse(self, cursor, batch, ret):
+
+        done = (len(ret) < batch)
+        return (None if done else (cursor + batch)), self._decode_val_obj(ret)
+
+    def __getitem__(self, idx):
+        """Get Seq Item (Transaction)"""
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return val[idx]
+
+        # Get Range
+        if _is_simple_slice(idx):
+
+            # LRANGE takes an inclusive stop, and a stop of -1 means the end
+            start = 0 if idx.start is None else idx.start
+            if idx.stop is None:
+                stop = -1
+            elif idx.stop == 0:
+                start, stop = 1, 0
+            else:
+                stop = idx.stop - 1
+
+            ret = self._transact_read(lambda pipe: pipe.lrange(self._redis_key, start, stop))
+            return self._decode_val_obj(ret)
+
+        # Only plain indexes map to LINDEX
+        if not isinstance(idx, int):
+            return super(List, self).__getitem__(idx)
+
+        # Get Item
+        ret = self._transact_read(lambda pipe: pipe.lindex(self._redis_key, idx))
+        if ret is None:
+            raise IndexError("list index out of range")
+
+        # Return Item
+        return self._decode_val_item(ret)
+
 class MutableList(List, abc_base.MutableList):
     pass
 
-class Set(Persistent, abc_base.Set):
+class Array(Collection, abc_base.Array):
+    """
+    Array of Fixed-Size Numbers Packed into One Little-Endian Binary Value
+
+    get_val() loads the whole array, as an array.array, in one GET, and
+    item and slice reads use GETRANGE. Numbers are not encoded by a
+    codec. Sequences, array.arrays and NumPy arrays are accepted as values.
+    """
+
+    _PREFIX = None
+    _TYPECODE = None
+    _DTYPE = None
+    _KINDS = None
+    _ITEMSIZE = 8
+    _EXACT = True
+
+    def __init__(self, driver, key, **kwargs):
+        """ Constructor"""
+
+        # Arrays are packed, so they take no item codec
+        if kwargs.get("codec", None) is not None:
+            raise TypeError("{:s} does not take a codec".format(type(self).__name__))
+
+        # Call Parent
+        super(Array, self).__init__(driver, key, self._PREFIX, **kwargs)
+
+    def _map_conv_obj(self, obj_in, conv_func, test=False):
+        return conv_func(obj_in, test=test)
+
+    def _encode_val_obj(self, obj_in, test=False):
+        """Pack numbers as little-endian bytes"""
+
+        # NumPy arrays are converted in one pass
+        if (numpy is not None) and isinstance(obj_in, numpy.ndarray):
+            if obj_in.dtype.kind not in self._KINDS:
+                raise TypeError("Encoding dtype '{}' not supported".format(obj_in.dtype))
+            return obj_in if test else obj_in.astype(self._DTYPE).tobytes()
+
+        # Strings would be read as raw buffers
+        if isinstance(obj_in, (str, bytes, native_str)):
+            raise TypeError("Encoding type '{}' not supported".format(type(obj_in)))
+
+        # Pack via array, which type-checks each item
+        val = array.array(self._TYPECODE, obj_in)
+        if test:
+            return obj_in
+        if not _LITTLE_ENDIAN:
+            val.byteswap()
+        return _ARRAY_TOBYTES(val)
+
+    def _decode_val_obj(self, obj_in, test=False):
+        """Unpack little-endian bytes as array"""
+
+        if test:
+            return obj_in
+        val = array.array(self._TYPECODE)
+        _ARRAY_FROMBYTES(val, obj_in or b"")
+        if not _LITTLE_ENDIAN:
+            val.byteswap()
+        return val
+
+    def _encode_val_item(self, item_in, test=False):
+        """Pack single number as little-endian bytes"""
+
+        out = self._encode_val_obj([item_in], test=test)
+        return item_in if test else out
+
+    def _decode_val_item(self, item_in, test=False):
+        """Unpack single number from little-endian bytes"""
+
+        return item_in if test else self._decode_val_obj(item_in)[0]
+
+    def _set_val_direct(self, pipe, val):
+
+        pipe.set(self._redis_key, val)
+
+    def _get_val_direct(self, pipe):
+
+        pipe.get(self._redis_key)
+
+    def _len_direct(self, pipe):
+
+        self._script_direct(pipe, _LUA_ARRAY_LEN, self._ITEMSIZE)
+
+    def _contains_direct(self, pipe, itm):
+
+        self._script_direct(pipe, _LUA_ARRAY_CONTAINS, itm)
+
+    def _chunk_direct(self, pipe, cursor, batch):
+
+        first = cursor * self._ITEMSIZE
+        pipe.getrange(self._redis_key, first, (first + (batch * self._ITEMSIZE) - 1))
+
+    def _chunk_parse(self, cursor, batch, ret):
+
+        val = self._decode_val_obj(ret)
+        done = (len(val) < batch)
+        return (None if done else (cursor + batch)), list(val)
+
+    def __contains__(self, itm):
+        """Contains Item (Transaction)"""
+
+        # Equal floats may differ in bytes (0.0 and -0.0), so compare values
+        if not self._EXACT:
+            return itm in self._get_val()
+        return super(Array, self).__contains__(itm)
+
+    def __getitem__(self, idx):
+        """Get Seq Item (Transaction)"""
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return val[idx]
+
+        # Get Range
+        if _is_simple_slice(idx):
+            args = _slice_args(idx) + (self._ITEMSIZE,)
+            ret = self._transact_read(
+                lambda pipe: self._script_direct(pipe, _LUA_ARRAY_SLICE, *args))
+            return self._decode_val_obj(ret)
+
+        # Only plain indexes map to a single item
+        if not isinstance(idx, int):
+            return super(Array, self).__getitem__(idx)
+
+        # Get Item
+        ret = self._transact_read(
+            lambda pipe: self._script_direct(pipe, _LUA_ARRAY_GETITEM, idx, self._ITEMSIZE))
+        if ret is None:
+            raise IndexError("array index out of range")
+
+        # Return Item
+        return self._decode_val_item(ret)
+
+    def get_view(self):
+        """
+        Get Value as a Read-Only memoryview of the Stored Bytes
+
+        The view wraps the GET reply without copying it. Big-endian hosts
+        get a view of a converted array instead. Python 2 memoryviews can
+        not be cast, so there the decoded array is returned.
+        """
+
+        raw = self._get_val_raw() or b""
+        if not _HAS_CAST:
+            return self._decode_val_obj(raw)
+        if not _LITTLE_ENDIAN:
+            return memoryview(self._decode_val_obj(raw))
+        return memoryview(raw).cast(self._TYPECODE)
+
+    def get_numpy(self):
+        """Get Value as a Read-Only NumPy Array over the Stored Bytes (Requires numpy)"""
+
+        if numpy is None:
+            raise ImportError("get_numpy() requires the numpy package")
+        return numpy.frombuffer(self._get_val_raw() or b"", dtype=self._DTYPE)
+
+class MutableArray(Array, abc_base.MutableArray):
+    pass
+
+class IntArray(Array):
+    """Packed Array of Signed 64-bit Integers"""
+
+    _PREFIX = _PREFIX_INT_ARRAY
+    _TYPECODE = _typecode_int64()
+    _DTYPE = _DTYPE_INT
+    _KINDS = "biu"
+
+class MutableIntArray(IntArray, MutableArray):
+    pass
+
+class FloatArray(Array):
+    """Packed Array of 64-bit Floats"""
+
+    _PREFIX = _PREFIX_FLOAT_ARRAY
+    _TYPECODE = native_str("d")
+    _DTYPE = _DTYPE_FLOAT
+    _KINDS = "biuf"
+    _EXACT = False
+
+class MutableFloatArray(FloatArray, MutableArray):
+    pass
+
+class Set(Collection, abc_base.Set):
 
     def __init__(self, driver, key, **kwargs):
         """Set Constructor"""
@@ -280,12 +1210,121 @@ class Set(Persistent, abc_base.Set):
         # Call Parent
         super(Set, self).__init__(driver, key, _PREFIX_SET, **kwargs)
 
-    def _map_conv_obj(self, obj_in, conv_func, test=False):
+    def _is_stored_set(self, other):
+        """Check if other is a Set in the same Redis Database, Stored with the Same Codec"""
+
+        return (isinstance(other, Set) and (other.driver is self.driver) and
+                ((other.codec is self.codec) or (other.codec == self.codec)))
+
+    def _is_stored_peer(self, other):
+        """Check if other is the same type of Set in the same Redis Database"""
+
+        return (type(other) == type(self)) and self._is_stored_set(other)
+
+    def _transact_stored(self, other, func):
+        """Run read func against this and other Set (Transaction)"""
+
+        # Read Transaction
+        def atomic_read(pipe):
+
+            if not self._exists_direct(pipe):
+                raise exceptions.ObjectDNE(self)
+            if not other._exists_direct(pipe):
+                raise exceptions.ObjectDNE(other)
+            pipe.multi()
+            func(pipe)
+
+        # Execute Transaction
+        return self._transact(atomic_read, other._exists_key, other._redis_key, readonly=True)
+
+    def _script_stored(self, other, source):
+        """Run read script against this and other Set (Transaction)"""
+
+        script = self.driver.script(source)
+        keys = [self._redis_key, other._redis_key]
+        def script_read(pipe):
+            script(keys=keys, client=pipe)
+        ret = self._transact_stored(other, script_read)
+        return bool(ret[0])
+
+    def __and__(self, other):
+        """Return Intersection"""
+        if self._is_stored_peer(other):
+            ret = self._transact_stored(
+                other, lambda pipe: pipe.sinter(self._redis_key, other._redis_key))
+            return self._decode_val_obj(ret[0])
+        return super(Set, self).__and__(other)
+
+    def __or__(self, other):
+        """Return Union"""
+        if self._is_stored_peer(other):
+            ret = self._transact_stored(
+                other, lambda pipe: pipe.sunion(self._redis_key, other._redis_key))
+            return self._decode_val_obj(ret[0])
+        return super(Set, self).__or__(other)
+
+    def __xor__(self, other):
+        """Return Symmetric Difference"""
+        if self._is_stored_peer(other):
+            def read_xor(pipe):
+                pipe.sdiff(self._redis_key, other._redis_key)
+                pipe.sdiff(other._redis_key, self._redis_key)
+            ret = self._transact_stored(other, read_xor)
+            return self._decode_val_obj(ret[0] | ret[1])
+        return super(Set, self).__xor__(other)
+
+    def __sub__(self, other):
+        """Return Difference"""
+        if self._is_stored_peer(other):
+            ret = self._transact_stored(
+                other, lambda pipe: pipe.sdiff(self._redis_key, other._redis_key))
+            return self._decode_val_obj(ret[0])
+        return super(Set, self).__sub__(other)
+
+    def intersection(self, other):
+        """Return Intersection"""
+        if self._is_stored_peer(other):
+            return self.__and__(other)
+        return super(Set, self).intersection(other)
+
+    def union(self, other):
+        """Return Union"""
+        if self._is_stored_peer(other):
+            return self.__or__(other)
+        return super(Set, self).union(other)
+
+    def difference(self, other):
+        """Return Difference"""
+        if self._is_stored_peer(other):
+            return self.__sub__(other)
+        return super(Set, self).difference(other)
+
+    def symmetric_difference(self, other):
+        """Return Symmetric Difference"""
+        if self._is_stored_peer(other):
+            return self.__xor__(other)
+        return super(Set, self).symmetric_difference(other)
+
+    def issubset(self, other):
+        """Test Subset"""
+        if self._is_stored_peer(other):
+            return self._script_stored(other, _LUA_SET_ISSUBSET)
+        return super(Set, self).issubset(other)
+
+    def issuperset(self, other):
+        """Test Superset"""
+        if self._is_stored_peer(other):
+            return other._script_stored(self, _LUA_SET_ISSUBSET)
+        return super(Set, self).issuperset(other)
+
+    def isdisjoint(self, other):
+        """Test Disjoint"""
+        if self._is_stored_set(other):
+            return self._script_stored(other, _LUA_SET_ISDISJOINT)
+        return super(Set, self).isdisjoint(other)
 
-        obj_out = set()
-        for item in obj_in:
-            obj_out.add(conv_func(item, test=test))
-        return obj_out
+    def _map_conv_obj(self, obj_in, conv_func, test=False):
+        return set(conv_func(list(obj_in), test=test))
 
     def _set_val_direct(self, pipe, val):
 
@@ -297,26 +1336,61 @@ class Set(Persistent, abc_base.Set):
 
         pipe.smembers(self._redis_key)
 
+    def _len_direct(self, pipe):
+
+        pipe.scard(self._redis_key)
+
+    def _contains_direct(self, pipe, itm):
+
+        pipe.sismember(self._redis_key, itm)
+
+    def sample(self, k):
+        """Return up to k Distinct Random Items (Transaction)"""
+
+        # Validate Input
+        if k < 0:
+            raise ValueError("k must not be negative")
+
+        # Get Sample
+        ret = self._transact_read(lambda pipe: pipe.srandmember(self._redis_key, k))
+        return [self._decode_val_item(itm) for itm in ret]
+
+    def _chunk_direct(self, pipe, cursor, batch):
+
+        pipe.sscan(self._redis_key, cursor, count=batch)
+
+    def _chunk_parse(self, cursor, batch, ret):
+
+        cursor, members = ret
+        return (cursor or None), [self._decode_val_item(itm) for itm in members]
+
 class MutableSet(Set, abc_base.MutableSet):
     pass
 
-class Dictionary(Persistent, abc_base.Dictionary):
+class Dictionary(Collection, abc_base.Dictionary):
+
+    _PREFIX = _PREFIX_DICTIONARY
 
     def __init__(self, driver, key, **kwargs):
         """ Constructor"""
 
         # Call Parent
-        super(Dictionary, self).__init__(driver, key, _PREFIX_DICTIONARY, **kwargs)
+        super(Dictionary, self).__init__(driver, key, self._PREFIX, **kwargs)
 
     def _map_conv_obj(self, obj_in, conv_func, test=False):
 
         obj_in = dict(obj_in)
-        obj_out = dict()
-        for key, val in viewitems(obj_in):
-            key = conv_func(key, test=test)
-            val = conv_func(val, test=test)
-            obj_out[key] = val
-        return obj_out
+        keys = list(obj_in)
+        vals = [obj_in[key] for key in keys]
+        return dict(zip(conv_func(keys, test=test), conv_func(vals, test=test)))
+
+    def _encode_val_mapped(self, item_in, test=False):
+        """Encode single mapped value as bytes"""
+        return self._encode_val_item(item_in, test=test)
+
+    def _decode_val_mapped(self, item_in, test=False):
+        """Decode single mapped value as Python type"""
+        return self._decode_val_item(item_in, test=test)
 
     def _set_val_direct(self, pipe, val):
 
@@ -328,5 +1402,207 @@ class Dictionary(Persistent, abc_base.Dictionary):
 
         pipe.hgetall(self._redis_key)
 
+    def _len_direct(self, pipe):
+
+        pipe.hlen(self._redis_key)
+
+    def _contains_direct(self, pipe, itm):
+
+        pipe.hexists(self._redis_key, itm)
+
+    def _chunk_direct(self, pipe, cursor, batch):
+
+        pipe.hscan(self._redis_key, cursor, count=batch)
+
+    def _chunk_parse(self, cursor, batch, ret):
+
+        cursor, fields = ret
+        return (cursor or None), list(viewitems(self._decode_val_obj(fields)))
+
+    def iterate(self, batch=_ITER_BATCH):
+        """Iterate Across Keys, Reading batch Items at a Time"""
+        return (key for key, _ in self.iterate_items(batch))
+
+    def iterate_items(self, batch=_ITER_BATCH):
+        """Iterate Across Items, Reading batch Items at a Time"""
+        return super(Dictionary, self).iterate(batch)
+
+    def items(self):
+        """Return Streaming Items View"""
+        return _ItemsView(self)
+
+    def values(self):
+        """Return Streaming Values View"""
+        return _ValuesView(self)
+
+    def get_many(self, keys, default=None):
+        """Get Values of keys in Order, with default for Missing (Transaction)"""
+
+        # Validate Input
+        keys = list(keys)
+        for key in keys:
+            self._encode_val_item(key, test=True)
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return [val.get(key, default) for key in keys]
+
+        # HMGET needs at least one field
+        if not keys:
+            self._transact_read(self._len_direct)
+            return []
+
+        # Get Items
+        out = [self._encode_val_item(key) for key in keys]
+        ret = self._transact_read(lambda pipe: pipe.hmget(self._redis_key, out))
+
+        # Return Items
+        return [default if itm is None else self._decode_val_mapped(itm) for itm in ret]
+
+    def __getitem__(self, key):
+        """Get Mapping Item (Transaction)"""
+
+        # Only encodable keys can be stored, so let the parent raise for the rest
+        try:
+            self._encode_val_item(key, test=True)
+        except TypeError:
+            return super(Dictionary, self).__getitem__(key)
+
+        # Check Cache
+        hit, val = self._cached()
+        if hit:
+            return val[key]
+
+        # Get Item
+        ret = self._transact_read(
+            lambda pipe: pipe.hget(self._redis_key, self._encode_val_item(key)))
+        if ret is None:
+            raise KeyError(key)
+
+        # Return Item
+        return self._decode_val_mapped(ret)
+
 class MutableDictionary(Dictionary, abc_base.MutableDictionary):
     pass
+
+class Counter(Dictionary, abc_base.Counter):
+    """
+    Hash of Items and their Counts
+
+    Items are encoded by the codec, counts always as decimal text so that
+    HINCRBY and HINCRBYFLOAT can change them in place. Missing items
+    count as 0, and get_val() returns a collections.Counter.
+    """
+
+    _PREFIX = _PREFIX_COUNTER
+
+    def _encode_val_obj(self, obj_in, test=False):
+        """Encode items via codec and counts as numbers"""
+
+        obj_in = dict(obj_in)
+        keys = list(obj_in)
+        vals = [obj_in[key] for key in keys]
+        keys_out = self._encode_val_many(keys, test=test)
+        if test:
+            _COUNT_CODEC.check_many(vals)
+            return dict(zip(keys_out, vals))
+        return dict(zip(keys_out, _COUNT_CODEC.encode_many(vals)))
+
+    def _decode_val_obj(self, obj_in, test=False):
+        """Decode items via codec and counts as numbers"""
+
+        keys = list(obj_in)
+        vals = [obj_in[key] for key in keys]
+        if not test:
+            vals = _COUNT_CODEC.decode_many(vals)
+        return collections.Counter(dict(zip(self._decode_val_many(keys, test=test), vals)))
+
+    def _encode_val_mapped(self, item_in, test=False):
+        """Encode single count as bytes"""
+
+        if test:
+            _COUNT_CODEC.check(item_in)
+            return item_in
+        return _COUNT_CODEC.encode(item_in)
+
+    def _decode_val_mapped(self, item_in, test=False):
+        """Decode single count as number"""
+
+        if test:
+            return item_in
+        return _COUNT_CODEC.decode(item_in)
+
+    def get_many(self, keys, default=0):
+        """Get Counts of keys in Order, with default for Missing (Transaction)"""
+        return super(Counter, self).get_many(keys, default)
+
+    def get(self, key, default=None):
+        """Get Count of Item or default (Transaction)"""
+
+        # Only encodable keys can be stored
+        try:
+            self._encode_val_item(key, test=True)
+        except TypeError:
+            return super(Counter, self).get(key, default)
+
+        # Get Item
+        return self.get_many([key], default)[0]
+
+    def __getitem__(self, key):
+        """Get Count of Item, 0 if Missing (Transaction)"""
+
+        try:
+            return super(Counter, self).__getitem__(key)
+        except KeyError:
+            return 0
+
+class MutableCounter(Counter, abc_base.MutableCounter):
+    pass
+
+class Integer(Persistent, abc_base.Integer):
+    """Integer Stored as Decimal Text (Compatible with INCRBY)"""
+
+    def __init__(self, driver, key, **kwargs):
+        """ Constructor"""
+
+        # Integers are stored as text, so they take no item codec
+        if kwargs.get("codec", None) is not None:
+            raise TypeError("{:s} does not take a codec".format(type(self).__name__))
+        kwargs["codec"] = _INT_CODEC
+
+        # Call Parent
+        super(Integer, self).__init__(driver, key, _PREFIX_INTEGER, **kwargs)
+
+    def _map_conv_obj(self, obj_in, conv_func, test=False):
+        return conv_func([obj_in], test=test)[0]
+
+    def _set_val_direct(self, pipe, val):
+
+        pipe.set(self._redis_key, val)
+
+    def _get_val_direct(self, pipe):
+
+        pipe.get(self._redis_key)
+
+    def __bool__(self):
+        """Test Bool"""
+        return bool(self._get_val())
+
+class AtomicInteger(Integer, abc_base.AtomicInteger):
+    pass
+
+
+### Views ###
+
+class _ItemsView(collections.ItemsView):
+
+    def __iter__(self):
+        """Iterate Across Items via HSCAN"""
+        return self._mapping.iterate_items()
+
+class _ValuesView(collections.ValuesView):
+
+    def __iter__(self):
+        """Iterate Across Values via HSCAN"""
+        return (val for _, val in self._mapping.iterate_items())
@@ -0,0 +1,1426 @@
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Package
+
+
+### Imports ###
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from future.utils import native_str
+from future.utils import viewitems
+from builtins import *
+
+import abc
+
+import redis
+
+from . import exceptions
+from . import be_redis_base
+from . import be_redis_atomic
+
+
+### Constants ###
+
+_ERR_DNE = "PCOL_DNE"
+_ERR_EXISTS = "PCOL_EXISTS"
+_ERR_INDEX = "PCOL_INDEX"
+_ERR_KEY = "PCOL_KEY"
+_ERR_VALUE = "PCOL_VALUE"
+_ERR_TYPE = "PCOL_TYPE"
+
+_VERSIONED = {}
+
+
+### Lua Scripts ###
+
+# All scripts are called with KEYS[1] set to the object's existence
+# marker and KEYS[2] set to the object's data key.
+
+_LUA_CHECK = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return redis.error_reply('PCOL_DNE')
+end
+"""
+
+_LUA_PUSH = be_redis_base._LUA_PUSH
+
+# Run a mutating script as a function, then bump the version held in the
+# existence marker unless the script failed or removed the object
+_LUA_VERSIONED = """
+local function run()
+%s
+end
+local ret = run()
+if not (type(ret) == 'table' and ret.err) and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('INCR', KEYS[1])
+end
+return ret
+"""
+
+_LUA_INIT = """
+local exists = (redis.call('EXISTS', KEYS[1]) == 1)
+if exists then
+    if ARGV[1] == '0' then
+        return redis.error_reply('PCOL_EXISTS')
+    elseif ARGV[1] == '1' and ARGV[2] == '1' then
+        write(3)
+    end
+else
+    if ARGV[1] == '1' then
+        return redis.error_reply('PCOL_DNE')
+    elseif ARGV[2] == '1' then
+        local now = redis.call('TIME')
+        redis.call('SET', KEYS[1], now[1] .. string.format('%06d', tonumber(now[2])))
+        write(3)
+    end
+end
+return redis.status_reply('OK')
+"""
+
+_LUA_SET = _LUA_CHECK + """
+write(1)
+return redis.status_reply('OK')
+"""
+
+_LUA_GET = _LUA_CHECK + """
+return read()
+"""
+
+_LUA_GET_IF_CHANGED = _LUA_CHECK + """
+local version = redis.call('GET', KEYS[1])
+if version == ARGV[1] then
+    return {version}
+end
+return {version, read()}
+"""
+
+_LUA_REM = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    if ARGV[1] == '1' then
+        return 0
+    end
+    return redis.error_reply('PCOL_DNE')
+end
+redis.call('DEL', KEYS[2])
+redis.call('DEL', KEYS[1])
+return 1
+"""
+
+# String indexes count characters, so they are mapped to UTF-8 byte offsets
+_LUA_STRING_SETITEM = be_redis_base._LUA_UTF8 + _LUA_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local len = utf8_len(val)
+local idx = tonumber(ARGV[1])
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+if idx < 0 then
+    idx = len + idx
+end
+local start = utf8_offset(val, idx)
+local stop = utf8_offset(val, idx + 1)
+if (stop - start) == string.len(ARGV[2]) then
+    return redis.call('SETRANGE', KEYS[2], start - 1, ARGV[2])
+end
+return redis.call('SET', KEYS[2], string.sub(val, 1, start - 1) .. ARGV[2] .. string.sub(val, stop))
+"""
+
+_LUA_STRING_INSERT = be_redis_base._LUA_UTF8 + _LUA_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local len = utf8_len(val)
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = math.max(len + idx, 0)
+end
+if idx >= len then
+    return redis.call('APPEND', KEYS[2], ARGV[2])
+end
+local pos = utf8_offset(val, idx)
+return redis.call('SETRANGE', KEYS[2], pos - 1, ARGV[2] .. string.sub(val, pos))
+"""
+
+_LUA_STRING_APPEND = _LUA_CHECK + """
+return redis.call('APPEND', KEYS[2], ARGV[1])
+"""
+
+_LUA_STRING_REVERSE = _LUA_CHECK + r"""
+local val = redis.call('GET', KEYS[2]) or ''
+local chars = {}
+for c in string.gmatch(val, '[%z\1-\127\194-\244][\128-\191]*') do
+    chars[#chars + 1] = c
+end
+local rev = {}
+for i = #chars, 1, -1 do
+    rev[#rev + 1] = chars[i]
+end
+return redis.call('SET', KEYS[2], table.concat(rev))
+"""
+
+_LUA_STRING_POP = be_redis_base._LUA_UTF8 + _LUA_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local len = utf8_len(val)
+local idx
+if ARGV[1] == '' then
+    idx = len - 1
+else
+    idx = tonumber(ARGV[1])
+end
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+if idx < 0 then
+    idx = len + idx
+end
+local start = utf8_offset(val, idx)
+local stop = utf8_offset(val, idx + 1)
+redis.call('SET', KEYS[2], string.sub(val, 1, start - 1) .. string.sub(val, stop))
+return string.sub(val, start, stop - 1)
+"""
+
+_LUA_STRING_REMOVE = _LUA_CHECK + """
+local val = redis.call('GET', KEYS[2]) or ''
+local idx = string.find(val, ARGV[1], 1, true)
+if not idx then
+    return redis.error_reply('PCOL_VALUE substring not found')
+end
+local rest = string.sub(val, idx + string.len(ARGV[1]))
+return redis.call('SET', KEYS[2], string.sub(val, 1, idx - 1) .. rest)
+"""
+
+_LUA_LIST_SETITEM = _LUA_CHECK + """
+local len = redis.call('LLEN', KEYS[2])
+local idx = tonumber(ARGV[1])
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+return redis.call('LSET', KEYS[2], idx, ARGV[2])
+"""
+
+_LUA_LIST_INSERT = _LUA_PUSH + _LUA_CHECK + """
+local len = redis.call('LLEN', KEYS[2])
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = math.max(len + idx, 0)
+end
+if idx >= len then
+    return redis.call('RPUSH', KEYS[2], ARGV[2])
+elseif idx == 0 then
+    return redis.call('LPUSH', KEYS[2], ARGV[2])
+end
+local tail = redis.call('LRANGE', KEYS[2], idx, -1)
+redis.call('LTRIM', KEYS[2], 0, idx - 1)
+redis.call('RPUSH', KEYS[2], ARGV[2])
+push('RPUSH', KEYS[2], tail, 1, #tail)
+return len + 1
+"""
+
+_LUA_LIST_EXTEND = _LUA_PUSH + _LUA_CHECK + """
+push('RPUSH', KEYS[2], ARGV, 1, #ARGV)
+return redis.call('LLEN', KEYS[2])
+"""
+
+_LUA_LIST_REVERSE = _LUA_PUSH + _LUA_CHECK + """
+local vals = redis.call('LRANGE', KEYS[2], 0, -1)
+local rev = {}
+for i = #vals, 1, -1 do
+    rev[#rev + 1] = vals[i]
+end
+redis.call('DEL', KEYS[2])
+push('RPUSH', KEYS[2], rev, 1, #rev)
+return #rev
+"""
+
+_LUA_LIST_POP = _LUA_PUSH + _LUA_CHECK + """
+local len = redis.call('LLEN', KEYS[2])
+local idx
+if ARGV[1] == '' then
+    idx = len - 1
+else
+    idx = tonumber(ARGV[1])
+end
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+if idx < 0 then
+    idx = len + idx
+end
+if idx == len - 1 then
+    return redis.call('RPOP', KEYS[2])
+elseif idx == 0 then
+    return redis.call('LPOP', KEYS[2])
+end
+local itm = redis.call('LINDEX', KEYS[2], idx)
+local tail = redis.call('LRANGE', KEYS[2], idx + 1, -1)
+redis.call('LTRIM', KEYS[2], 0, idx - 1)
+push('RPUSH', KEYS[2], tail, 1, #tail)
+return itm
+"""
+
+_LUA_LIST_REMOVE = _LUA_CHECK + """
+if redis.call('LREM', KEYS[2], 1, ARGV[1]) == 0 then
+    return redis.error_reply("PCOL_VALUE '" .. ARGV[1] .. "' is not in list")
+end
+return 1
+"""
+
+# Array scripts take packed items, so item size is the length of ARGV[2]
+_LUA_ARRAY_SETITEM = _LUA_CHECK + """
+local size = string.len(ARGV[2])
+local len = math.floor(redis.call('STRLEN', KEYS[2]) / size)
+local idx = tonumber(ARGV[1])
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX ' .. idx .. ' out of range')
+end
+if idx < 0 then
+    idx = len + idx
+end
+return redis.call('SETRANGE', KEYS[2], idx * size, ARGV[2])
+"""
+
+_LUA_ARRAY_INSERT = _LUA_CHECK + """
+local size = string.len(ARGV[2])
+local len = math.floor(redis.call('STRLEN', KEYS[2]) / size)
+local idx = tonumber(ARGV[1])
+if idx < 0 then
+    idx = math.max(len + idx, 0)
+end
+if idx >= len then
+    return redis.call('APPEND', KEYS[2], ARGV[2])
+end
+local tail = redis.call('GETRANGE', KEYS[2], idx * size, -1)
+return redis.call('SETRANGE', KEYS[2], idx * size, ARGV[2] .. tail)
+"""
+
+_LUA_ARRAY_APPEND = _LUA_CHECK + """
+return redis.call('APPEND', KEYS[2], ARGV[1])
+"""
+
+# Pop item ARGV[1] ('' for last) of size ARGV[2]
+_LUA_ARRAY_POP = _LUA_CHECK + """
+local size = tonumber(ARGV[2])
+local val = redis.call('GET', KEYS[2]) or ''
+local len = math.floor(string.len(val) / size)
+local idx = len - 1
+if ARGV[1] ~= '' then
+    idx = tonumber(ARGV[1])
+end
+if idx >= len or idx < -len then
+    return redis.error_reply('PCOL_INDEX pop index out of range')
+end
+if idx < 0 then
+    idx = len + idx
+end
+redis.call('SET', KEYS[2], string.sub(val, 1, idx * size) .. string.sub(val, (idx + 1) * size + 1))
+return string.sub(val, idx * size + 1, (idx + 1) * size)
+"""
+
+_LUA_SET_ADD = _LUA_CHECK + """
+return redis.call('SADD', KEYS[2], ARGV[1])
+"""
+
+_LUA_SET_DISCARD = _LUA_CHECK + """
+return redis.call('SREM', KEYS[2], ARGV[1])
+"""
+
+_LUA_SET_ADD_MANY = _LUA_CHECK + """
+local count = 0
+for i = 1, #ARGV, 1000 do
+    count = count + redis.call('SADD', KEYS[2], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+return count
+"""
+
+_LUA_SET_DISCARD_MANY = _LUA_CHECK + """
+local count = 0
+for i = 1, #ARGV, 1000 do
+    count = count + redis.call('SREM', KEYS[2], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+return count
+"""
+
+_LUA_SET_POP_N = """
+redis.replicate_commands()
+""" + _LUA_CHECK + """
+return redis.call('SPOP', KEYS[2], ARGV[1])
+"""
+
+_LUA_SET_REMOVE = _LUA_CHECK + """
+if redis.call('SREM', KEYS[2], ARGV[1]) == 0 then
+    return redis.error_reply('PCOL_KEY ' .. ARGV[1] .. ' not in set')
+end
+return 1
+"""
+
+_LUA_SET_POP = """
+redis.replicate_commands()
+""" + _LUA_CHECK + """
+local itm = redis.call('SPOP', KEYS[2])
+if not itm then
+    return redis.error_reply('PCOL_KEY Empty set, can not pop()')
+end
+return itm
+"""
+
+_LUA_SET_IOR = _LUA_PUSH + _LUA_CHECK + """
+push('SADD', KEYS[2], ARGV, 1, #ARGV)
+return redis.call('SCARD', KEYS[2])
+"""
+
+_LUA_SET_IAND = _LUA_PUSH + _LUA_CHECK + """
+local keep = {}
+for i = 1, #ARGV do
+    keep[ARGV[i]] = true
+end
+local drop = {}
+for _, itm in ipairs(redis.call('SMEMBERS', KEYS[2])) do
+    if not keep[itm] then
+        drop[#drop + 1] = itm
+    end
+end
+push('SREM', KEYS[2], drop, 1, #drop)
+return redis.call('SCARD', KEYS[2])
+"""
+
+_LUA_SET_IXOR = _LUA_CHECK + """
+for i = 1, #ARGV do
+    if redis.call('SISMEMBER', KEYS[2], ARGV[i]) == 1 then
+        redis.call('SREM', KEYS[2], ARGV[i])
+    else
+        redis.call('SADD', KEYS[2], ARGV[i])
+    end
+end
+return redis.call('SCARD', KEYS[2])
+"""
+
+_LUA_SET_ISUB = _LUA_PUSH + _LUA_CHECK + """
+push('SREM', KEYS[2], ARGV, 1, #ARGV)
+return redis.call('SCARD', KEYS[2])
+"""
+
+_LUA_CLEAR = _LUA_CHECK + """
+return redis.call('DEL', KEYS[2])
+"""
+
+_LUA_HASH_SETITEM = _LUA_CHECK + """
+return redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+"""
+
+_LUA_HASH_DELITEM = _LUA_CHECK + """
+if redis.call('HDEL', KEYS[2], ARGV[1]) == 0 then
+    return redis.error_reply("PCOL_KEY '" .. ARGV[1] .. "' not in dict")
+end
+return 1
+"""
+
+_LUA_HASH_POP = _LUA_CHECK + """
+local val = redis.call('HGET', KEYS[2], ARGV[1])
+if val then
+    redis.call('HDEL', KEYS[2], ARGV[1])
+end
+return val
+"""
+
+_LUA_HASH_POPITEM = """
+redis.replicate_commands()
+""" + _LUA_CHECK + """
+local cursor = '0'
+repeat
+    local res = redis.call('HSCAN', KEYS[2], cursor)
+    cursor = res[1]
+    if #res[2] > 0 then
+        redis.call('HDEL', KEYS[2], res[2][1])
+        return {res[2][1], res[2][2]}
+    end
+until cursor == '0'
+return redis.error_reply('PCOL_KEY popitem(): dictionary is empty')
+"""
+
+_LUA_HASH_UPDATE = _LUA_PUSH + _LUA_CHECK + """
+push('HMSET', KEYS[2], ARGV, 1, #ARGV)
+return redis.call('HLEN', KEYS[2])
+"""
+
+_LUA_HASH_DELETE_MANY = _LUA_CHECK + """
+local count = 0
+for i = 1, #ARGV, 1000 do
+    count = count + redis.call('HDEL', KEYS[2], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+return count
+"""
+
+_LUA_HASH_SETDEFAULT = _LUA_CHECK + """
+local val = redis.call('HGET', KEYS[2], ARGV[1])
+if val then
+    return val
+elseif #ARGV < 2 then
+    return redis.error_reply('PCOL_TYPE default must not be None')
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+return ARGV[2]
+"""
+
+_LUA_COUNTER_INCR = be_redis_atomic._LUA_HINCR + _LUA_CHECK + """
+return hincr(KEYS[2], 1)
+"""
+
+_LUA_INTEGER_INCRBY = _LUA_CHECK + """
+return redis.call('INCRBY', KEYS[2], ARGV[1])
+"""
+
+_LUA_INTEGER_DECRBY = _LUA_CHECK + """
+return redis.call('DECRBY', KEYS[2], ARGV[1])
+"""
+
+
+### Functions ###
+
+def _versioned(source):
+    """Wrap Mutating Script to Bump Object Version"""
+
+    if source not in _VERSIONED:
+        _VERSIONED[source] = _LUA_VERSIONED % (source,)
+    return _VERSIONED[source]
+
+def _discard(ret):
+    """Drop Reply of Calls that Return None"""
+    return None
+
+open_many = be_redis_base.open_many
+create_many = be_redis_base.create_many
+get_many = be_redis_base.get_many
+buffered = be_redis_atomic.buffered
+
+
+### Batch Objects ###
+
+class Deferred(object):
+    """Result of a Batched Call, Available Once the Batch Executes"""
+
+    def __init__(self, obj, parse=None):
+
+        # Call Parent
+        super(Deferred, self).__init__()
+
+        # Save Attrs
+        self._obj = obj
+        self._parse = parse
+        self._done = False
+        self._val = None
+        self._err = None
+
+    @property
+    def done(self):
+        return self._done
+
+    def _resolve(self, ret):
+        """Set Result from Raw Reply"""
+
+        try:
+            if isinstance(ret, redis.exceptions.ResponseError):
+                self._obj._raise_script_error(ret)
+            elif isinstance(ret, Exception):
+                raise ret
+            self._val = self._parse(ret) if self._parse else ret
+        except Exception as err:
+            self._err = err
+        self._done = True
+
+    def get(self):
+        """Get Result, Raising the Call's Exception if it Failed"""
+
+        if not self._done:
+            raise RuntimeError("batch has not been executed")
+        if self._err is not None:
+            raise self._err
+        return self._val
+
+class Batch(object):
+    """
+    Queue Script Calls Across Objects and Run Them as One MULTI/EXEC
+
+    While a batch is active on a thread, every scripted call made on that
+    thread through the batch's driver is queued and returns a Deferred.
+    Each script still checks that its object exists. The queue is run
+    when the context exits, when execute() is called, or after size calls
+    (if given). Reads that are not scripted, such as len(), item lookups,
+    iteration and index(), run at once and do not see queued writes.
+    Mutations that are not scripted, such as slice assignment, stored set
+    operators and edits of compressed strings, raise RuntimeError. A
+    failed call does not undo the others.
+    """
+
+    def __init__(self, driver, size=None):
+
+        # Check Args
+        if size is not None and size < 1:
+            raise ValueError("size must be positive")
+
+        # Call Parent
+        super(Batch, self).__init__()
+
+        # Save Attrs
+        self._driver = driver
+        self._size = size
+        self._pipe = driver.redis.pipeline(transaction=True)
+        self._calls = []
+
+    def __enter__(self):
+
+        if self._driver.batch is not None:
+            raise RuntimeError("a batch is already active on this thread")
+        self._driver.batch = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        self._driver.batch = None
+        if exc_type is None:
+            self.execute()
+        else:
+            self._pipe.reset()
+            self._calls = []
+        return False
+
+    def __len__(self):
+        """Get Number of Queued Calls"""
+        return len(self._calls)
+
+    def _queue(self, obj, script, keys, args, parse):
+        """Queue Script Call and Return its Deferred"""
+
+        script(keys=keys, args=args, client=self._pipe)
+        deferred = Deferred(obj, parse)
+        self._calls.append(deferred)
+        if self._size is not None and len(self._calls) >= self._size:
+            self.execute()
+        return deferred
+
+    def execute(self):
+        """Run Queued Calls, Raising the First Failure"""
+
+        # Swap Queue
+        calls = self._calls
+        self._calls = []
+        if not calls:
+            return []
+
+        # Execute and Resolve, Failing Every Call if the Pipeline Fails
+        try:
+            rets = self._pipe.execute(raise_on_error=False)
+        except Exception as err:
+            for deferred in calls:
+                deferred._resolve(err)
+            raise
+        finally:
+            for deferred in calls:
+                deferred._obj._invalidate()
+        for deferred, ret in zip(calls, rets):
+            deferred._resolve(ret)
+
+        # Raise First Failure
+        for deferred in calls:
+            deferred.get()
+
+        # Return Results
+        return calls
+
+
+### Base Objects ###
+
+class Persistent(be_redis_base.Persistent):
+
+    # Lua functions write(first), storing ARGV[first..], and read()
+    _LUA_WRITE = None
+    _LUA_READ = None
+
+    @abc.abstractmethod
+    def _flatten_val(self, val):
+        """Flatten encoded value to a list of script args"""
+        pass
+
+    @abc.abstractmethod
+    def _unflatten_val(self, val):
+        """Rebuild encoded value from a script reply"""
+        pass
+
+    def _run(self, source, *args, **kwargs):
+        """Run Lua Script Against Object Keys, Parsing the Reply"""
+
+        # Get Args
+        parse = kwargs.pop("parse", None)
+        readonly = kwargs.pop("readonly", False)
+        batched = kwargs.pop("batched", True)
+        if not readonly:
+            source = _versioned(source)
+        script = self.driver.script(source)
+        keys = [self._exists_key, self._redis_key]
+
+        # Queue in Active Batch
+        batch = self.driver.batch
+        if batched and batch is not None:
+            return batch._queue(self, script, keys, args, parse)
+
+        # Execute Now
+        try:
+            ret = script(keys=keys, args=args)
+        except redis.exceptions.ResponseError as err:
+            self._raise_script_error(err)
+        finally:
+            if not readonly:
+                self._invalidate()
+        return parse(ret) if parse else ret
+
+    def _run_many(self, source, arg_lists, parse=None):
+        """
+        Run Mutating Lua Script Once per Arg List, Returning the Parsed Replies
+
+        Several calls are sent as one MULTI/EXEC, or queued in the active
+        batch, so they still apply together.
+        """
+
+        # Single calls and batched calls need no pipeline of their own
+        if len(arg_lists) == 1 or self.driver.batch is not None:
+            return [self._run(source, *args, parse=parse) for args in arg_lists]
+
+        # Execute Now
+        script = self.driver.script(_versioned(source))
+        keys = [self._exists_key, self._redis_key]
+        pipe = self.driver.redis.pipeline(transaction=True)
+        for args in arg_lists:
+            script(keys=keys, args=args, client=pipe)
+        try:
+            rets = pipe.execute(raise_on_error=False)
+        finally:
+            self._invalidate()
+
+        # Raise First Failure
+        for ret in rets:
+            if isinstance(ret, redis.exceptions.ResponseError):
+                self._raise_script_error(ret)
+
+        # Return Replies
+        return [parse(ret) if parse else ret for ret in rets]
+
+    def _transact(self, func, *extra_watches, **kwargs):
+
+        # Transactions run at once, so only reads may bypass an active batch
+        if not kwargs.get("readonly", False) and self.driver.batch is not None:
+            raise RuntimeError("{} can not be batched; ".format(type(self).__name__) +
+                               "this operation is not scripted")
+
+        # Call Parent
+        return super(Persistent, self)._transact(func, *extra_watches, **kwargs)
+
+    def _raise_script_error(self, err):
+        """Translate Script Error Reply to Exception"""
+
+        code, _, msg = str(err).partition(" ")
+        if code == _ERR_DNE:
+            raise exceptions.ObjectDNE(self)
+        elif code == _ERR_EXISTS:
+            raise exceptions.ObjectExists(self)
+        elif code == _ERR_INDEX:
+            raise IndexError(msg)
+        elif code == _ERR_KEY:
+            raise KeyError(msg)
+        elif code == _ERR_VALUE:
+            raise ValueError(msg)
+        elif code == _ERR_TYPE:
+            raise TypeError(msg)
+        else:
+            raise err
+
+    def _init_val_raw(self, create=None, existing=None):
+
+        # Opening without a value or an existence check needs no round trip
+        if create is None and existing is None:
+            return
+
+        # Check Args
+        if existing is None:
+            arg_existing = ""
+        elif isinstance(existing, bool):
+            arg_existing = "1" if existing else "0"
+        else:
+            raise TypeError("existing must be bool or None")
+
+        # Build Args
+        if create is None:
+            args = [arg_existing, "0"]
+        else:
+            args = [arg_existing, "1"] + self._flatten_val(create)
+
+        # Execute Script
+        self._run(_LUA_PUSH + self._LUA_WRITE + _LUA_INIT, *args)
+
+    def _set_val_raw(self, val):
+
+        # Execute Script
+        return self._run(_LUA_PUSH + self._LUA_WRITE + _LUA_SET, *self._flatten_val(val),
+                         parse=_discard)
+
+    def _get_val_raw(self):
+
+        # Execute Script, Bypassing any Batch since Internal Reads Need the Value
+        return self._run(self._LUA_READ + _LUA_GET, parse=self._unflatten_val, readonly=True,
+                         batched=False)
+
+    def get_val(self):
+        """Get value as Python types"""
+
+        # Outside a batch, read through the cache
+        if self.driver.batch is None:
+            return super(Persistent, self).get_val()
+
+        # Parse via script so batched reads can defer decoding
+        def parse_get(ret):
+            return self._decode_val_obj(self._unflatten_val(ret))
+
+        # Queue Script
+        return self._run(self._LUA_READ + _LUA_GET, parse=parse_get, readonly=True)
+
+    def get_val_if_changed(self, version):
+        """
+        Get (version, value), with value None if still at version
+
+        Pass the version from an earlier call to skip transferring an
+        unchanged value. Versions restart from the server clock when an
+        object is recreated, so only compare them for equality.
+        """
+
+        # Parse Version and Value
+        def parse_get(ret):
+            if len(ret) < 2:
+                return int(ret[0]), None
+            return int(ret[0]), self._decode_val_obj(self._unflatten_val(ret[1]))
+
+        # Execute Script
+        arg = "" if version is None else version
+        return self._run(self._LUA_READ + _LUA_GET_IF_CHANGED, arg, parse=parse_get,
+                         readonly=True)
+
+    def exists(self):
+        """Check if Object Exists"""
+
+        return bool(self.driver.redis.exists(self._exists_key))
+
+    def rem(self, force=False):
+        """Delete Object"""
+
+        # Execute Script
+        self._run(_LUA_REM, "1" if force else "0")
+
+
+### Objects ###
+
+class String(Persistent, be_redis_atomic.String):
+
+    _LUA_WRITE = """
+local function write(first)
+    redis.call('SET', KEYS[2], ARGV[first])
+end
+"""
+
+    _LUA_READ = """
+local function read()
+    return redis.call('GET', KEYS[2])
+end
+"""
+
+    def _flatten_val(self, val):
+        return [val]
+
+    def _unflatten_val(self, val):
+        return val
+
+class MutableString(String, be_redis_atomic.MutableString):
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        # Slices and compressed strings use the transactional versions
+        if isinstance(idx, slice) or self._compressed:
+            return super(MutableString, self).__setitem__(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Execute Script
+        return self._run(_LUA_STRING_SETITEM, idx, out, parse=_discard)
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).insert(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Execute Script
+        return self._run(_LUA_STRING_INSERT, idx, out, parse=_discard)
+
+    def append(self, itm):
+        """Append Seq Item"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).append(itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Execute Script
+        return self._run(_LUA_STRING_APPEND, out, parse=_discard)
+
+    def reverse(self):
+        """Reverse Seq"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).reverse()
+
+        # Execute Script
+        return self._run(_LUA_STRING_REVERSE, parse=_discard)
+
+    def extend(self, seq):
+        """Append Seq with another Seq"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).extend(seq)
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
+
+        # Execute Script
+        if len(out):
+            return self._run(_LUA_STRING_APPEND, out, parse=_discard)
+        else:
+            pass
+
+    def pop(self, pop_idx=None):
+        """Pop Seq Item"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).pop(pop_idx)
+
+        # Execute Script
+        return self._run(_LUA_STRING_POP, "" if pop_idx is None else pop_idx,
+                         parse=self._decode_val_item)
+
+    def remove(self, itm):
+        """Remove itm from Seq"""
+
+        # Compressed strings use the transactional version
+        if self._compressed:
+            return super(MutableString, self).remove(itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+        if len(itm) != 1:
+            raise ValueError("'{:s}' must be a single charecter".format(itm))
+
+        # Execute Script
+        return self._run(_LUA_STRING_REMOVE, out, parse=_discard)
+
+    def clear(self):
+        """Clear Seq"""
+
+        # Execute Script
+        return self._set_val_raw(b"")
+
+class List(Persistent, be_redis_atomic.List):
+
+    _LUA_WRITE = """
+local function write(first)
+    redis.call('DEL', KEYS[2])
+    push('RPUSH', KEYS[2], ARGV, first, #ARGV)
+end
+"""
+
+    _LUA_READ = """
+local function read()
+    return redis.call('LRANGE', KEYS[2], 0, -1)
+end
+"""
+
+    def _flatten_val(self, val):
+        return list(val)
+
+    def _unflatten_val(self, val):
+        return list(val)
+
+class MutableList(List, be_redis_atomic.MutableList):
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        # Slices use the transactional splice
+        if isinstance(idx, slice):
+            return super(MutableList, self).__setitem__(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_LIST_SETITEM, idx, out, parse=_discard)
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_LIST_INSERT, idx, out, parse=_discard)
+
+    def append(self, itm):
+        """Append Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_LIST_EXTEND, out, parse=_discard)
+
+    def reverse(self):
+        """Reverse Seq"""
+
+        # Execute Script
+        return self._run(_LUA_LIST_REVERSE, parse=_discard)
+
+    def extend(self, seq):
+        """Append Seq with another Seq"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
+
+        # Execute Script
+        if len(out):
+            return self._run(_LUA_LIST_EXTEND, *out, parse=_discard)
+        else:
+            pass
+
+    def pop(self, pop_idx=None):
+        """Pop Seq Item"""
+
+        # Execute Script
+        return self._run(_LUA_LIST_POP, "" if pop_idx is None else pop_idx,
+                         parse=self._decode_val_item)
+
+    def remove(self, itm):
+        """Remove itm from Seq"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_LIST_REMOVE, out, parse=_discard)
+
+    def clear(self):
+        """Clear Seq"""
+
+        # Execute Script
+        return self._set_val_raw([])
+
+class Array(Persistent, be_redis_base.Array):
+
+    _LUA_WRITE = String._LUA_WRITE
+
+    _LUA_READ = String._LUA_READ
+
+    def _flatten_val(self, val):
+        return [val]
+
+    def _unflatten_val(self, val):
+        return val
+
+class IntArray(Array, be_redis_atomic.IntArray):
+    pass
+
+class FloatArray(Array, be_redis_atomic.FloatArray):
+    pass
+
+class MutableArray(Array, be_redis_atomic.MutableArray):
+
+    def __setitem__(self, idx, itm):
+        """Set Seq Item"""
+
+        # Slices use the transactional version
+        if isinstance(idx, slice):
+            return super(MutableArray, self).__setitem__(idx, itm)
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_ARRAY_SETITEM, idx, out, parse=_discard)
+
+    def insert(self, idx, itm):
+        """Insert Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_ARRAY_INSERT, idx, out, parse=_discard)
+
+    def append(self, itm):
+        """Append Seq Item"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_ARRAY_APPEND, out, parse=_discard)
+
+    def extend(self, seq):
+        """Append Seq with another Seq"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(seq)
+
+        # Execute Script
+        if len(out):
+            return self._run(_LUA_ARRAY_APPEND, out, parse=_discard)
+        else:
+            pass
+
+    def pop(self, pop_idx=None):
+        """Pop Seq Item"""
+
+        # Execute Script
+        return self._run(_LUA_ARRAY_POP, "" if pop_idx is None else pop_idx, self._ITEMSIZE,
+                         parse=self._decode_val_item)
+
+    def clear(self):
+        """Clear Seq"""
+
+        # Execute Script
+        return self._set_val_raw(b"")
+
+class MutableIntArray(IntArray, MutableArray):
+    pass
+
+class MutableFloatArray(FloatArray, MutableArray):
+    pass
+
+class Set(Persistent, be_redis_atomic.Set):
+
+    _LUA_WRITE = """
+local function write(first)
+    redis.call('DEL', KEYS[2])
+    push('SADD', KEYS[2], ARGV, first, #ARGV)
+end
+"""
+
+    _LUA_READ = """
+local function read()
+    return redis.call('SMEMBERS', KEYS[2])
+end
+"""
+
+    def _flatten_val(self, val):
+        return list(val)
+
+    def _unflatten_val(self, val):
+        return set(val)
+
+class MutableSet(Set, be_redis_atomic.MutableSet):
+
+    def add(self, itm):
+        """Add Item to Set"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_SET_ADD, out, parse=_discard)
+
+    def discard(self, itm):
+        """Remove Item from Set if Present"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_SET_DISCARD, out, parse=_discard)
+
+    def add_many(self, itms):
+        """Add Items to Set, Returning Count Added"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(itms)
+
+        # Execute Script
+        return self._run(_LUA_SET_ADD_MANY, *out)
+
+    def discard_many(self, itms):
+        """Remove Items from Set if Present, Returning Count Removed"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(itms)
+
+        # Execute Script
+        return self._run(_LUA_SET_DISCARD_MANY, *out)
+
+    def pop_n(self, count):
+        """Pop up to count Items from Set"""
+
+        # Validate Input
+        if count < 0:
+            raise ValueError("count must not be negative")
+
+        # Execute Script
+        return self._run(_LUA_SET_POP_N, count, parse=self._decode_val_obj)
+
+    def clear(self):
+        """Clear Set"""
+
+        # Execute Script
+        return self._run(_LUA_CLEAR, parse=_discard)
+
+    def pop(self):
+        """Pop item from Set"""
+
+        # Execute Script
+        return self._run(_LUA_SET_POP, parse=self._decode_val_item)
+
+    def remove(self, itm):
+        """Remove itm from Set"""
+
+        # Validate and Encode Input
+        out = self._encode_val_item(itm)
+
+        # Execute Script
+        return self._run(_LUA_SET_REMOVE, out, parse=_discard)
+
+    def _combine(self, source, other):
+        """Combine Set with other Set via Script"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(other)
+
+        # Execute Script
+        self._run(source, *out)
+
+        # Return
+        return self
+
+    def __ior__(self, other):
+        """Unary or"""
+        if self._is_stored_set(other):
+            return super(MutableSet, self).__ior__(other)
+        return self._combine(_LUA_SET_IOR, other)
+
+    def __iand__(self, other):
+        """Unary and"""
+        if self._is_stored_set(other):
+            return super(MutableSet, self).__iand__(other)
+        return self._combine(_LUA_SET_IAND, other)
+
+    def __ixor__(self, other):
+        """Unary xor"""
+        if self._is_stored_set(other):
+            return super(MutableSet, self).__ixor__(other)
+        return self._combine(_LUA_SET_IXOR, other)
+
+    def __isub__(self, other):
+        """Unary subtract"""
+        if self._is_stored_set(other):
+            return super(MutableSet, self).__isub__(other)
+        return self._combine(_LUA_SET_ISUB, other)
+
+class Dictionary(Persistent, be_redis_atomic.Dictionary):
+
+    _LUA_WRITE = """
+local function write(first)
+    redis.call('DEL', KEYS[2])
+    push('HMSET', KEYS[2], ARGV, first, #ARGV)
+end
+"""
+
+    _LUA_READ = """
+local function read()
+    return redis.call('HGETALL', KEYS[2])
+end
+"""
+
+    def _flatten_val(self, val):
+
+        flat = list()
+        for key, itm in viewitems(val):
+            flat.append(key)
+            flat.append(itm)
+        return flat
+
+    def _unflatten_val(self, val):
+        return dict(zip(val[::2], val[1::2]))
+
+class MutableDictionary(Dictionary, be_redis_atomic.MutableDictionary):
+
+    def __setitem__(self, key, val):
+        """Set Mapping Item"""
+
+        # Validate and Encode Input
+        key_out = self._encode_val_item(key)
+        val_out = self._encode_val_mapped(val)
+
+        # Execute Script
+        return self._run(_LUA_HASH_SETITEM, key_out, val_out, parse=_discard)
+
+    def __delitem__(self, key):
+        """Delete Mapping Item"""
+
+        # Validate and Encode Input
+        key_out = self._encode_val_item(key)
+
+        # Execute Script
+        return self._run(_LUA_HASH_DELITEM, key_out, parse=_discard)
+
+    def pop(self, *args):
+        """Pop Specified Item or Default"""
+
+        # Validate input:
+        if (len(args) < 1) or (len(args) > 2):
+            raise TypeError("pop() requires either 1 or 2 args: {}".format(args))
+        key = args[0]
+        key_out = self._encode_val_item(key)
+
+        # Process Return
+        def parse_pop(ret):
+            if ret is None:
+                if len(args) > 1:
+                    return args[1]
+                else:
+                    raise KeyError("'{}' not in dict".format(key))
+            else:
+                return self._decode_val_mapped(ret)
+
+        # Execute Script
+        return self._run(_LUA_HASH_POP, key_out, parse=parse_pop)
+
+    def popitem(self):
+        """Pop Arbitrary Item"""
+
+        # Process Return
+        def parse_popitem(ret):
+            key_ret = self._decode_val_item(ret[0])
+            val_ret = self._decode_val_mapped(ret[1])
+            return (key_ret, val_ret)
+
+        # Execute Script
+        return self._run(_LUA_HASH_POPITEM, parse=parse_popitem)
+
+    def clear(self):
+        """Clear Dictionary"""
+
+        # Execute Script
+        return self._run(_LUA_CLEAR, parse=_discard)
+
+    def update(self, *args, **kwargs):
+        """Update Dictionary"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(dict(*args, **kwargs))
+
+        # Execute Script
+        self._run(_LUA_HASH_UPDATE, *self._flatten_val(out))
+
+        # Return
+        return self
+
+    def delete_many(self, keys):
+        """Delete Keys if Present, Returning Count Deleted"""
+
+        # Validate and Encode Input
+        out = self._encode_val_many(list(keys))
+
+        # Execute Script
+        return self._run(_LUA_HASH_DELETE_MANY, *out)
+
+    def setdefault(self, key, default=None):
+        """return Key or Set to Default"""
+
+        # Validate and Encode Input
+        args = [self._encode_val_item(key)]
+        if default is not None:
+            args.append(self._encode_val_mapped(default))
+
+        # Execute Script
+        return self._run(_LUA_HASH_SETDEFAULT, *args, parse=self._decode_val_mapped)
+
+class Counter(Dictionary, be_redis_atomic.Counter):
+    pass
+
+class MutableCounter(Counter, be_redis_atomic.MutableCounter, MutableDictionary):
+
+    def _add(self, counts, parse=_discard):
+        """Add Counts to Items"""
+
+        # Validate and Encode Input
+        out = self._encode_val_obj(counts)
+
+        # Execute Script per Chunk, Checking Existence Even if Empty
+        chunks = be_redis_atomic._chunks(viewitems(out)) or [[]]
+        arg_lists = [self._flatten_val(dict(chunk)) for chunk in chunks]
+        return self._run_many(_LUA_COUNTER_INCR, arg_lists, parse=parse)[-1]
+
+    def incr(self, key, amount=1):
+        """Add amount to Count of key, Returning the New Count"""
+
+        # Process Return
+        def parse_incr(ret):
+            return self._decode_val_mapped(ret[0])
+
+        # Execute Script
+        return self._add({key: amount}, parse=parse_incr)
+
+class Integer(Persistent, be_redis_atomic.Integer):
+
+    _LUA_WRITE = String._LUA_WRITE
+
+    _LUA_READ = String._LUA_READ
+
+    def _flatten_val(self, val):
+        return [val]
+
+    def _unflatten_val(self, val):
+        return val
+
+class AtomicInteger(Integer, be_redis_atomic.AtomicInteger):
+
+    def incr(self, amount=1):
+        """Add amount, Returning the New Value"""
+
+        # Validate Input
+        self._encode_val_item(amount, test=True)
+
+        # Execute Script
+        return self._run(_LUA_INTEGER_INCRBY, amount)
+
+    def decr(self, amount=1):
+        """Subtract amount, Returning the New Value"""
+
+        # Validate Input
+        self._encode_val_item(amount, test=True)
+
+        # Execute Script
+        return self._run(_LUA_INTEGER_DECRBY, amount)
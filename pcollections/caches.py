@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Package
+
+
+### Pylint ###
+
+
+### Imports ###
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from future.utils import native_str
+from builtins import *
+
+import collections
+import copy
+import threading
+
+import redis
+
+from . import codecs
+from . import constants
+from . import drivers
+from . import be_redis_base
+
+
+### Constants ###
+
+_MISS = object()
+_EVENTS = "KA"
+_EVENT_CLASSES = "g$lshxe"
+_LISTEN_TIMEOUT = 1.0
+_RETRY_DELAY = 1.0
+
+
+### Functions ###
+
+def _copy(val, tag):
+    """Copy Value, Sharing its Items Only if tag's Codec Decodes them Immutable"""
+
+    if isinstance(tag, codecs.Codec) and tag.immutable:
+        return copy.copy(val)
+    return copy.deepcopy(val)
+
+
+### Classes ###
+
+class RedisCache(object):
+    """
+    Bounded LRU Cache of Decoded Values, Invalidated via Keyspace Notifications
+
+    A listener thread subscribes to keyspace events for the driver's
+    database and drops the entry of every key that changes. Writes made
+    through objects using this cache drop their entry at once, so a thread
+    always reads its own writes; changes made elsewhere are seen once
+    their event arrives. get_val(), len(), membership tests and item
+    lookups are served from the cache. Nothing is served while the
+    subscription is down, and the cache is cleared whenever it is
+    (re)established, since events may have been missed. FLUSHDB and
+    FLUSHALL publish no events.
+
+    The server must publish keyspace events for all key classes ('KA').
+    Pass configure=True to add them via CONFIG SET. RESP3 client tracking
+    is not used, since redis-py does not speak RESP3.
+    """
+
+    def __init__(self, driver, size=1024, configure=False, timeout=5.0):
+
+        # Check Args
+        if not isinstance(driver, drivers.RedisDriver):
+            raise TypeError("driver must be instance of RedisDriver")
+        if size < 1:
+            raise ValueError("size must be positive")
+
+        # Call Parent
+        super(RedisCache, self).__init__()
+
+        # Save Attrs
+        self._driver = driver
+        self._size = size
+        db = driver.redis.connection_pool.connection_kwargs.get("db", 0)
+        self._channel = "__keyspace@{:d}__:".format(db)
+        self._marker = "{:s}{:s}".format(be_redis_base._PREFIX_EXISTS, be_redis_base._SEP_FIELD)
+
+        # Setup State
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._reads = {}
+        self._dropped = {}
+        self._gen = 0
+        self._cleared = 0
+        self._active = False
+        self._hits = 0
+        self._misses = 0
+
+        # Check Server
+        self._check_events(configure)
+
+        # Start Listener
+        self._ready = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._listen, name="pcollections-cache")
+        self._thread.daemon = True
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            self.close()
+            raise redis.exceptions.ConnectionError("keyspace subscription timed out")
+
+    ## Properties ##
+
+    @property
+    def driver(self):
+        return self._driver
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def active(self):
+        return self._active
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    ## Methods ##
+
+    def __len__(self):
+        """Get Number of Cached Values"""
+        return len(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def lookup(self, key, tag=None):
+        """Return (hit, val) for key, with val a Copy"""
+
+        with self._lock:
+            val = self._get(key, tag)
+        if val is _MISS:
+            return False, None
+        return True, _copy(val, tag)
+
+    def fetch(self, key, read, tag=None):
+        """
+        Return Copy of Value for key, Calling read() on a Miss
+
+        Values are stored with tag, and only returned for the same tag, so
+        handles that decode a key differently do not share values.
+        """
+
+        # Check Cache, Noting the Read so Racing Invalidations are Kept
+        with self._lock:
+            val = self._get(key, tag)
+            if val is not _MISS:
+                return _copy(val, tag)
+            start = self._gen
+            self._reads[key] = self._reads.get(key, 0) + 1
+
+        try:
+
+            # Read Value
+            val = read()
+
+            # Store unless Invalidated since the Read Began
+            with self._lock:
+                if (self._active and (self._cleared <= start) and
+                    (self._dropped.get(key, 0) <= start)):
+                    self._entries.pop(key, None)
+                    self._entries[key] = (tag, _copy(val, tag))
+                    while len(self._entries) > self._size:
+                        self._entries.popitem(last=False)
+
+            # Return Value
+            return val
+
+        finally:
+
+            # Finish Read
+            with self._lock:
+                cnt = self._reads[key] - 1
+                if cnt:
+                    self._reads[key] = cnt
+                else:
+                    del(self._reads[key])
+                    self._dropped.pop(key, None)
+
+    def invalidate(self, key):
+        """Drop Cached Value of key"""
+
+        with self._lock:
+            self._gen += 1
+            self._entries.pop(key, None)
+            if key in self._reads:
+                self._dropped[key] = self._gen
+
+    def clear(self):
+        """Drop All Cached Values"""
+
+        with self._lock:
+            self._gen += 1
+            self._cleared = self._gen
+            self._entries.clear()
+
+    def close(self):
+        """Stop Listener and Drop All Cached Values"""
+
+        self._closed.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._set_active(False)
+
+    ## Internal ##
+
+    def _get(self, key, tag):
+        """Get Entry Value for tag and Mark it Recently Used (Locked)"""
+
+        if not self._active:
+            self._misses += 1
+            return _MISS
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self._misses += 1
+            return _MISS
+        self._entries[key] = entry
+        if entry[0] != tag:
+            self._misses += 1
+            return _MISS
+        self._hits += 1
+        return entry[1]
+
+    def _set_active(self, active):
+        """Clear Cache and Start or Stop Serving"""
+
+        with self._lock:
+            self._gen += 1
+            self._cleared = self._gen
+            self._entries.clear()
+            self._active = active
+
+    def _check_events(self, configure):
+        """Confirm (or Enable) Keyspace Events on Server"""
+
+        # Get Flags, Trusting the Operator if CONFIG is Unavailable
+        try:
+            ret = self._driver.redis.config_get("notify-keyspace-events")
+        except redis.exceptions.ResponseError:
+            return
+        flags = ret.get("notify-keyspace-events", "")
+        if isinstance(flags, bytes):
+            flags = flags.decode(constants.ENCODING)
+
+        # Check Flags
+        if ("K" in flags) and (("A" in flags) or set(_EVENT_CLASSES).issubset(flags)):
+            return
+        if not configure:
+            msg = "server must publish keyspace events ('{:s}'), ".format(_EVENTS)
+            msg += "got '{:s}'; pass configure=True to enable them".format(flags)
+            raise ValueError(msg)
+
+        # Add Flags
+        flags = "".join(sorted(set(flags) | set(_EVENTS)))
+        self._driver.redis.config_set("notify-keyspace-events", flags)
+
+    def _listen(self):
+        """Drop Entries of Changed Keys Until Closed (Thread)"""
+
+        while not self._closed.is_set():
+            pubsub = self._driver.redis.pubsub()
+            try:
+                pubsub.psubscribe("{:s}*".format(self._channel))
+                while not self._closed.is_set():
+                    msg = pubsub.get_message(timeout=_LISTEN_TIMEOUT)
+                    if msg is None:
+                        continue
+                    elif msg["type"] == "psubscribe":
+                        # Reconnects resubscribe, so events may have been missed
+                        self._set_active(True)
+                        self._ready.set()
+                    elif msg["type"] == "pmessage":
+                        self._on_event(msg["channel"])
+            except redis.exceptions.RedisError:
+                pass
+            finally:
+                self._set_active(False)
+                pubsub.close()
+            self._closed.wait(_RETRY_DELAY)
+
+    def _on_event(self, channel):
+        """Drop Entry of Key Named by Event Channel"""
+
+        if isinstance(channel, bytes):
+            channel = channel.decode(constants.ENCODING, "replace")
+        key = channel[len(self._channel):]
+        if key.startswith(self._marker):
+            key = key[len(self._marker):]
+        self.invalidate(key)
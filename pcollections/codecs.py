@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Package
+
+
+### Pylint ###
+
+
+### Imports ###
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from future.utils import native_str
+from future.utils import raise_from
+from future.utils import with_metaclass
+from builtins import *
+
+import abc
+import json
+import pickle
+import zlib
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from . import constants
+
+
+### Constants ###
+
+_HEADER_ZLIB = b"\xff"
+_HEADER_ESCAPE = b"\xfe"
+
+
+### Abstract Classes ###
+
+class Codec(with_metaclass(abc.ABCMeta, object)):
+    """
+    Converts Items to and from the Bytes Stored in the Backend
+
+    Encodings must be canonical (equal items give equal bytes), since set
+    members, dict keys and membership tests compare stored bytes. Set
+    members and dict keys must also decode to hashable items.
+    """
+
+    _IMMUTABLE = False
+
+    @property
+    def immutable(self):
+        """Decoded Items are Immutable, so Copies of Values may Share them"""
+        return self._IMMUTABLE
+
+    @abc.abstractmethod
+    def encode(self, item):
+        """Encode Item as Bytes, Raising TypeError if Unsupported"""
+        pass
+
+    @abc.abstractmethod
+    def decode(self, raw):
+        """Decode Bytes as Item"""
+        pass
+
+    def check(self, item):
+        """Raise TypeError if Item can not be Encoded"""
+        self.encode(item)
+
+    def encode_many(self, items):
+        """Encode List of Items"""
+        encode = self.encode
+        return [encode(item) for item in items]
+
+    def decode_many(self, raws):
+        """Decode List of Bytes"""
+        decode = self.decode
+        return [decode(raw) for raw in raws]
+
+    def check_many(self, items):
+        """Raise TypeError if any Item can not be Encoded"""
+        check = self.check
+        for item in items:
+            check(item)
+
+    def __eq__(self, other):
+        """Codecs of the Same Type and Settings Encode Alike"""
+        return (type(other) is type(self)) and (vars(other) == vars(self))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(type(self))
+
+
+### Classes ###
+
+class Utf8Codec(Codec):
+    """Text Stored as UTF-8, Bytes Passed Through (Default)"""
+
+    _IMMUTABLE = True
+
+    def encode(self, item):
+        if isinstance(item, bytes):
+            return item
+        elif isinstance(item, str) or isinstance(item, native_str):
+            return bytes(item.encode(constants.ENCODING))
+        else:
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+    def decode(self, raw):
+        if isinstance(raw, bytes):
+            return str(raw.decode(constants.ENCODING))
+        elif isinstance(raw, str) or isinstance(raw, native_str):
+            return raw
+        else:
+            raise TypeError("Decoding '{}' not supported".format(type(raw)))
+
+    def check(self, item):
+        if not (isinstance(item, bytes) or isinstance(item, str) or
+                isinstance(item, native_str)):
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+class RawCodec(Codec):
+    """
+    Bytes Stored and Returned As-Is, With No Decode Step (Raw Mode)
+
+    For binary payloads such as images or protobufs. Bytearrays and
+    memoryviews are copied to bytes on encode, since the client only
+    sends bytes. Text is rejected rather than implicitly encoded.
+    """
+
+    _IMMUTABLE = True
+
+    def encode(self, item):
+        if isinstance(item, bytes):
+            return item
+        elif isinstance(item, memoryview):
+            return bytes(item.tobytes())
+        elif isinstance(item, bytearray):
+            return bytes(item)
+        else:
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+    def decode(self, raw):
+        return raw
+
+    def check(self, item):
+        if not isinstance(item, (bytes, bytearray, memoryview)):
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+    def decode_many(self, raws):
+        return raws if isinstance(raws, list) else list(raws)
+
+class JsonCodec(Codec):
+    """
+    Items Stored as Compact JSON with Sorted Keys
+
+    Tuples decode as lists. Equal numbers of different types (1 and 1.0)
+    encode differently.
+    """
+
+    def encode(self, item):
+        try:
+            out = json.dumps(item, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except ValueError as err:
+            raise_from(TypeError(str(err)), err)
+        return bytes(str(out).encode(constants.ENCODING))
+
+    def decode(self, raw):
+        if isinstance(raw, bytes):
+            raw = raw.decode(constants.ENCODING)
+        return json.loads(raw)
+
+class PickleCodec(Codec):
+    """
+    Items Stored as Pickles
+
+    Only decode data from trusted writers. Pickles of equal containers
+    are not always equal, so keep set members and dict keys simple.
+    """
+
+    def __init__(self, protocol=2):
+
+        # Call Parent
+        super(PickleCodec, self).__init__()
+
+        # Save Attrs
+        self._protocol = protocol
+
+    def encode(self, item):
+        try:
+            return bytes(pickle.dumps(item, self._protocol))
+        except (pickle.PicklingError, AttributeError) as err:
+            raise_from(TypeError(str(err)), err)
+
+    def decode(self, raw):
+        return pickle.loads(bytes(raw))
+
+class MsgpackCodec(Codec):
+    """
+    Items Stored as MessagePack (Requires msgpack)
+
+    Maps keep insertion order, so keep set members and dict keys simple.
+    Arrays decode as lists.
+    """
+
+    def __init__(self):
+
+        # Check Dependency
+        if msgpack is None:
+            raise ImportError("MsgpackCodec requires the msgpack package")
+
+        # Call Parent
+        super(MsgpackCodec, self).__init__()
+
+    def encode(self, item):
+        try:
+            return bytes(msgpack.packb(item, use_bin_type=True))
+        except ValueError as err:
+            raise_from(TypeError(str(err)), err)
+
+    def decode(self, raw):
+        return msgpack.unpackb(bytes(raw), raw=False)
+
+class IntCodec(Codec):
+    """Integers Stored as Decimal Text (Compatible with INCRBY)"""
+
+    _IMMUTABLE = True
+
+    def encode(self, item):
+        self.check(item)
+        return bytes(str(item).encode(constants.ENCODING))
+
+    def decode(self, raw):
+        return int(raw)
+
+    def check(self, item):
+        if isinstance(item, bool) or not isinstance(item, int):
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+class FloatCodec(Codec):
+    """Floats Stored as Shortest Round-Trip Text (Compatible with INCRBYFLOAT)"""
+
+    _IMMUTABLE = True
+
+    def encode(self, item):
+        self.check(item)
+        return bytes(repr(float(item)).encode(constants.ENCODING))
+
+    def decode(self, raw):
+        return float(raw)
+
+    def check(self, item):
+        if isinstance(item, bool) or not isinstance(item, (int, float)):
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+class NumberCodec(Codec):
+    """
+    Integers and Floats Stored as Text (Compatible with INCRBY and INCRBYFLOAT)
+
+    Values that parse as integers decode as ints, all others as floats,
+    so integral results of float increments read back as ints.
+    """
+
+    _IMMUTABLE = True
+
+    def encode(self, item):
+        self.check(item)
+        if isinstance(item, int):
+            return bytes(str(item).encode(constants.ENCODING))
+        return bytes(repr(float(item)).encode(constants.ENCODING))
+
+    def decode(self, raw):
+        try:
+            return int(raw)
+        except ValueError:
+            return float(raw)
+
+    def check(self, item):
+        if isinstance(item, bool) or not isinstance(item, (int, float)):
+            raise TypeError("Encoding type '{}' not supported".format(type(item)))
+
+class ZlibCodec(Codec):
+    """
+    Wraps a Codec, Compressing Encodings of at Least threshold Bytes
+
+    Compressed values start with a 0xFF header byte. Uncompressed values
+    that start with 0xFF or 0xFE get a 0xFE header, so values written
+    with and without compression read back alike. UTF-8 text never starts
+    with either byte, so existing text values need no migration. Values
+    that do not shrink are stored uncompressed.
+    """
+
+    def __init__(self, codec=None, threshold=1024, level=6):
+
+        # Check Args
+        if codec is None:
+            codec = Utf8Codec()
+        if not isinstance(codec, Codec):
+            raise TypeError("codec must be instance of Codec")
+        if threshold < 0:
+            raise ValueError("threshold must not be negative")
+        if not (-1 <= level <= 9):
+            raise ValueError("level must be between -1 and 9")
+
+        # Call Parent
+        super(ZlibCodec, self).__init__()
+
+        # Save Attrs
+        self._codec = codec
+        self._threshold = threshold
+        self._level = level
+
+    @property
+    def codec(self):
+        return self._codec
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @property
+    def level(self):
+        return self._level
+
+    @property
+    def immutable(self):
+        return self._codec.immutable
+
+    def encode(self, item):
+        raw = self._codec.encode(item)
+        if len(raw) >= self._threshold:
+            packed = zlib.compress(raw, self._level)
+            if (len(packed) + 1) < len(raw):
+                return _HEADER_ZLIB + packed
+        if raw[:1] in (_HEADER_ZLIB, _HEADER_ESCAPE):
+            return _HEADER_ESCAPE + raw
+        return raw
+
+    def decode(self, raw):
+        head = raw[:1]
+        if head == _HEADER_ZLIB:
+            return self._codec.decode(zlib.decompress(raw[1:]))
+        elif head == _HEADER_ESCAPE:
+            return self._codec.decode(raw[1:])
+        else:
+            return self._codec.decode(raw)
+
+    def check(self, item):
+        self._codec.check(item)
+
+
+### Instances ###
+
+UTF8 = Utf8Codec()
+RAW = RawCodec()
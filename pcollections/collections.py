@@ -23,6 +23,19 @@ from future.utils import python_2_unicode_compatible
 from builtins import *
 
 from . import backends
+from . import caches
+from . import codecs
+
+
+### Constants ###
+
+_OBJ_TYPES = ("String", "MutableString", "List", "MutableList",
+              "Set", "MutableSet", "Dictionary", "MutableDictionary",
+              "IntArray", "MutableIntArray", "FloatArray", "MutableFloatArray",
+              "Counter", "MutableCounter", "Integer", "AtomicInteger")
+_STR_TYPES = ("String", "MutableString")
+_ARRAY_TYPES = ("IntArray", "MutableIntArray", "FloatArray", "MutableFloatArray")
+_INT_TYPES = ("Integer", "AtomicInteger")
 
 
 ### Classes ###
@@ -31,17 +44,26 @@ class PCollections(object):
 
     ## Methods ##
 
-    def __init__(self, backend):
+    def __init__(self, backend, cache=None, codec=None):
 
         # Check Args
         if not isinstance(backend, backends.Backend):
             raise TypeError("backend must be instance of Backend")
+        if cache is not None:
+            if not isinstance(cache, caches.RedisCache):
+                raise TypeError("cache must be instance of RedisCache")
+            if cache.driver is not backend.driver:
+                raise ValueError("cache must use the backend's driver")
+        if not (codec is None or isinstance(codec, codecs.Codec)):
+            raise TypeError("codec must be instance of Codec")
 
         # Call Parent
         super().__init__()
 
         # Save Attrs
         self._backend = backend
+        self._cache = cache
+        self._codec = codec
 
     ## Properties ##
 
@@ -49,32 +71,122 @@ class PCollections(object):
     def backend(self):
         return self._backend
 
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def codec(self):
+        return self._codec
+
+    def _obj_kwargs(self, obj_type, codec=None):
+        """Get Constructor Args, Leaving Strings UTF-8 and Numbers Unencoded Unless Given a Codec"""
+        kwargs = {"cache": self._cache}
+        if obj_type not in (_STR_TYPES + _ARRAY_TYPES + _INT_TYPES):
+            kwargs["codec"] = codec or self._codec
+        elif codec is not None:
+            kwargs["codec"] = codec
+        return kwargs
+
+    ## Batches ##
+
+    def batch(self, size=None):
+        return self.backend.batch(size=size)
+
+    ## Buffers ##
+
+    def buffered(self, obj, interval=1.0, size=1000):
+        return self.backend.buffered(obj, interval=interval, size=size)
+
+    ## Bulk ##
+
+    def _obj_cls(self, obj_type):
+        if obj_type not in _OBJ_TYPES:
+            raise ValueError("obj_type must be one of {}".format(", ".join(_OBJ_TYPES)))
+        return getattr(self.backend.module, obj_type)
+
+    def open_many(self, obj_type, keys, codec=None):
+        return self.backend.module.open_many(self._obj_cls(obj_type),
+                                             self.backend.driver, keys,
+                                             **self._obj_kwargs(obj_type, codec))
+    def create_many(self, obj_type, vals, codec=None):
+        return self.backend.module.create_many(self._obj_cls(obj_type),
+                                               self.backend.driver, vals,
+                                               **self._obj_kwargs(obj_type, codec))
+    def get_many(self, objs):
+        return self.backend.module.get_many(self.backend.driver, objs)
+
     ## Objects ##
 
-    def String(self, key, create=None, existing=None):
+    def String(self, key, create=None, existing=None, codec=None):
         return self.backend.module.String(self.backend.driver, key,
-                                          create=create, existing=existing)
-    def MutableString(self, key, create=None, existing=None):
+                                          create=create, existing=existing,
+                                          **self._obj_kwargs("String", codec))
+    def MutableString(self, key, create=None, existing=None, codec=None):
         return self.backend.module.MutableString(self.backend.driver, key,
-                                                 create=create, existing=existing)
+                                                 create=create, existing=existing,
+                                                 **self._obj_kwargs("MutableString", codec))
 
-    def List(self, key, create=None, existing=None):
+    def List(self, key, create=None, existing=None, codec=None):
         return self.backend.module.List(self.backend.driver, key,
-                                        create=create, existing=existing)
-    def MutableList(self, key, create=None, existing=None):
+                                        create=create, existing=existing,
+                                        **self._obj_kwargs("List", codec))
+    def MutableList(self, key, create=None, existing=None, codec=None):
         return self.backend.module.MutableList(self.backend.driver, key,
-                                               create=create, existing=existing)
+                                               create=create, existing=existing,
+                                               **self._obj_kwargs("MutableList", codec))
 
-    def Set(self, key, create=None, existing=None):
+    def Set(self, key, create=None, existing=None, codec=None):
         return self.backend.module.Set(self.backend.driver, key,
-                                       create=create, existing=existing)
-    def MutableSet(self, key, create=None, existing=None):
+                                       create=create, existing=existing,
+                                       **self._obj_kwargs("Set", codec))
+    def MutableSet(self, key, create=None, existing=None, codec=None):
         return self.backend.module.MutableSet(self.backend.driver, key,
-                                              create=create, existing=existing)
+                                              create=create, existing=existing,
+                                              **self._obj_kwargs("MutableSet", codec))
 
-    def Dictionary(self, key, create=None, existing=None):
+    def Dictionary(self, key, create=None, existing=None, codec=None):
         return self.backend.module.Dictionary(self.backend.driver, key,
-                                              create=create, existing=existing)
-    def MutableDictionary(self, key, create=None, existing=None):
+                                              create=create, existing=existing,
+                                              **self._obj_kwargs("Dictionary", codec))
+    def MutableDictionary(self, key, create=None, existing=None, codec=None):
         return self.backend.module.MutableDictionary(self.backend.driver, key,
-                                                     create=create, existing=existing)
+                                                     create=create, existing=existing,
+                                                     **self._obj_kwargs("MutableDictionary",
+                                                                        codec))
+
+    def IntArray(self, key, create=None, existing=None):
+        return self.backend.module.IntArray(self.backend.driver, key,
+                                            create=create, existing=existing,
+                                            **self._obj_kwargs("IntArray"))
+    def MutableIntArray(self, key, create=None, existing=None):
+        return self.backend.module.MutableIntArray(self.backend.driver, key,
+                                                   create=create, existing=existing,
+                                                   **self._obj_kwargs("MutableIntArray"))
+
+    def FloatArray(self, key, create=None, existing=None):
+        return self.backend.module.FloatArray(self.backend.driver, key,
+                                              create=create, existing=existing,
+                                              **self._obj_kwargs("FloatArray"))
+    def MutableFloatArray(self, key, create=None, existing=None):
+        return self.backend.module.MutableFloatArray(self.backend.driver, key,
+                                                     create=create, existing=existing,
+                                                     **self._obj_kwargs("MutableFloatArray"))
+
+    def Counter(self, key, create=None, existing=None, codec=None):
+        return self.backend.module.Counter(self.backend.driver, key,
+                                           create=create, existing=existing,
+                                           **self._obj_kwargs("Counter", codec))
+    def MutableCounter(self, key, create=None, existing=None, codec=None):
+        return self.backend.module.MutableCounter(self.backend.driver, key,
+                                                  create=create, existing=existing,
+                                                  **self._obj_kwargs("MutableCounter", codec))
+
+    def Integer(self, key, create=None, existing=None):
+        return self.backend.module.Integer(self.backend.driver, key,
+                                           create=create, existing=existing,
+                                           **self._obj_kwargs("Integer"))
+    def AtomicInteger(self, key, create=None, existing=None):
+        return self.backend.module.AtomicInteger(self.backend.driver, key,
+                                                 create=create, existing=existing,
+                                                 **self._obj_kwargs("AtomicInteger"))
@@ -23,10 +23,19 @@ from future.utils import python_2_unicode_compatible
 from builtins import *
 
 import abc
+import threading
+import time
 
 import redis
 
 
+### Constants ###
+
+# Commands that block or change connection state can't share a pipeline
+_AUTOPIPELINE_BYPASS = frozenset(["BLPOP", "BRPOP", "BRPOPLPUSH", "BZPOPMIN", "BZPOPMAX",
+                                  "WAIT", "SELECT", "MONITOR", "SUBSCRIBE", "PSUBSCRIBE"])
+
+
 ### Abstract Classes ###
 
 class Driver(with_metaclass(abc.ABCMeta, object)):
@@ -34,13 +43,176 @@ class Driver(with_metaclass(abc.ABCMeta, object)):
     pass
 
 
+### Helper Classes ###
+
+class _PendingCommand(object):
+    """Command Waiting in the Auto-Pipeline Queue"""
+
+    def __init__(self, args, options):
+
+        # Call Parent
+        super(_PendingCommand, self).__init__()
+
+        # Save Attrs
+        self.args = args
+        self.options = options
+        self.event = threading.Event()
+        self.lead = False
+        self.ret = None
+
+    def result(self):
+        """Return Reply or Raise Error"""
+
+        if isinstance(self.ret, Exception):
+            raise self.ret
+        return self.ret
+
+class _AutoPipelineRedis(redis.StrictRedis):
+    """
+    StrictRedis Client that Coalesces Concurrent Commands into Pipelines
+
+    The first thread to issue a command becomes the leader. It waits for
+    window seconds (if set) and sends everything queued so far as one
+    pipeline. Commands issued while that pipeline is in flight are queued
+    for the next one, and the leader role passes to the first of them.
+    Each caller gets back its own reply or error. Pipelines and
+    transactions use their own connections and are not coalesced.
+    """
+
+    def __init__(self, *args, **kwargs):
+
+        # Get Args
+        window = kwargs.pop("window", 0)
+
+        # Call Parent
+        super(_AutoPipelineRedis, self).__init__(*args, **kwargs)
+
+        # Save Attrs
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending = []
+        self._leading = False
+
+    def execute_command(self, *args, **options):
+        """Queue Command and Return its Reply"""
+
+        # Bypass
+        if args[0] in _AUTOPIPELINE_BYPASS:
+            return super(_AutoPipelineRedis, self).execute_command(*args, **options)
+
+        # Queue
+        cmd = _PendingCommand(args, options)
+        with self._lock:
+            self._pending.append(cmd)
+            lead = not self._leading
+            self._leading = True
+
+        # Wait for Reply or Promotion
+        if not lead:
+            try:
+                cmd.event.wait()
+            except BaseException:
+                self._abandon(cmd)
+                raise
+            if not cmd.lead:
+                return cmd.result()
+
+        # Flush as Leader
+        self._flush(cmd)
+        return cmd.result()
+
+    def _flush(self, lead_cmd):
+        """Send Queued Commands as One Pipeline"""
+
+        cmds = None
+        rets = None
+        try:
+
+            # Let Other Threads Queue
+            if self._window:
+                time.sleep(self._window)
+
+            # Swap Queue
+            with self._lock:
+                cmds = self._pending
+                self._pending = []
+
+            # Execute Pipeline
+            try:
+                pipe = self.pipeline(transaction=False)
+                for cmd in cmds:
+                    pipe.execute_command(*cmd.args, **cmd.options)
+                rets = pipe.execute(raise_on_error=False)
+            except Exception as err:
+                rets = [err] * len(cmds)
+
+        finally:
+
+            # Pick Next Leader, Even if Interrupted, so No Thread Waits Forever
+            with self._lock:
+                if cmds is None:
+                    self._pending.remove(lead_cmd)
+                    cmds = []
+                successor = self._promote()
+
+            # Hand Out Replies, Failing Commands whose Pipeline was Interrupted
+            if rets is None:
+                err = redis.exceptions.ConnectionError("auto-pipeline flush was interrupted")
+                rets = [err] * len(cmds)
+            for cmd, ret in zip(cmds, rets):
+                cmd.ret = ret
+                cmd.event.set()
+            if successor is not None:
+                successor.event.set()
+
+    def _abandon(self, cmd):
+        """Drop Interrupted Waiter, Passing On the Leader Role if it was Promoted"""
+
+        with self._lock:
+            if cmd not in self._pending:
+                return
+            self._pending.remove(cmd)
+            if not cmd.lead:
+                return
+            successor = self._promote()
+        if successor is not None:
+            successor.event.set()
+
+    def _promote(self):
+        """Pass Leader Role to First Queued Command, if Any (Locked)"""
+
+        if self._pending:
+            successor = self._pending[0]
+            successor.lead = True
+            return successor
+        self._leading = False
+        return None
+
+
 ### Classes ###
 
 class RedisDriver(Driver):
 
     def __init__(self, *args, **kwargs):
-
-        self._redis = redis.StrictRedis(*args, **kwargs)
+        """
+        Driver Constructor
+
+        Takes StrictRedis args, plus autopipeline=True to coalesce commands
+        from concurrent threads into shared pipelines, and
+        autopipeline_window to wait that many seconds before each flush.
+        """
+
+        # Get Args
+        autopipeline = kwargs.pop("autopipeline", False)
+        window = kwargs.pop("autopipeline_window", 0)
+
+        # Setup Client
+        if autopipeline:
+            self._redis = _AutoPipelineRedis(*args, window=window, **kwargs)
+        else:
+            self._redis = redis.StrictRedis(*args, **kwargs)
+        self._scripts = {}
+        self._local = threading.local()
 
         # Call Parent
         super().__init__()
@@ -48,3 +220,22 @@ class RedisDriver(Driver):
     @property
     def redis(self):
         return self._redis
+
+    @property
+    def batch(self):
+        """Batch Active on the Current Thread, if Any"""
+        return getattr(self._local, "batch", None)
+
+    @batch.setter
+    def batch(self, batch):
+        self._local.batch = batch
+
+    def script(self, source):
+        """Get Registered Lua Script"""
+
+        # Scripts are cached per driver so the SHA is only computed once
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._redis.register_script(source)
+            self._scripts[source] = script
+        return script
@@ -91,6 +91,7 @@ setup(
     extras_require={
 #        'dev': ['check-manifest'],
 #        'test': ['coverage'],
+        'msgpack': ['msgpack>=0.5.2'],
     },
 
     # If there are data files included in your packages that need to be
@@ -18,13 +18,17 @@ from future.utils import native_str
 from builtins import *
 
 ## stdlib ##
+import time
 import unittest
 import warnings
 
 ## pcollections ##
+import pcollections.exceptions
+from pcollections import caches
 from pcollections import drivers
 from pcollections import backends
 from pcollections import collections
+from pcollections import codecs
 
 ## tests ##
 import test_mixins
@@ -33,6 +37,28 @@ import test_mixins
 ### Globals ###
 
 _REDIS_DB = 9
+_CACHE = None
+
+
+### Functions ###
+
+def _shared_cache():
+    """Get Cache Shared by Cached Test Cases (Enables Keyspace Events)"""
+
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = caches.RedisCache(drivers.RedisDriver(db=_REDIS_DB), size=64, configure=True)
+    return _CACHE
+
+def _wait_for(func, timeout=5.0):
+    """Poll func Until it Returns True"""
+
+    end = time.time() + timeout
+    while not func():
+        if time.time() > end:
+            return False
+        time.sleep(0.01)
+    return True
 
 
 ### Exceptions ###
@@ -94,6 +120,18 @@ class ListTestCase(test_mixins.ListMixin, RedisAtomicTestCase):
 class MutableListTestCase(test_mixins.MutableListMixin, RedisAtomicTestCase):
     pass
 
+class IntArrayTestCase(test_mixins.IntArrayMixin, RedisAtomicTestCase):
+    pass
+
+class MutableIntArrayTestCase(test_mixins.MutableIntArrayMixin, RedisAtomicTestCase):
+    pass
+
+class FloatArrayTestCase(test_mixins.FloatArrayMixin, RedisAtomicTestCase):
+    pass
+
+class MutableFloatArrayTestCase(test_mixins.MutableFloatArrayMixin, RedisAtomicTestCase):
+    pass
+
 class SetTestCase(test_mixins.SetMixin, RedisAtomicTestCase):
     pass
 
@@ -105,3 +143,322 @@ class DictionaryTestCase(test_mixins.DictionaryMixin, RedisAtomicTestCase):
 
 class MutableDictionaryTestCase(test_mixins.MutableDictionaryMixin, RedisAtomicTestCase):
     pass
+
+class CounterTestCase(test_mixins.CounterMixin, RedisAtomicTestCase):
+    pass
+
+class MutableCounterTestCase(test_mixins.MutableCounterMixin, RedisAtomicTestCase):
+    pass
+
+class IntegerTestCase(test_mixins.IntegerMixin, RedisAtomicTestCase):
+    pass
+
+class AtomicIntegerTestCase(test_mixins.AtomicIntegerMixin, RedisAtomicTestCase):
+    pass
+
+class AtomicIncrTestCase(test_mixins.AtomicIncrMixin, RedisAtomicTestCase):
+    pass
+
+
+### Codec Classes ###
+
+class CodecTestCase(test_mixins.CodecMixin, test_mixins.EncodeOnceMixin,
+                    RedisAtomicTestCase):
+    pass
+
+class CompressedMutableStringTestCase(test_mixins.MutableStringMixin, RedisAtomicTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(CompressedMutableStringTestCase, self).__init__(*args, **kwargs)
+        self.obj = test_mixins.with_codec(self.obj, codecs.ZlibCodec(threshold=0))
+
+
+### Buffered Classes ###
+
+class BufferedTestCase(RedisAtomicTestCase):
+
+    def test_dictionary(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={"a": "1", "b": "2"},
+                                                existing=False)
+        buf = self.collection.buffered(dct, interval=None, size=None)
+
+        # Test Buffered
+        buf["a"] = "x"
+        buf["a"] = "y"
+        buf["c"] = "3"
+        del(buf["b"])
+        del(buf["z"])
+        buf.update({"d": "4"})
+        self.assertEqual(5, buf.pending)
+        self.assertEqual(3, len(buf))
+        self.assertEqual({"a": "1", "b": "2"}, dct.get_val())
+        self.assertEqual({"a": "y", "c": "3", "d": "4"}, buf.get_val())
+        self.assertEqual("y", buf["a"])
+        self.assertRaises(KeyError, buf.__getitem__, "b")
+        self.assertFalse("b" in buf)
+        self.assertEqual("3", buf.get("c"))
+        self.assertRaises(TypeError, buf.__setitem__, "e", None)
+
+        # Test Flush
+        buf.flush()
+        self.assertEqual(0, buf.pending)
+        self.assertEqual(3, len(buf))
+        self.assertEqual({"a": "y", "c": "3", "d": "4"}, dct.get_val())
+        self.assertEqual("4", buf["d"])
+
+        # Cleanup
+        buf.close()
+        dct.rem()
+
+    def test_set(self):
+
+        # Create Instance
+        st = self.collection.MutableSet(self.generate_key(), create={"a", "b"}, existing=False)
+        buf = self.collection.buffered(st, interval=None, size=None)
+
+        # Test Buffered
+        buf.add("c")
+        buf.discard("a")
+        buf.add("a")
+        buf.discard("b")
+        buf.add_many(["d", "e"])
+        buf.discard_many(["e"])
+        self.assertEqual({"a", "b"}, st.get_val())
+        self.assertEqual({"a", "c", "d"}, buf.get_val())
+        self.assertTrue("c" in buf)
+        self.assertFalse("b" in buf)
+        self.assertFalse("e" in buf)
+        self.assertEqual(3, len(buf))
+
+        # Test Flush
+        buf.flush()
+        self.assertEqual({"a", "c", "d"}, st.get_val())
+        self.assertEqual(3, len(buf))
+
+        # Cleanup
+        buf.close()
+        st.rem()
+
+    def test_size(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={}, existing=False)
+        buf = self.collection.buffered(dct, interval=None, size=3)
+
+        # Test Auto Flush
+        for i in range(4):
+            buf[str(i)] = str(i)
+        self.assertEqual(1, buf.pending)
+        self.assertEqual(4, len(buf))
+        self.assertEqual({"0": "0", "1": "1", "2": "2"}, dct.get_val())
+
+        # Test Close
+        with buf:
+            pass
+        self.assertTrue(buf.closed)
+        self.assertEqual({"0": "0", "1": "1", "2": "2", "3": "3"}, dct.get_val())
+        self.assertRaises(RuntimeError, buf.__setitem__, "4", "4")
+
+        # Cleanup
+        dct.rem()
+
+    def test_interval(self):
+
+        # Create Instance
+        st = self.collection.MutableSet(self.generate_key(), create=set(), existing=False)
+
+        # Test Timer
+        with self.collection.buffered(st, interval=0.01, size=None) as buf:
+            buf.add("a")
+            self.assertTrue(_wait_for(lambda: st.get_val() == {"a"}))
+
+        # Cleanup
+        st.rem()
+
+    def test_errors(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={}, existing=False)
+        buf = self.collection.buffered(dct, interval=None, size=None)
+
+        # Test Failed Flush Keeps Mutations
+        buf["a"] = "1"
+        buf["b"] = "2"
+        dct.rem()
+        self.assertRaises(pcollections.exceptions.ObjectDNE, buf.flush)
+        buf["a"] = "3"
+        self.assertEqual(2, buf.pending)
+        self.assertRaises(pcollections.exceptions.ObjectDNE, len, buf)
+        self.assertEqual("3", buf["a"])
+        self.assertEqual("2", buf["b"])
+
+        # Test Retry
+        dct = self.collection.MutableDictionary(dct.key, create={}, existing=False)
+        buf.close()
+        self.assertEqual({"a": "3", "b": "2"}, dct.get_val())
+
+        # Test Bad Args
+        lst = self.collection.MutableList(self.generate_key(), create=[], existing=False)
+        self.assertRaises(TypeError, self.collection.buffered, lst)
+        self.assertRaises(ValueError, self.collection.buffered, dct, interval=0)
+        self.assertRaises(ValueError, self.collection.buffered, dct, size=0)
+
+        # Cleanup
+        lst.rem()
+        dct.rem()
+
+
+### Cached Classes ###
+
+class RedisAtomicCachedTestCase(RedisAtomicTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(RedisAtomicCachedTestCase, self).__init__(*args, **kwargs)
+        self.cache = _shared_cache()
+        self.driver = self.cache.driver
+        self.backend = backends.RedisAtomicBackend(self.driver)
+        self.collection = collections.PCollections(self.backend, cache=self.cache)
+
+class CachedMutableStringTestCase(test_mixins.MutableStringMixin, RedisAtomicCachedTestCase):
+    pass
+
+class CachedMutableListTestCase(test_mixins.MutableListMixin, RedisAtomicCachedTestCase):
+    pass
+
+class CachedMutableSetTestCase(test_mixins.MutableSetMixin, RedisAtomicCachedTestCase):
+    pass
+
+class CachedMutableDictionaryTestCase(test_mixins.MutableDictionaryMixin,
+                                      RedisAtomicCachedTestCase):
+    pass
+
+class CacheTestCase(RedisAtomicCachedTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(CacheTestCase, self).__init__(*args, **kwargs)
+        self.uncached = collections.PCollections(self.backend)
+
+    def test_hit(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={"k": "v"},
+                                                existing=False)
+
+        # Test Hits
+        self.assertEqual({"k": "v"}, dct.get_val())
+        hits = self.cache.hits
+        val = dct.get_val()
+        self.assertEqual({"k": "v"}, val)
+        self.assertEqual("v", dct["k"])
+        self.assertEqual(["v", None], dct.get_many(["k", "j"]))
+        self.assertTrue("k" in dct)
+        self.assertEqual(1, len(dct))
+        self.assertEqual(hits + 5, self.cache.hits)
+
+        # Test Copy
+        val["j"] = "w"
+        self.assertEqual({"k": "v"}, dct.get_val())
+
+        # Test Own Write
+        dct["j"] = "w"
+        self.assertEqual({"k": "v", "j": "w"}, dct.get_val())
+        self.assertEqual("w", dct["j"])
+
+        # Cleanup
+        dct.rem()
+
+    def test_nested(self):
+
+        # Create Instance
+        key = self.generate_key()
+        lst = self.collection.MutableList(key, create=[{"k": ["v"]}], existing=False,
+                                          codec=codecs.JsonCodec())
+        other = self.collection.List(key, existing=True, codec=codecs.JsonCodec())
+        def cached():
+            hits = self.cache.hits
+            lst.get_val()
+            return self.cache.hits > hits
+        self.assertTrue(_wait_for(cached))
+
+        # Test Equal Codecs Share Entries
+        hits = self.cache.hits
+        self.assertEqual({"k": ["v"]}, other[0])
+        self.assertLess(hits, self.cache.hits)
+
+        # Test Copies
+        lst[0]["k"].append("w")
+        lst.get_val()[0]["j"] = "x"
+        self.assertEqual([{"k": ["v"]}], lst.get_val())
+        self.assertEqual({"k": ["v"]}, lst[0])
+
+        # Cleanup
+        lst.rem()
+
+    def test_invalidate(self):
+
+        # Create Instance
+        key = self.generate_key()
+        dct = self.collection.MutableDictionary(key, create={"k": "v"}, existing=False)
+        self.assertEqual({"k": "v"}, dct.get_val())
+
+        # Test Write Elsewhere
+        other = self.uncached.MutableDictionary(key, existing=True)
+        other["k"] = "w"
+        self.assertTrue(_wait_for(lambda: dct.get_val() == {"k": "w"}))
+
+        # Test Remove Elsewhere
+        lst = self.collection.MutableList(self.generate_key(), create=[], existing=False)
+        self.assertEqual([], lst.get_val())
+        self.uncached.MutableList(lst.key).rem()
+        def removed():
+            try:
+                lst.get_val()
+            except pcollections.exceptions.ObjectDNE:
+                return True
+            return False
+        self.assertTrue(_wait_for(removed))
+
+        # Cleanup
+        dct.rem()
+
+    def test_lru(self):
+
+        with caches.RedisCache(self.driver, size=2) as cache:
+
+            # Create Instances
+            col = collections.PCollections(self.backend, cache=cache)
+            strs = [col.String(self.generate_key(), create=str(i), existing=False)
+                    for i in range(3)]
+
+            # Test Eviction
+            for obj in strs:
+                obj.get_val()
+            self.assertEqual(2, len(cache))
+            self.assertFalse(cache.lookup(strs[0]._redis_key, strs[0].codec)[0])
+            self.assertTrue(cache.lookup(strs[2]._redis_key, strs[2].codec)[0])
+
+            # Test Recent Use
+            strs[1].get_val()
+            strs[0].get_val()
+            self.assertFalse(cache.lookup(strs[2]._redis_key, strs[2].codec)[0])
+            self.assertTrue(cache.lookup(strs[1]._redis_key, strs[1].codec)[0])
+
+        # Test Closed
+        self.assertFalse(cache.active)
+        self.assertEqual(0, len(cache))
+        self.assertEqual("0", strs[0].get_val())
+        self.assertEqual(0, len(cache))
+
+        # Cleanup
+        for obj in strs:
+            obj.rem()
+
+    def test_args(self):
+
+        self.assertRaises(TypeError, caches.RedisCache, None)
+        self.assertRaises(ValueError, caches.RedisCache, self.driver, size=0)
+        self.assertRaises(TypeError, collections.PCollections, self.backend, cache="cache")
+        other = backends.RedisAtomicBackend(drivers.RedisDriver(db=_REDIS_DB))
+        self.assertRaises(ValueError, collections.PCollections, other, cache=self.cache)
@@ -25,6 +25,7 @@ import warnings
 from pcollections import drivers
 from pcollections import backends
 from pcollections import collections
+from pcollections import codecs
 
 ## tests ##
 import test_mixins
@@ -94,6 +95,18 @@ class ListTestCase(test_mixins.ListMixin, RedisBaseTestCase):
 class MutableListTestCase(test_mixins.MutableListMixin, RedisBaseTestCase):
     pass
 
+class IntArrayTestCase(test_mixins.IntArrayMixin, RedisBaseTestCase):
+    pass
+
+class MutableIntArrayTestCase(test_mixins.MutableIntArrayMixin, RedisBaseTestCase):
+    pass
+
+class FloatArrayTestCase(test_mixins.FloatArrayMixin, RedisBaseTestCase):
+    pass
+
+class MutableFloatArrayTestCase(test_mixins.MutableFloatArrayMixin, RedisBaseTestCase):
+    pass
+
 class SetTestCase(test_mixins.SetMixin, RedisBaseTestCase):
     pass
 
@@ -105,3 +118,27 @@ class DictionaryTestCase(test_mixins.DictionaryMixin, RedisBaseTestCase):
 
 class MutableDictionaryTestCase(test_mixins.MutableDictionaryMixin, RedisBaseTestCase):
     pass
+
+class CounterTestCase(test_mixins.CounterMixin, RedisBaseTestCase):
+    pass
+
+class MutableCounterTestCase(test_mixins.MutableCounterMixin, RedisBaseTestCase):
+    pass
+
+class IntegerTestCase(test_mixins.IntegerMixin, RedisBaseTestCase):
+    pass
+
+class AtomicIntegerTestCase(test_mixins.AtomicIntegerMixin, RedisBaseTestCase):
+    pass
+
+
+### Codec Classes ###
+
+class CodecTestCase(test_mixins.CodecMixin, RedisBaseTestCase):
+    pass
+
+class CompressedMutableStringTestCase(test_mixins.MutableStringMixin, RedisBaseTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(CompressedMutableStringTestCase, self).__init__(*args, **kwargs)
+        self.obj = test_mixins.with_codec(self.obj, codecs.ZlibCodec(threshold=0))
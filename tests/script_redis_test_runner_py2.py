@@ -0,0 +1,16 @@
+#!/usr/bin/env python2
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Tests
+
+
+import warnings
+
+
+from script_redis_tests import *
+if __name__ == '__main__':
+    warnings.simplefilter("always")
+    unittest.main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Tests
+
+
+from script_redis_tests import *
+if __name__ == '__main__':
+    unittest.main(warnings="always")
@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+
+
+# Andy Sayler
+# 2014, 2015
+# pcollections Tests
+
+
+### Imports ###
+
+## Future ##
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+from future.utils import native_str
+from builtins import *
+
+## stdlib ##
+import threading
+import unittest
+import warnings
+
+## redis ##
+import redis
+
+## pcollections ##
+import pcollections.exceptions
+from pcollections import caches
+from pcollections import drivers
+from pcollections import backends
+from pcollections import collections
+from pcollections import codecs
+
+## tests ##
+import test_mixins
+
+
+### Globals ###
+
+_REDIS_DB = 9
+_CACHE = None
+
+
+### Functions ###
+
+def _shared_cache():
+    """Get Cache Shared by Cached Test Cases (Enables Keyspace Events)"""
+
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = caches.RedisCache(drivers.RedisDriver(db=_REDIS_DB), size=64, configure=True)
+    return _CACHE
+
+
+### Exceptions ###
+
+class RedisScriptTestError(test_mixins.BaseTestError):
+    """Base class for RedisScriptTest Exceptions"""
+
+    pass
+
+class RedisDatabaseNotEmpty(RedisScriptTestError):
+
+    def __init__(self, redis):
+        msg = "Redis DB not empty: {:d} keys".format(redis.dbsize())
+        super(RedisDatabaseNotEmpty, self).__init__(msg)
+
+
+### Base Class ###
+
+class RedisScriptTestCase(test_mixins.BaseTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(RedisScriptTestCase, self).__init__(*args, **kwargs)
+        self.driver = drivers.RedisDriver(db=_REDIS_DB)
+        self.backend = backends.RedisScriptBackend(self.driver)
+        self.collection = collections.PCollections(self.backend)
+
+    def setUp(self):
+
+        # Call Parent
+        super(RedisScriptTestCase, self).setUp()
+
+        # Confirm Empty DB
+        if (self.driver.redis.dbsize() != 0):
+            raise RedisDatabaseNotEmpty(self.driver.redis)
+
+    def tearDown(self):
+
+        # Confirm Empty DB
+        if (self.driver.redis.dbsize() != 0):
+            print("")
+            warnings.warn("Redis database not empty prior to tearDown")
+            self.driver.redis.flushdb()
+
+        # Call Parent
+        super(RedisScriptTestCase, self).tearDown()
+
+
+### Object Classes ###
+
+class StringTestCase(test_mixins.StringMixin, RedisScriptTestCase):
+    pass
+
+class MutableStringTestCase(test_mixins.MutableStringMixin, RedisScriptTestCase):
+    pass
+
+class ListTestCase(test_mixins.ListMixin, RedisScriptTestCase):
+    pass
+
+class MutableListTestCase(test_mixins.MutableListMixin, RedisScriptTestCase):
+    pass
+
+class IntArrayTestCase(test_mixins.IntArrayMixin, RedisScriptTestCase):
+    pass
+
+class MutableIntArrayTestCase(test_mixins.MutableIntArrayMixin, RedisScriptTestCase):
+    pass
+
+class FloatArrayTestCase(test_mixins.FloatArrayMixin, RedisScriptTestCase):
+    pass
+
+class MutableFloatArrayTestCase(test_mixins.MutableFloatArrayMixin, RedisScriptTestCase):
+    pass
+
+class SetTestCase(test_mixins.SetMixin, RedisScriptTestCase):
+    pass
+
+class MutableSetTestCase(test_mixins.MutableSetMixin, RedisScriptTestCase):
+    pass
+
+class DictionaryTestCase(test_mixins.DictionaryMixin, RedisScriptTestCase):
+    pass
+
+class MutableDictionaryTestCase(test_mixins.MutableDictionaryMixin, RedisScriptTestCase):
+    pass
+
+class CounterTestCase(test_mixins.CounterMixin, RedisScriptTestCase):
+    pass
+
+class MutableCounterTestCase(test_mixins.MutableCounterMixin, RedisScriptTestCase):
+    pass
+
+class IntegerTestCase(test_mixins.IntegerMixin, RedisScriptTestCase):
+    pass
+
+class AtomicIntegerTestCase(test_mixins.AtomicIntegerMixin, RedisScriptTestCase):
+    pass
+
+class AtomicIncrTestCase(test_mixins.AtomicIncrMixin, RedisScriptTestCase):
+    pass
+
+
+### Codec Classes ###
+
+class CodecTestCase(test_mixins.CodecMixin, test_mixins.EncodeOnceMixin,
+                    RedisScriptTestCase):
+    pass
+
+class CompressedMutableStringTestCase(test_mixins.MutableStringMixin, RedisScriptTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(CompressedMutableStringTestCase, self).__init__(*args, **kwargs)
+        self.obj = test_mixins.with_codec(self.obj, codecs.ZlibCodec(threshold=0))
+
+
+### Batch Classes ###
+
+class BatchTestCase(RedisScriptTestCase):
+
+    def test_batch(self):
+
+        # Create Instances
+        lst = self.collection.MutableList(self.generate_key(), create=["a", "b"], existing=False)
+        dct = self.collection.MutableDictionary(self.generate_key(), create={"k": "v"}, existing=False)
+
+        # Queue Calls
+        with self.collection.batch() as batch:
+            lst.append("c")
+            dct["j"] = "w"
+            ret_pop = lst.pop(0)
+            ret_get = dct.get_val()
+            self.assertEqual(4, len(batch))
+            self.assertFalse(ret_pop.done)
+            self.assertEqual(["a", "b"], list(lst.iterate()))
+
+        # Test Results
+        self.assertEqual("a", ret_pop.get())
+        self.assertEqual({"k": "v", "j": "w"}, ret_get.get())
+        self.assertEqual(["b", "c"], lst.get_val())
+
+        # Cleanup
+        lst.rem()
+        dct.rem()
+
+    def test_batch_errors(self):
+
+        # Create Instances
+        lst = self.collection.MutableList(self.generate_key(), create=["a"], existing=False)
+        dne = self.collection.MutableList(self.generate_key())
+
+        # Test Failures
+        with self.assertRaises(pcollections.exceptions.ObjectDNE):
+            with self.collection.batch():
+                ret_dne = dne.append("x")
+                ret_oob = lst.pop(5)
+                lst.append("b")
+        self.assertRaises(pcollections.exceptions.ObjectDNE, ret_dne.get)
+        self.assertRaises(IndexError, ret_oob.get)
+        self.assertEqual(["a", "b"], lst.get_val())
+
+        # Test Pipeline Failure
+        def failed(*args, **kwargs):
+            raise redis.exceptions.ConnectionError("lost")
+        with self.assertRaises(redis.exceptions.ConnectionError):
+            with self.collection.batch() as batch:
+                ret_app = lst.append("c")
+                ret_get = lst.get_val()
+                batch._pipe.execute = failed
+        self.assertRaises(redis.exceptions.ConnectionError, ret_app.get)
+        self.assertRaises(redis.exceptions.ConnectionError, ret_get.get)
+
+        # Test Nested
+        with self.collection.batch():
+            self.assertRaises(RuntimeError, self.collection.batch().__enter__)
+
+        # Cleanup
+        lst.rem()
+
+    def test_batch_size(self):
+
+        # Create Instance
+        lst = self.collection.MutableList(self.generate_key(), create=[], existing=False)
+
+        # Test Auto Execute
+        with self.collection.batch(size=2) as batch:
+            for i in range(5):
+                lst.append(str(i))
+            self.assertEqual(1, len(batch))
+            self.assertEqual(["0", "1", "2", "3"], list(lst.iterate()))
+        self.assertEqual(["0", "1", "2", "3", "4"], lst.get_val())
+
+        # Cleanup
+        lst.rem()
+
+    def test_batch_reads(self):
+
+        # Create Instances
+        lst = self.collection.MutableList(self.generate_key(), create=["a", "b"], existing=False)
+        cnt = self.collection.MutableCounter(self.generate_key(), create={"x": 2, "y": 1},
+                                             existing=False)
+        string = self.collection.MutableString(self.generate_key(), create="abc", existing=False,
+                                               codec=codecs.ZlibCodec(threshold=0))
+        st_a = self.collection.MutableSet(self.generate_key(), create={"x", "y"}, existing=False)
+        st_b = self.collection.MutableSet(self.generate_key(), create={"x", "z"}, existing=False,
+                                          codec=codecs.JsonCodec())
+
+        # Test Unscripted Reads Run at Once
+        with self.collection.batch() as batch:
+            lst.append("c")
+            self.assertEqual(1, lst.index("b"))
+            self.assertEqual(["b", "a"], list(reversed(lst)))
+            self.assertEqual("['a', 'b']", str(lst))
+            self.assertEqual([("x", 2)], cnt.most_common(1))
+            self.assertEqual(["x", "x", "y"], sorted(cnt.elements()))
+            self.assertEqual(3, cnt.total())
+            self.assertEqual(3, len(string))
+            self.assertEqual(["a", "b", "c"], list(string))
+            self.assertEqual({"x"}, st_a & st_b)
+            self.assertFalse(st_a.isdisjoint(st_b))
+            self.assertEqual(1, len(batch))
+        self.assertEqual(["a", "b", "c"], lst.get_val())
+
+        # Cleanup
+        lst.rem()
+        cnt.rem()
+        string.rem()
+        st_a.rem()
+        st_b.rem()
+
+    def test_batch_unscripted(self):
+
+        # Create Instances
+        arr = self.collection.MutableIntArray(self.generate_key(), create=[1, 2], existing=False)
+        lst = self.collection.MutableList(self.generate_key(), create=["a", "b"], existing=False)
+        string = self.collection.MutableString(self.generate_key(), create="abc", existing=False,
+                                               codec=codecs.ZlibCodec(threshold=0))
+        st_a = self.collection.MutableSet(self.generate_key(), create={"x"}, existing=False)
+        st_b = self.collection.MutableSet(self.generate_key(), create={"y"}, existing=False)
+
+        # Test Unscripted Mutations Raise Without Running
+        with self.collection.batch() as batch:
+            arr.append(3)
+            self.assertRaises(RuntimeError, arr.remove, 3)
+            self.assertRaises(RuntimeError, arr.reverse)
+            self.assertRaises(RuntimeError, arr.__delitem__, 0)
+            self.assertRaises(RuntimeError, arr.__setitem__, slice(0, 1), [5])
+            self.assertRaises(RuntimeError, lst.__setitem__, slice(0, 1), ["x"])
+            self.assertRaises(RuntimeError, lst.__delitem__, slice(0, 1))
+            self.assertRaises(RuntimeError, string.append, "d")
+            self.assertRaises(RuntimeError, string.pop)
+            self.assertRaises(RuntimeError, st_a.__ior__, st_b)
+            self.assertRaises(RuntimeError, st_a.__isub__, st_b)
+            self.assertEqual(1, len(batch))
+        self.assertEqual([1, 2, 3], list(arr.get_val()))
+        self.assertEqual(["a", "b"], lst.get_val())
+        self.assertEqual("abc", string.get_val())
+        self.assertEqual({"x"}, st_a.get_val())
+
+        # Test Clear is Queued in Order
+        with self.collection.batch():
+            lst.append("c")
+            lst.clear()
+            lst.append("d")
+            arr.clear()
+            string.clear()
+        self.assertEqual(["d"], lst.get_val())
+        self.assertEqual([], list(arr.get_val()))
+        self.assertEqual("", string.get_val())
+
+        # Cleanup
+        arr.rem()
+        lst.rem()
+        string.rem()
+        st_a.rem()
+        st_b.rem()
+
+
+### Buffered Classes ###
+
+class BufferedTestCase(RedisScriptTestCase):
+
+    def test_buffered(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={"a": "1"},
+                                                existing=False)
+
+        # Test Flush on Close
+        with self.collection.buffered(dct, interval=None) as buf:
+            buf["b"] = "2"
+            del(buf["a"])
+            self.assertEqual({"a": "1"}, dct.get_val())
+        self.assertEqual({"b": "2"}, dct.get_val())
+
+        # Cleanup
+        dct.rem()
+
+
+### Auto-Pipeline Classes ###
+
+class RedisScriptAutoPipelineTestCase(RedisScriptTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(RedisScriptAutoPipelineTestCase, self).__init__(*args, **kwargs)
+        self.driver = drivers.RedisDriver(db=_REDIS_DB, autopipeline=True)
+        self.backend = backends.RedisScriptBackend(self.driver)
+        self.collection = collections.PCollections(self.backend)
+
+class AutoPipelineMutableListTestCase(test_mixins.MutableListMixin,
+                                      RedisScriptAutoPipelineTestCase):
+    pass
+
+class AutoPipelineMutableDictionaryTestCase(test_mixins.MutableDictionaryMixin,
+                                            RedisScriptAutoPipelineTestCase):
+    pass
+
+class AutoPipelineTestCase(RedisScriptAutoPipelineTestCase):
+
+    def test_interrupted_flush(self):
+
+        client = self.driver.redis
+        replies = []
+
+        # Interrupt the Leader while it Builds the Pipeline
+        def interrupted(*args, **kwargs):
+            del(client.pipeline)
+            raise KeyboardInterrupt()
+        client.pipeline = interrupted
+        self.assertRaises(KeyboardInterrupt, client.ping)
+
+        # Test Later Commands Still Get a Leader
+        thread = threading.Thread(target=lambda: replies.append(client.ping()))
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertEqual([True], replies)
+
+    def test_threads(self):
+
+        # Setup Shared Set
+        members = self.collection.MutableSet(self.generate_key(), create=set(), existing=False)
+        keys = [self.generate_key() for i in range(32)]
+        errors = []
+
+        # Each thread writes and reads back its own objects
+        def worker(key):
+            try:
+                obj = self.collection.MutableList(key, create=[key], existing=False)
+                for i in range(20):
+                    obj.append(str(i))
+                    members.add("{:s}_{:d}".format(key, i))
+                    if obj.get_val()[-1] != str(i):
+                        raise AssertionError("wrong reply for {:s}".format(key))
+                self.assertRaises(IndexError, obj.pop, 100)
+                obj.rem()
+            except Exception as err:
+                errors.append(err)
+
+        # Run Threads
+        threads = [threading.Thread(target=worker, args=(key,)) for key in keys]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Test Results
+        self.assertEqual([], errors)
+        self.assertEqual(len(keys) * 20, len(members))
+
+        # Cleanup
+        members.rem()
+
+
+### Cached Classes ###
+
+class RedisScriptCachedTestCase(RedisScriptTestCase):
+
+    def __init__(self, *args, **kwargs):
+        super(RedisScriptCachedTestCase, self).__init__(*args, **kwargs)
+        self.cache = _shared_cache()
+        self.driver = self.cache.driver
+        self.backend = backends.RedisScriptBackend(self.driver)
+        self.collection = collections.PCollections(self.backend, cache=self.cache)
+
+class CachedMutableListTestCase(test_mixins.MutableListMixin, RedisScriptCachedTestCase):
+    pass
+
+class CachedMutableDictionaryTestCase(test_mixins.MutableDictionaryMixin,
+                                      RedisScriptCachedTestCase):
+    pass
+
+class CachedBatchTestCase(RedisScriptCachedTestCase):
+
+    def test_batch(self):
+
+        # Create Instance
+        dct = self.collection.MutableDictionary(self.generate_key(), create={"k": "v"},
+                                                existing=False)
+        self.assertEqual({"k": "v"}, dct.get_val())
+
+        # Test Queued Write
+        with self.collection.batch():
+            dct["j"] = "w"
+            ret_get = dct.get_val()
+        self.assertEqual({"k": "v", "j": "w"}, ret_get.get())
+        self.assertEqual({"k": "v", "j": "w"}, dct.get_val())
+
+        # Cleanup
+        dct.rem()
@@ -20,12 +20,18 @@ from builtins import *
 
 ## stdlib ##
 import abc
+import array
 import copy
 import collections
+import operator
+import threading
 import unittest
 import warnings
 
 ### pcollections ###
+import pcollections.be_redis_base
+import pcollections.codecs
+import pcollections.collections
 import pcollections.constants
 import pcollections.exceptions
 
@@ -35,6 +41,17 @@ import pcollections.exceptions
 _TEST_KEY_PRE = "TESTKEY"
 
 
+### Functions ###
+
+def with_codec(factory, codec):
+    """Wrap Collection Factory to Pass codec"""
+
+    def wrapped(key, create=None, existing=None):
+        return factory(key, create=create, existing=existing, codec=codec)
+    wrapped.__name__ = factory.__name__
+    return wrapped
+
+
 ### Exceptions ###
 
 class BaseTestError(Exception):
@@ -79,6 +96,9 @@ class BaseTestCase(unittest.TestCase):
 
 class PersistentMixin(object):
 
+    def helper_val_size(self, val):
+        return len(val)
+
     def helper_raises(self, size, error, test_func, *args):
 
         key = self.generate_key()
@@ -145,7 +165,7 @@ class PersistentMixin(object):
         # Setup Test Vals
         key = self.generate_key()
         val = self.generate_val_multi(0)
-        self.assertEqual(len(val), 0)
+        self.assertEqual(self.helper_val_size(val), 0)
 
         # Create Invalid Instance
         self.assertRaises(TypeError, self.from_new, None, None)
@@ -169,7 +189,7 @@ class PersistentMixin(object):
         # Setup Test Vals
         key = self.generate_key()
         val = self.generate_val_multi(10)
-        self.assertGreater(len(val), 0)
+        self.assertGreater(self.helper_val_size(val), 0)
 
         # Create Invalid Instance
         self.assertRaises(TypeError, self.from_new, None, None)
@@ -193,7 +213,7 @@ class PersistentMixin(object):
         # Setup Test Vals
         key = self.generate_key()
         val = self.generate_val_multi(0)
-        self.assertEqual(len(val), 0)
+        self.assertEqual(self.helper_val_size(val), 0)
 
         # Get Invalid Instance
         self.assertRaises(TypeError, self.from_existing, None)
@@ -219,7 +239,7 @@ class PersistentMixin(object):
         # Setup Test Vals
         key = self.generate_key()
         val = self.generate_val_multi(10)
-        self.assertGreater(len(val), 0)
+        self.assertGreater(self.helper_val_size(val), 0)
 
         # Get Invalid Instance
         self.assertRaises(TypeError, self.from_existing, None)
@@ -304,6 +324,103 @@ class PersistentMixin(object):
         instance.rem()
         self.assertRaises(pcollections.exceptions.ObjectDNE, instance.get_val)
 
+    def test_open_many(self):
+
+        # Setup Test Vals
+        keys = [self.generate_key() for i in range(4)]
+        vals = [self.generate_val_multi(5) for i in range(2)]
+        for key, val in zip(keys, vals):
+            self.from_new(key, val)
+
+        # Test Open
+        objs, errs = self.collection.open_many(self.obj.__name__, keys)
+        self.assertEqual(set(keys[:2]), set(objs))
+        self.assertEqual(set(keys[2:]), set(errs))
+        for key, val in zip(keys, vals):
+            self.assertEqual(val, objs[key].get_val())
+        for key in keys[2:]:
+            self.assertIsInstance(errs[key], pcollections.exceptions.ObjectDNE)
+
+        # Cleanup
+        for obj in objs.values():
+            obj.rem()
+
+    def test_create_many(self):
+
+        # Setup Test Vals
+        keys = [self.generate_key() for i in range(4)]
+        vals = [self.generate_val_multi(5) for i in range(4)]
+        existing = self.from_new(keys[0], vals[0])
+
+        # Test Create
+        new_vals = [self.generate_val_multi(5)] + vals[1:]
+        objs, errs = self.collection.create_many(self.obj.__name__, dict(zip(keys, new_vals)))
+        self.assertEqual(set(keys[1:]), set(objs))
+        self.assertEqual(set(keys[:1]), set(errs))
+        self.assertIsInstance(errs[keys[0]], pcollections.exceptions.ObjectExists)
+        self.assertEqual(vals[0], existing.get_val())
+        for key, val in zip(keys[1:], vals[1:]):
+            self.assertEqual(val, objs[key].get_val())
+
+        # Test Bad Val
+        self.assertRaises(TypeError, self.collection.create_many,
+                          self.obj.__name__, {self.generate_key(): None})
+
+        # Cleanup
+        existing.rem()
+        for obj in objs.values():
+            obj.rem()
+
+    def test_get_many(self):
+
+        # Setup Test Vals
+        vals = [self.generate_val_multi(5) for i in range(3)]
+        objs = [self.from_new(self.generate_key(), val) for val in vals]
+        other = self.collection.String(self.generate_key(), create="other", existing=False)
+
+        # Test Good
+        self.assertEqual([], self.collection.get_many([]))
+        rets = self.collection.get_many([objs[2], other, objs[0], objs[1]])
+        self.assertEqual([vals[2], "other", vals[0], vals[1]], rets)
+
+        # Test DNE
+        dne = self.from_raw(self.generate_key())
+        self.assertRaises(pcollections.exceptions.ObjectDNE,
+                          self.collection.get_many, objs + [dne])
+
+        # Test Bad Handle
+        self.assertRaises(TypeError, self.collection.get_many, objs + ["not a handle"])
+
+        # Cleanup
+        other.rem()
+        for obj in objs:
+            obj.rem()
+
+    def test_version(self):
+
+        # Setup Test Vals
+        key = self.generate_key()
+        val = self.generate_val_multi(10)
+
+        # Test DNE
+        self.helper_dne(lambda instance: instance.version())
+        self.helper_dne(lambda instance: instance.get_val_if_changed(None))
+
+        # Test Unchanged
+        instance = self.from_new(key, val)
+        version = instance.version()
+        self.assertEqual((version, val), instance.get_val_versioned())
+        self.assertEqual((version, None), instance.get_val_if_changed(version))
+        self.assertEqual((version, val), instance.get_val_if_changed(version - 1))
+
+        # Test Recreated
+        instance.rem()
+        instance = self.from_new(key, val)
+        self.assertNotEqual(version, instance.version())
+
+        # Cleanup
+        instance.rem()
+
     def test_get_key(self):
 
         # Setup Test Vals
@@ -355,10 +472,14 @@ class MutableMixin(PersistentMixin):
 
         self.assertTrue(instance.exists())
         self.assertEqual(ref, instance.get_val())
+        orig = copy.copy(ref)
+        version = instance.version()
         ref_ret = test_func(ref, *args)
         instance_ret = test_func(instance, *args)
         self.assertEqual(ref_ret, instance_ret)
         self.assertEqual(ref, instance.get_val())
+        if ref != orig:
+            self.assertNotEqual(version, instance.version())
 
     def helper_exp_mutable(self, size, exp_ret, exp_val, test_func, *args):
 
@@ -372,9 +493,12 @@ class MutableMixin(PersistentMixin):
 
         self.assertTrue(instance.exists())
         self.assertEqual(ref, instance.get_val())
+        version = instance.version()
         ret = test_func(instance, *args)
         self.assertEqual(exp_ret, ret)
         self.assertEqual(exp_val, instance.get_val())
+        if exp_val != ref:
+            self.assertNotEqual(version, instance.version())
 
     def test_set_val_empty(self):
 
@@ -568,6 +692,22 @@ class ContainerMixin(PersistentMixin):
             return contains(instance, item)
         self.helper_ab_immutable(10, contains_out)
 
+    def test_contains_pattern(self):
+
+        # Setup Test Vals
+        key = self.generate_key()
+        val = self.generate_val_multi(10)
+
+        # Create Instance
+        instance = self.from_new(key, val)
+
+        # Test Pattern Chars Match Literally
+        self.assertFalse("%" in instance)
+        self.assertFalse(".*" in instance)
+
+        # Cleanup
+        instance.rem()
+
 class IterableMixin(PersistentMixin):
 
     def test_iter(self):
@@ -586,6 +726,26 @@ class IterableMixin(PersistentMixin):
         # Cleanup
         instance.rem()
 
+    def test_iterate_batch(self):
+
+        def iterate(instance, batch):
+            return sorted(instance.iterate(batch))
+
+        # Test DNE
+        self.helper_dne(iterate, 3)
+
+        # Test Good
+        for batch in (1, 3, 10, 11):
+            self.helper_exp_immutable(0, [], iterate, batch)
+            key = self.generate_key()
+            val = self.generate_val_multi(10)
+            instance = self.from_new(key, val)
+            self.assertEqual(sorted(val), iterate(instance, batch))
+            instance.rem()
+
+        # Test Bad Batch
+        self.helper_raises(10, ValueError, iterate, 0)
+
 class SizedMixin(PersistentMixin):
 
     def test_len(self):
@@ -629,6 +789,26 @@ class SequenceMixin(ContainerMixin, IterableMixin, SizedMixin):
         self.helper_raises(10, IndexError, getitem, -11)
         self.helper_raises(10, IndexError, getitem, -12)
 
+    def test_getitem_slice(self):
+
+        def getitem(instance, index):
+            return instance[index]
+
+        # Test DNE
+        self.helper_dne(getitem, slice(0, 1))
+
+        # Test Good
+        bounds = [(None, None), (2, 5), (-3, None), (None, -2), (5, 2),
+                  (0, 0), (-20, 20), (3, -3), (10, 12), (-1, 0)]
+        for start, stop in bounds:
+            self.helper_ab_immutable(10, getitem, slice(start, stop))
+            self.helper_ab_immutable( 0, getitem, slice(start, stop))
+
+        # Test Extended
+        self.helper_ab_immutable(10, getitem, slice(None, None, 2))
+        self.helper_ab_immutable(10, getitem, slice(None, None, -1))
+        self.helper_ab_immutable(10, getitem, slice(8, 1, -3))
+
     def test_index(self):
 
         def index(instance, item):
@@ -757,6 +937,47 @@ class MutableSequenceMixin(SequenceMixin, MutableMixin):
         self.helper_raises(10, IndexError, delitem, -11)
         self.helper_raises(10, IndexError, delitem, -12)
 
+    def test_setitem_slice(self):
+
+        def setitem(instance, idx, item):
+            instance[idx] = item
+
+        # Test DNE
+        item = self.generate_val_multi(2)
+        self.helper_dne(setitem, slice(0, 1), item)
+
+        # Test Good
+        bounds = [(None, None), (2, 5), (-3, None), (None, -2), (5, 2),
+                  (0, 0), (-20, 20), (3, -3), (10, 12)]
+        for start, stop in bounds:
+            for size in (0, 3, 5):
+                item = self.generate_val_multi(size)
+                self.helper_ab_mutable(10, setitem, slice(start, stop), item)
+
+        # Test Extended
+        item = self.generate_val_multi(5)
+        self.helper_ab_mutable(10, setitem, slice(None, None, 2), item)
+        item = self.generate_val_multi(3)
+        self.helper_raises(10, ValueError, setitem, slice(None, None, 2), item)
+
+    def test_delitem_slice(self):
+
+        def delitem(instance, idx):
+            del(instance[idx])
+
+        # Test DNE
+        self.helper_dne(delitem, slice(0, 1))
+
+        # Test Good
+        bounds = [(None, None), (2, 5), (-3, None), (None, -2), (5, 2),
+                  (0, 0), (-20, 20), (3, -3), (10, 12)]
+        for start, stop in bounds:
+            self.helper_ab_mutable(10, delitem, slice(start, stop))
+
+        # Test Extended
+        self.helper_ab_mutable(10, delitem, slice(None, None, 2))
+        self.helper_ab_mutable(10, delitem, slice(8, 1, -3))
+
     def test_insert(self):
 
         def insert(instance, idx, item):
@@ -1092,6 +1313,29 @@ class BaseSetMixin(ComparableMixin, ContainerMixin, IterableMixin, SizedMixin):
 
         self.helper_xor(func_symmetric_difference)
 
+    def test_sample(self):
+
+        def sample(instance, k):
+            return instance.sample(k)
+
+        # Test DNE
+        self.helper_dne(sample, 2)
+
+        # Test Bad K
+        self.helper_raises(10, ValueError, sample, -1)
+
+        # Test Good
+        for size, k in [(10, 0), (10, 3), (10, 10), (3, 5), (0, 2)]:
+            key = self.generate_key()
+            val = self.generate_val_multi(size)
+            instance = self.from_new(key, val)
+            ret = sample(instance, k)
+            self.assertEqual(min(size, k), len(ret))
+            self.assertEqual(len(ret), len(set(ret)))
+            self.assertTrue(set(ret) <= val)
+            self.assertEqual(val, instance.get_val())
+            instance.rem()
+
     def test_isdisjoint(self):
 
         # Setup Test Vals
@@ -1176,7 +1420,8 @@ class MutableBaseSetMixin(MutableMixin, BaseSetMixin):
 
         # Test In
         def discard_in(instance):
-            itm = next(iter(instance))
+            # Set order is unspecified, so pick the same item on both sides
+            itm = min(instance)
             return discard(instance, itm)
         self.helper_ab_mutable(2, discard_in)
         self.helper_ab_mutable(10, discard_in)
@@ -1433,6 +1678,105 @@ class MutableBaseSetMixin(MutableMixin, BaseSetMixin):
         instance_a.rem()
         instance_b.rem()
 
+    def test_add_many(self):
+
+        def add_many(instance, itms):
+            return instance.add_many(itms)
+
+        # Test DNE
+        self.helper_dne(add_many, self.generate_val_multi(2))
+
+        # Test Bad Itm
+        self.helper_raises(10, TypeError, add_many, [None])
+
+        # Test Good
+        key = self.generate_key()
+        val = self.generate_val_multi(10)
+        instance = self.from_new(key, val)
+        new = self.generate_val_multi(5, exclude=val)
+        self.assertEqual(0, add_many(instance, []))
+        self.assertEqual(5, add_many(instance, list(new) + list(val)[:3]))
+        self.assertEqual(val | new, instance.get_val())
+        instance.rem()
+
+    def test_discard_many(self):
+
+        def discard_many(instance, itms):
+            return instance.discard_many(itms)
+
+        # Test DNE
+        self.helper_dne(discard_many, self.generate_val_multi(2))
+
+        # Test Good
+        key = self.generate_key()
+        val = self.generate_val_multi(10)
+        instance = self.from_new(key, val)
+        gone = set(list(val)[:4])
+        other = self.generate_val_multi(3, exclude=val)
+        self.assertEqual(0, discard_many(instance, []))
+        self.assertEqual(4, discard_many(instance, gone | other))
+        self.assertEqual(val - gone, instance.get_val())
+        instance.rem()
+
+    def test_pop_n(self):
+
+        def pop_n(instance, count):
+            return instance.pop_n(count)
+
+        # Test DNE
+        self.helper_dne(pop_n, 2)
+
+        # Test Bad Count
+        self.helper_raises(10, ValueError, pop_n, -1)
+
+        # Test Good
+        for size, count in [(10, 0), (10, 3), (10, 10), (3, 5), (0, 2)]:
+            key = self.generate_key()
+            val = self.generate_val_multi(size)
+            instance = self.from_new(key, val)
+            ret = pop_n(instance, count)
+            self.assertEqual(min(size, count), len(ret))
+            self.assertTrue(ret <= val)
+            self.assertEqual(val - ret, instance.get_val())
+            instance.rem()
+
+    def test_inplace_local(self):
+
+        def ior(instance, other):
+            instance |= other
+            self.assertIsNotNone(instance)
+
+        def iand(instance, other):
+            instance &= other
+            self.assertIsNotNone(instance)
+
+        def ixor(instance, other):
+            instance ^= other
+            self.assertIsNotNone(instance)
+
+        def isub(instance, other):
+            instance -= other
+            self.assertIsNotNone(instance)
+
+        extra = self.generate_val_multi(3)
+
+        def overlap(func):
+            def test_func(instance):
+                other = set(sorted(instance)[:5]) | extra
+                return func(instance, other)
+            return test_func
+
+        for func in [ior, iand, ixor, isub]:
+
+            # Test DNE
+            self.helper_dne(func, extra)
+
+            # Test Overlap
+            self.helper_ab_mutable(10, overlap(func))
+
+            # Test Empty
+            self.helper_ab_mutable(10, func, set())
+
 class MappingMixin(EqualityMixin, ContainerMixin, IterableMixin, SizedMixin):
 
     def test_getitem(self):
@@ -1492,6 +1836,30 @@ class MappingMixin(EqualityMixin, ContainerMixin, IterableMixin, SizedMixin):
         # Cleanup
         instance.rem()
 
+    def test_get_many(self):
+
+        def get_many(instance, keys, *args):
+            return instance.get_many(keys, *args)
+
+        # Test DNE
+        self.helper_dne(get_many, ["key_a"])
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = {"key_a": "val_a", "key_b": "val_b", "key_c": "val_c"}
+        instance = self.from_new(i_key, i_val)
+
+        # Test Keys
+        keys = ["key_b", "key_d", "key_a"]
+        self.assertEqual(["val_b", None, "val_a"], get_many(instance, keys))
+        self.assertEqual(["val_b", "val_x", "val_a"], get_many(instance, keys, "val_x"))
+        self.assertEqual([], get_many(instance, []))
+        self.assertRaises(TypeError, get_many, instance, [None])
+        self.assertEqual(i_val, instance.get_val())
+
+        # Cleanup
+        instance.rem()
+
     def test_keys(self):
 
         def keys(instance):
@@ -1545,6 +1913,43 @@ class MappingMixin(EqualityMixin, ContainerMixin, IterableMixin, SizedMixin):
 
 class MutableMappingMixin(MutableMixin, MappingMixin):
 
+    def test_delete_many(self):
+
+        def delete_many(instance, keys):
+            return instance.delete_many(keys)
+
+        # Test DNE
+        self.helper_dne(delete_many, ["key_a"])
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = {"key_a": "val_a", "key_b": "val_b", "key_c": "val_c"}
+        instance = self.from_new(i_key, i_val)
+
+        # Test Keys
+        self.assertEqual(0, delete_many(instance, []))
+        self.assertEqual(2, delete_many(instance, ["key_a", "key_c", "key_d"]))
+        self.assertEqual({"key_b": "val_b"}, instance.get_val())
+
+        # Cleanup
+        instance.rem()
+
+    def test_update_large(self):
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = {"key_{:d}".format(i): "val" for i in range(10)}
+        instance = self.from_new(i_key, i_val)
+
+        # Test Update Across Chunks
+        delta = {"key_{:d}".format(i): "new" for i in range(5, 2500)}
+        instance.update(delta)
+        i_val.update(delta)
+        self.assertEqual(i_val, instance.get_val())
+
+        # Cleanup
+        instance.rem()
+
     def test_setitem(self):
 
         def setitem(instance, key, val):
@@ -1820,6 +2225,54 @@ class StringMixin(SequenceMixin):
 
         return val.encode(pcollections.constants.ENCODING)
 
+    def test_len_unicode(self):
+
+        # Setup Test Vals
+        key = self.generate_key()
+        val = "\u00e9t\u00e9 \u2603"
+
+        # Create Instance
+        instance = self.from_new(key, val)
+
+        # Test Len
+        self.assertEqual(len(val), len(instance))
+        self.assertTrue(instance)
+
+        # Cleanup
+        instance.rem()
+
+    def test_getitem_unicode(self):
+
+        # Setup Test Vals
+        key = self.generate_key()
+        val = "\u00e9t\u00e9 \u2603"
+
+        # Create Instance
+        instance = self.from_new(key, val)
+
+        # Test Getitem
+        for i in range(len(val)):
+            self.assertEqual(val[i], instance[i])
+            self.assertEqual(val[i-len(val)], instance[i-len(val)])
+        self.assertRaises(IndexError, instance.__getitem__, len(val))
+        self.assertRaises(IndexError, instance.__getitem__, -len(val)-1)
+
+        # Test Slice
+        for start, stop in [(None, None), (1, 3), (-3, None), (None, -1), (2, 2)]:
+            self.assertEqual(val[start:stop], instance[start:stop])
+
+        # Test Iterate Across Split Characters
+        for batch in (1, 2, 3):
+            self.assertEqual(list(val), list(instance.iterate(batch)))
+
+        # Test Contains
+        self.assertTrue("t\u00e9" in instance)
+        self.assertTrue("" in instance)
+        self.assertFalse("\u00e9\u00e9" in instance)
+
+        # Cleanup
+        instance.rem()
+
 class MutableStringMixin(MutableSequenceMixin, StringMixin):
 
     class MutableStringRef(collections.MutableSequence, native_str):
@@ -1899,6 +2352,12 @@ class MutableStringMixin(MutableSequenceMixin, StringMixin):
         def __setitem__(self, idx, item):
             """Set Seq Item"""
 
+            if isinstance(idx, slice):
+                chars = list(self._get_val())
+                chars[idx] = list(item)
+                self._set_val("".join(chars))
+                return
+
             val_in = self._get_val()
             val_out = ""
             if (idx != 0) and (idx != -len(val_in)):
@@ -1911,6 +2370,12 @@ class MutableStringMixin(MutableSequenceMixin, StringMixin):
         def __delitem__(self, idx):
             """Del Seq Item"""
 
+            if isinstance(idx, slice):
+                chars = list(self._get_val())
+                del(chars[idx])
+                self._set_val("".join(chars))
+                return
+
             val_in = self._get_val()
             val_out = ""
             if (idx != 0) and (idx != -len(val_in)):
@@ -1960,6 +2425,48 @@ class MutableStringMixin(MutableSequenceMixin, StringMixin):
             cnt -= 1
         return sorted(vals)
 
+    def test_edit_unicode(self):
+
+        # Setup Test Vals
+        key = self.generate_key()
+        val = "h\u00e9llo \u2603"
+
+        # Create Instance
+        instance = self.from_new(key, val)
+        ref = list(val)
+
+        # Test Setitem
+        for idx, itm in ((1, "x"), (2, "\u00e9"), (-1, "s"), (0, "\u2603"), (-2, "\u00df")):
+            instance[idx] = itm
+            ref[idx] = itm
+            self.assertEqual("".join(ref), instance.get_val())
+        self.assertRaises(IndexError, instance.__setitem__, len(ref), "x")
+
+        # Test Insert
+        for idx, itm in ((2, "Z"), (1, "\u00e9"), (-1, "\u2603"), (100, "e"), (-100, "\u00e8")):
+            instance.insert(idx, itm)
+            ref.insert(idx, itm)
+            self.assertEqual("".join(ref), instance.get_val())
+
+        # Test Pop and Del
+        for idx in (1, -2, 0, 3):
+            self.assertEqual(ref.pop(idx), instance.pop(idx))
+            self.assertEqual("".join(ref), instance.get_val())
+        self.assertEqual(ref.pop(), instance.pop())
+        del(ref[2])
+        del(instance[2])
+        self.assertEqual("".join(ref), instance.get_val())
+        self.assertRaises(IndexError, instance.pop, len(ref))
+
+        # Test Remove
+        instance.remove("\u00e9")
+        ref.remove("\u00e9")
+        self.assertEqual("".join(ref), instance.get_val())
+        self.assertEqual(len(ref), len(instance))
+
+        # Cleanup
+        instance.rem()
+
 class ListMixin(SequenceMixin):
 
     def __init__(self, *args, **kwargs):
@@ -2008,57 +2515,198 @@ class MutableListMixin(MutableSequenceMixin, ListMixin):
         super(MutableListMixin, self).__init__(*args, **kwargs)
         self.obj = self.collection.MutableList
 
-class SetMixin(BaseSetMixin):
+class IntArrayMixin(SequenceMixin):
+
+    typecode = pcollections.be_redis_base.IntArray._TYPECODE
 
     def __init__(self, *args, **kwargs):
-        super(SetMixin, self).__init__(*args, **kwargs)
-        self.obj = self.collection.Set
+        super(IntArrayMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.IntArray
+
+    def convert_val(self, cnt):
+        return cnt - 50
 
     def generate_val_single(self, exclude=None):
 
         if exclude is None:
             exclude = []
         while True:
-            val = self.val_cnt
+            val = self.convert_val(self.val_cnt)
             if val not in exclude:
                 self.val_cnt += 1
                 break
-        return str(val)
+        return val
 
     def generate_val_multi(self, size, exclude=None):
 
-        val = []
+        val = array.array(self.typecode)
         while size:
             val.append(self.generate_val_single(exclude=exclude))
             size -= 1
-        return set(val)
+        return val
 
     def generate_vals_sorted(self, size, cnt):
 
-        del(size)
         vals = []
-        base = []
         while cnt:
-            base.append(self.generate_val_single())
-            vals.append(set(base))
+            val = self.generate_val_multi(size)
+            vals.append(val)
             cnt -= 1
-        return vals
+        return sorted(vals)
 
-    def convert_bytes(self, val_in):
+    def test_packed(self):
 
-        val_out = set()
-        for item in val_in:
-            item = bytes(item.encode(pcollections.constants.ENCODING))
-            val_out.add(item)
-        return val_out
+        # Setup Test Vals
+        key = self.generate_key()
+        val = self.generate_val_multi(10)
 
-class MutableSetMixin(MutableBaseSetMixin, SetMixin):
+        # Create Instance
+        instance = self.from_new(key, val)
 
-    def __init__(self, *args, **kwargs):
-        super(MutableSetMixin, self).__init__(*args, **kwargs)
-        self.obj = self.collection.MutableSet
+        # Test Storage
+        raw = self.collection.backend.driver.redis.get(instance._redis_key)
+        self.assertEqual(len(val) * val.itemsize, len(raw))
+        self.assertIsInstance(instance.get_val(), array.array)
 
-class DictionaryMixin(MappingMixin):
+        # Test View
+        view = instance.get_view()
+        self.assertEqual(val.tolist(), view.tolist())
+        if isinstance(view, memoryview):
+            self.assertTrue(view.readonly)
+
+        # Test Bad Vals
+        self.assertRaises(TypeError, self.from_new, self.generate_key(), "abc")
+        self.assertRaises(TypeError, self.from_new, self.generate_key(), ["a"])
+        backend = self.collection.backend
+        self.assertRaises(TypeError, backend.module.IntArray, backend.driver,
+                          self.generate_key(), codec=pcollections.codecs.JsonCodec())
+
+        # Cleanup
+        instance.rem()
+
+class MutableArrayMixin(MutableSequenceMixin):
+
+    def test_extend(self):
+
+        def extend(instance, seq):
+            return instance.extend(seq)
+
+        # Test DNE
+        seq = self.generate_val_multi(1)
+        self.helper_dne(extend, seq)
+
+        # Test Single: Numbers are not Sequences
+        itm = self.generate_val_single()
+        self.helper_raises(10, TypeError, extend, itm)
+
+        # Test Seq
+        for cnt in range(5):
+            seq = self.generate_val_multi(cnt)
+            self.helper_ab_mutable(10, extend, seq)
+
+    def test_iadd(self):
+
+        def iadd(instance, other):
+            instance += other
+            self.assertIsNotNone(instance)
+
+        # Test DNE
+        seq = self.generate_val_multi(1)
+        self.helper_dne(iadd, seq)
+
+        # Test Single: Numbers are not Sequences
+        itm = self.generate_val_single()
+        self.helper_raises(10, TypeError, iadd, itm)
+
+        # Test Seq
+        for cnt in range(5):
+            seq = self.generate_val_multi(cnt)
+            self.helper_ab_mutable(10, iadd, seq)
+
+    def test_setitem_slice_inplace(self):
+
+        def setitem(instance, idx, seq):
+            instance[idx] = seq
+
+        # Test Equal and Unequal Lengths
+        self.helper_ab_mutable(10, setitem, slice(2, 5), self.generate_val_multi(3))
+        self.helper_ab_mutable(10, setitem, slice(-3, None), self.generate_val_multi(1))
+        self.helper_ab_mutable(10, setitem, slice(8, 20), self.generate_val_multi(4))
+
+class MutableIntArrayMixin(MutableArrayMixin, IntArrayMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(MutableIntArrayMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.MutableIntArray
+
+class FloatArrayMixin(IntArrayMixin):
+
+    typecode = native_str("d")
+
+    def __init__(self, *args, **kwargs):
+        super(FloatArrayMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.FloatArray
+
+    def convert_val(self, cnt):
+        return (cnt - 50) / 4.0
+
+class MutableFloatArrayMixin(MutableArrayMixin, FloatArrayMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(MutableFloatArrayMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.MutableFloatArray
+
+class SetMixin(BaseSetMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(SetMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.Set
+
+    def generate_val_single(self, exclude=None):
+
+        if exclude is None:
+            exclude = []
+        while True:
+            val = self.val_cnt
+            if val not in exclude:
+                self.val_cnt += 1
+                break
+        return str(val)
+
+    def generate_val_multi(self, size, exclude=None):
+
+        val = []
+        while size:
+            val.append(self.generate_val_single(exclude=exclude))
+            size -= 1
+        return set(val)
+
+    def generate_vals_sorted(self, size, cnt):
+
+        del(size)
+        vals = []
+        base = []
+        while cnt:
+            base.append(self.generate_val_single())
+            vals.append(set(base))
+            cnt -= 1
+        return vals
+
+    def convert_bytes(self, val_in):
+
+        val_out = set()
+        for item in val_in:
+            item = bytes(item.encode(pcollections.constants.ENCODING))
+            val_out.add(item)
+        return val_out
+
+class MutableSetMixin(MutableBaseSetMixin, SetMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(MutableSetMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.MutableSet
+
+class DictionaryMixin(MappingMixin):
 
     def __init__(self, *args, **kwargs):
         super(DictionaryMixin, self).__init__(*args, **kwargs)
@@ -2111,3 +2759,890 @@ class MutableDictionaryMixin(MutableMappingMixin, DictionaryMixin):
     def __init__(self, *args, **kwargs):
         super(MutableDictionaryMixin, self).__init__(*args, **kwargs)
         self.obj = self.collection.MutableDictionary
+
+class CounterMixin(EqualityMixin, ContainerMixin, IterableMixin, SizedMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(CounterMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.Counter
+
+    def generate_val_single(self, exclude=None):
+
+        TEST_MAP_KEY_PRE_STRING = "TESTCOUNTKEY"
+
+        if exclude is None:
+            exclude = []
+        while True:
+            map_key = TEST_MAP_KEY_PRE_STRING + str(self.val_cnt)
+            map_val = (self.val_cnt % 7) - 2
+            if map_key not in exclude:
+                self.val_cnt += 1
+                break
+        return (map_key, map_val)
+
+    def generate_val_multi(self, size, exclude=None):
+
+        multi = collections.Counter()
+        while size:
+            map_key, map_val = self.generate_val_single(exclude=exclude)
+            multi[map_key] = map_val
+            size -= 1
+        return multi
+
+    def test_getitem(self):
+
+        def getitem(instance, key):
+            return instance[key]
+
+        # Test DNE
+        self.helper_dne(getitem, "key_a")
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Good Keys
+        for k in i_val:
+            self.helper_ab_immutable_core(instance, i_val, getitem, k)
+
+        # Test Missing Keys Count Zero
+        self.helper_ab_immutable_core(instance, i_val, getitem, "key_x")
+        self.helper_exp_immutable_core(instance, i_val, 0, getitem, None)
+
+        # Cleanup
+        instance.rem()
+
+    def test_get(self):
+
+        def get(instance, key, *args):
+            return instance.get(key, *args)
+
+        # Test DNE
+        self.helper_dne(get, "key_a")
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Keys
+        for k in i_val:
+            self.helper_ab_immutable_core(instance, i_val, get, k)
+        self.helper_ab_immutable_core(instance, i_val, get, "key_x")
+        self.helper_ab_immutable_core(instance, i_val, get, "key_x", 5)
+        self.helper_ab_immutable_core(instance, i_val, get, None, 5)
+
+        # Cleanup
+        instance.rem()
+
+    def test_get_many(self):
+
+        def get_many(instance, keys, *args):
+            return instance.get_many(keys, *args)
+
+        # Test DNE
+        self.helper_dne(get_many, ["key_a"])
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = collections.Counter({"key_a": 3, "key_b": -1})
+        instance = self.from_new(i_key, i_val)
+
+        # Test Keys
+        keys = ["key_b", "key_d", "key_a"]
+        self.assertEqual([-1, 0, 3], get_many(instance, keys))
+        self.assertEqual([-1, None, 3], get_many(instance, keys, None))
+        self.assertEqual([], get_many(instance, []))
+
+        # Cleanup
+        instance.rem()
+
+    def test_most_common(self):
+
+        def most_common(instance, *args):
+            return instance.most_common(*args)
+
+        # Test DNE
+        self.helper_dne(most_common)
+
+        # Create Instance with Distinct Counts
+        i_key = self.generate_key()
+        i_val = collections.Counter({"key_{:d}".format(i): (i * 3) - 10 for i in range(10)})
+        instance = self.from_new(i_key, i_val)
+
+        # Test Good
+        self.helper_ab_immutable_core(instance, i_val, most_common)
+        for n in (0, 1, 3, 10, 20):
+            self.helper_ab_immutable_core(instance, i_val, most_common, n)
+
+        # Cleanup
+        instance.rem()
+
+    def test_elements(self):
+
+        def elements(instance):
+            return sorted(instance.elements())
+
+        # Test DNE
+        self.helper_dne(elements)
+
+        # Test Good
+        self.helper_ab_immutable(0, elements)
+        self.helper_ab_immutable(10, elements)
+
+    def test_total(self):
+
+        def total(instance):
+            return instance.total()
+
+        # Test DNE
+        self.helper_dne(total)
+
+        # Test Good
+        for size in (0, 10):
+            key = self.generate_key()
+            val = self.generate_val_multi(size)
+            instance = self.from_new(key, val)
+            self.helper_exp_immutable_core(instance, val, sum(val.values()), total)
+            instance.rem()
+
+    def test_counts(self):
+
+        # Test Floats
+        val = collections.Counter({"key_a": 1.5, "key_b": -2, "key_c": 1e100})
+        instance = self.from_new(self.generate_key(), val)
+        self.assertEqual(val, instance.get_val())
+        self.assertIsInstance(instance["key_a"], float)
+        self.assertIsInstance(instance["key_b"], int)
+        instance.rem()
+
+        # Test Bad Counts
+        self.assertRaises(TypeError, self.from_new, self.generate_key(), {"key_a": "1"})
+        self.assertRaises(TypeError, self.from_new, self.generate_key(), {"key_a": True})
+        self.assertRaises(TypeError, self.from_new, self.generate_key(), {"key_a": None})
+
+        # Test Key Codec
+        instance = self.collection.Counter(self.generate_key(), create={1: 2, (3, 4): 5},
+                                           existing=False,
+                                           codec=pcollections.codecs.PickleCodec())
+        self.assertEqual(collections.Counter({1: 2, (3, 4): 5}), instance.get_val())
+        self.assertEqual(5, instance[(3, 4)])
+        instance.rem()
+
+class MutableCounterMixin(MutableMixin, CounterMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(MutableCounterMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.MutableCounter
+
+    def test_incr(self):
+
+        def incr(instance, key, *args):
+            if isinstance(instance, collections.Counter):
+                instance[key] += args[0] if args else 1
+                return instance[key]
+            return instance.incr(key, *args)
+
+        # Test DNE
+        self.helper_dne(incr, "key_a")
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Existing and New Keys
+        for k in list(i_val)[:3] + ["key_x", "key_y"]:
+            self.helper_ab_mutable_core(instance, i_val, incr, k)
+            self.helper_ab_mutable_core(instance, i_val, incr, k, 10)
+            self.helper_ab_mutable_core(instance, i_val, incr, k, -25)
+
+        # Test Floats, Returning to Integers
+        self.assertEqual(0.5, incr(instance, "key_f", 0.5))
+        self.assertEqual(1.5, incr(instance, "key_f", 1))
+        self.assertEqual(2, incr(instance, "key_f", 0.5))
+        self.assertEqual(3, incr(instance, "key_f"))
+
+        # Test Bad Amounts
+        self.assertRaises(TypeError, incr, instance, "key_a", "1")
+        self.assertRaises(TypeError, incr, instance, "key_a", None)
+
+        # Cleanup
+        instance.rem()
+
+    def test_update(self):
+
+        def update(instance, *args):
+            instance.update(*args)
+
+        def update_kwargs(instance, kwargs):
+            instance.update(**kwargs)
+
+        # Test DNE
+        self.helper_dne(update, ["key_a"])
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        keys = list(i_val)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Iterable
+        self.helper_ab_mutable_core(instance, i_val, update, keys[:3] + keys[:1] + ["key_x"])
+        self.helper_ab_mutable_core(instance, i_val, update, [])
+
+        # Test Mapping
+        self.helper_ab_mutable_core(instance, i_val, update, {keys[0]: 5, "key_y": -3})
+        self.helper_ab_mutable_core(instance, i_val, update, collections.Counter(keys[1:4]))
+        self.helper_ab_mutable_core(instance, i_val, update, {"key_z": 0.5})
+
+        # Test Kwargs
+        self.helper_ab_mutable_core(instance, i_val, update_kwargs, {"key_x": 2, "key_w": 1})
+
+        # Test Bad Counts
+        self.helper_raises_core(instance, i_val, TypeError, update, {"key_a": "1"})
+
+        # Cleanup
+        instance.rem()
+
+    def test_update_large(self):
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = collections.Counter({"key_{:d}".format(i): 1 for i in range(10)})
+        instance = self.from_new(i_key, i_val)
+
+        # Test Update Across Chunks
+        delta = ["key_{:d}".format(i % 2500) for i in range(5000)]
+        instance.update(delta)
+        i_val.update(delta)
+        self.assertEqual(i_val, instance.get_val())
+
+        # Cleanup
+        instance.rem()
+
+    def test_subtract(self):
+
+        def subtract(instance, *args):
+            instance.subtract(*args)
+
+        def subtract_kwargs(instance, kwargs):
+            instance.subtract(**kwargs)
+
+        # Test DNE
+        self.helper_dne(subtract, ["key_a"])
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        keys = list(i_val)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Iterable
+        self.helper_ab_mutable_core(instance, i_val, subtract, keys[:3] + keys[:1] + ["key_x"])
+
+        # Test Mapping
+        self.helper_ab_mutable_core(instance, i_val, subtract, {keys[0]: 5, "key_y": -3})
+
+        # Test Kwargs
+        self.helper_ab_mutable_core(instance, i_val, subtract_kwargs, {"key_x": 2})
+
+        # Cleanup
+        instance.rem()
+
+    def test_setitem(self):
+
+        def setitem(instance, key, val):
+            instance[key] = val
+
+        # Test DNE
+        self.helper_dne(setitem, "key_a", 1)
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Existing and New Keys
+        for k in list(i_val)[:3] + ["key_x"]:
+            self.helper_ab_mutable_core(instance, i_val, setitem, k, 42)
+            self.helper_ab_mutable_core(instance, i_val, setitem, k, -0.25)
+
+        # Test Bad Count
+        self.helper_raises_core(instance, i_val, TypeError, setitem, "key_a", "1")
+
+        # Cleanup
+        instance.rem()
+
+    def test_delitem(self):
+
+        def delitem(instance, key):
+            del(instance[key])
+
+        # Test DNE
+        self.helper_dne(delitem, "key_a")
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Existing and Missing Keys
+        for k in list(i_val)[:3] + ["key_x"]:
+            self.helper_ab_mutable_core(instance, i_val, delitem, k)
+
+        # Cleanup
+        instance.rem()
+
+    def test_pop(self):
+
+        def pop(instance, key, *args):
+            return instance.pop(key, *args)
+
+        # Test DNE
+        self.helper_dne(pop, "key_a")
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Keys
+        for k in list(i_val)[:3]:
+            self.helper_ab_mutable_core(instance, i_val, pop, k)
+        self.helper_ab_mutable_core(instance, i_val, pop, "key_x", 7)
+        self.helper_raises_core(instance, i_val, KeyError, pop, "key_x")
+
+        # Cleanup
+        instance.rem()
+
+    def test_setdefault(self):
+
+        def setdefault(instance, key, default):
+            return instance.setdefault(key, default)
+
+        # Test DNE
+        self.helper_dne(setdefault, "key_a", 1)
+
+        # Create Instance
+        i_key = self.generate_key()
+        i_val = self.generate_val_multi(10)
+        instance = self.from_new(i_key, i_val)
+
+        # Test Existing and New Keys
+        self.helper_ab_mutable_core(instance, i_val, setdefault, list(i_val)[0], 9)
+        self.helper_ab_mutable_core(instance, i_val, setdefault, "key_x", 9)
+
+        # Cleanup
+        instance.rem()
+
+class IntegerMixin(ComparableMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(IntegerMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.Integer
+
+    def generate_val_single(self, exclude=None):
+        return self.generate_val_multi(1, exclude=exclude)
+
+    def generate_val_multi(self, size, exclude=None):
+
+        # Sizes map to magnitudes, so size 0 is 0
+        if exclude is None:
+            exclude = []
+        if size == 0:
+            return 0
+        while True:
+            val = (size * 1000) + self.val_cnt
+            self.val_cnt += 1
+            if val not in exclude:
+                break
+        return -val if (val % 2) else val
+
+    def generate_vals_sorted(self, size, cnt):
+
+        vals = []
+        while cnt:
+            vals.append(self.generate_val_multi(size))
+            cnt -= 1
+        return sorted(vals)
+
+    def helper_val_size(self, val):
+        return abs(val)
+
+    def test_int(self):
+
+        # Create Instance
+        val = self.generate_val_multi(10)
+        instance = self.from_new(self.generate_key(), val)
+
+        # Test Conversions
+        self.assertEqual(val, int(instance))
+        self.assertEqual(val, operator.index(instance))
+        self.assertEqual(str(val), str(instance))
+
+        # Test Not a Container
+        self.assertRaises(TypeError, len, instance)
+        self.assertRaises(TypeError, iter, instance)
+        self.assertRaises(TypeError, lambda: val in instance)
+
+        # Cleanup
+        instance.rem()
+
+    def test_bad_vals(self):
+
+        # Test Bad Vals
+        for val in ("1", 1.5, True, [1]):
+            self.assertRaises(TypeError, self.from_new, self.generate_key(), val)
+
+        # Test Codec
+        backend = self.collection.backend
+        self.assertRaises(TypeError, backend.module.Integer, backend.driver,
+                          self.generate_key(), codec=pcollections.codecs.IntCodec())
+
+class AtomicIntegerMixin(MutableMixin, IntegerMixin):
+
+    def __init__(self, *args, **kwargs):
+        super(AtomicIntegerMixin, self).__init__(*args, **kwargs)
+        self.obj = self.collection.AtomicInteger
+
+    def test_set_val_empty(self):
+
+        def test_func(instance, new_val):
+            instance.set_val(new_val)
+
+        # Test Good
+        self.helper_dne(test_func, 0)
+        self.helper_exp_mutable(10, None, 0, test_func, 0)
+
+        # Test Bad
+        self.helper_raises(0, TypeError, test_func, None)
+
+    def test_set_val_nonempty(self):
+
+        def test_func(instance, new_val):
+            instance.set_val(new_val)
+
+        # Test Good
+        new_val = self.generate_val_multi(10)
+        self.helper_dne(test_func, new_val)
+        self.helper_exp_mutable(0, None, new_val, test_func, new_val)
+
+        # Test Bad
+        self.helper_raises(10, TypeError, test_func, 1.5)
+
+    def test_incr(self):
+
+        def incr(instance, *args):
+            return instance.incr(*args)
+
+        # Test DNE
+        self.helper_dne(incr)
+
+        # Create Instance
+        val = self.generate_val_multi(10)
+        instance = self.from_new(self.generate_key(), val)
+
+        # Test Good
+        for args, delta in (((), 1), ((7,), 7), ((-7,), -7), ((10**12,), 10**12)):
+            self.helper_exp_mutable_core(instance, val, val + delta, val + delta, incr, *args)
+            val += delta
+
+        # Test Bad
+        for amount in ("1", 1.5, True, None):
+            self.helper_raises_core(instance, val, TypeError, incr, amount)
+
+        # Cleanup
+        instance.rem()
+
+    def test_decr(self):
+
+        def decr(instance, *args):
+            return instance.decr(*args)
+
+        # Test DNE
+        self.helper_dne(decr)
+
+        # Create Instance
+        val = self.generate_val_multi(10)
+        instance = self.from_new(self.generate_key(), val)
+
+        # Test Good
+        for args, delta in (((), 1), ((7,), 7), ((-7,), -7)):
+            self.helper_exp_mutable_core(instance, val, val - delta, val - delta, decr, *args)
+            val -= delta
+
+        # Test Bad
+        for amount in ("1", 1.5, True, None):
+            self.helper_raises_core(instance, val, TypeError, decr, amount)
+
+        # Cleanup
+        instance.rem()
+
+    def test_iadd_isub(self):
+
+        # Create Instance
+        val = self.generate_val_multi(10)
+        instance = self.from_new(self.generate_key(), val)
+        orig = instance
+
+        # Test In-Place Ops
+        instance += 5
+        self.assertIs(orig, instance)
+        self.assertEqual(val + 5, instance.get_val())
+        instance -= 8
+        self.assertIs(orig, instance)
+        self.assertEqual(val - 3, instance.get_val())
+
+        # Cleanup
+        instance.rem()
+
+class AtomicIncrMixin(object):
+
+    def test_incr_concurrent(self):
+
+        # Create Instances
+        counter = self.collection.MutableCounter(self.generate_key(), create={}, existing=False)
+        integer = self.collection.AtomicInteger(self.generate_key(), create=0, existing=False)
+        errors = []
+
+        # Each thread increments the same counts
+        def worker():
+            try:
+                for i in range(50):
+                    counter.incr("key_a")
+                    counter.update(["key_a", "key_b"])
+                    integer.incr()
+            except Exception as err:
+                errors.append(err)
+
+        # Run Threads
+        threads = [threading.Thread(target=worker) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Test No Increments Lost
+        self.assertEqual([], errors)
+        self.assertEqual(collections.Counter({"key_a": 800, "key_b": 400}), counter.get_val())
+        self.assertEqual(400, integer.get_val())
+
+        # Test Increments Bump Versions
+        versions = (counter.version(), integer.version())
+        counter.incr("key_a")
+        integer.decr()
+        self.assertNotEqual(versions[0], counter.version())
+        self.assertNotEqual(versions[1], integer.version())
+
+        # Cleanup
+        counter.rem()
+        integer.rem()
+
+
+### Codec Mixins ###
+
+class CodecMixin(object):
+
+    def helper_codec(self, codec, lst_val, set_val, dct_val):
+
+        # Create Instances
+        lst = self.collection.MutableList(self.generate_key(), create=lst_val,
+                                          existing=False, codec=codec)
+        st = self.collection.MutableSet(self.generate_key(), create=set_val,
+                                        existing=False, codec=codec)
+        dct = self.collection.MutableDictionary(self.generate_key(), create=dct_val,
+                                                existing=False, codec=codec)
+
+        # Test Round Trip
+        self.assertEqual(lst_val, lst.get_val())
+        self.assertEqual(set_val, st.get_val())
+        self.assertEqual(dct_val, dct.get_val())
+
+        # Test Items
+        self.assertEqual(lst_val[-1], lst[-1])
+        self.assertTrue(lst_val[0] in lst)
+        for itm in set_val:
+            self.assertTrue(itm in st)
+        for key, val in viewitems(dct_val):
+            self.assertTrue(key in dct)
+            self.assertEqual(val, dct[key])
+
+        # Test Mutations
+        lst.append(lst_val[0])
+        self.assertEqual(lst_val + lst_val[:1], lst.get_val())
+        self.assertEqual(lst_val[0], lst.pop())
+        itm = next(iter(set_val))
+        st.discard(itm)
+        self.assertFalse(itm in st)
+        st.add(itm)
+        self.assertEqual(set_val, st.get_val())
+        key = next(iter(dct_val))
+        del(dct[key])
+        self.assertFalse(key in dct)
+        dct.update({key: dct_val[key]})
+        self.assertEqual(dct_val, dct.get_val())
+
+        # Cleanup
+        lst.rem()
+        st.rem()
+        dct.rem()
+
+    def test_codec_mixed_sets(self):
+
+        # Create Instances
+        json_codec = pcollections.codecs.JsonCodec()
+        a_key = self.generate_key()
+        b_key = self.generate_key()
+        c_key = self.generate_key()
+        a = self.collection.MutableSet(a_key, create={"x", "y"}, existing=False)
+        b = self.collection.MutableSet(b_key, create={"x", "z"}, existing=False,
+                                       codec=json_codec)
+        c = self.collection.MutableSet(c_key, create={"x"}, existing=False,
+                                       codec=pcollections.codecs.JsonCodec())
+
+        # Test Operators Compare Items, Not Stored Bytes
+        self.assertEqual({"x"}, a & b)
+        self.assertEqual({"x", "y", "z"}, a | b)
+        self.assertEqual({"y", "z"}, a ^ b)
+        self.assertEqual({"y"}, a - b)
+        self.assertEqual({"x"}, a.intersection(b))
+        self.assertEqual({"x", "y", "z"}, a.union(b))
+        self.assertEqual({"y", "z"}, a.symmetric_difference(b))
+        self.assertEqual({"y"}, a.difference(b))
+        self.assertFalse(a.isdisjoint(b))
+        self.assertFalse(a.issubset(b))
+        self.assertFalse(a.issuperset(b))
+        self.assertTrue(c.issubset(a))
+        self.assertTrue(a.issuperset(c))
+        self.assertFalse(c.isdisjoint(a))
+
+        # Test Equal Codecs Still Match
+        self.assertEqual(json_codec, c.codec)
+        self.assertEqual({"x"}, b & c)
+        self.assertTrue(c.issubset(b))
+
+        # Test In-Place Operators Re-Encode Items
+        for op, ref in ((operator.ior, {"x", "y", "z"}), (operator.iand, {"x"}),
+                        (operator.ixor, {"y", "z"}), (operator.isub, {"y"})):
+            a.set_val({"x", "y"})
+            self.assertIs(a, op(a, b))
+            self.assertEqual(ref, a.get_val())
+            other = self.collection.MutableSet(a_key, existing=True)
+            self.assertEqual(ref, other.get_val())
+        self.assertEqual({"x", "z"}, b.get_val())
+
+        # Cleanup
+        a.rem()
+        b.rem()
+        c.rem()
+
+    def test_codec_utf8(self):
+
+        codec = pcollections.codecs.Utf8Codec()
+        self.helper_codec(codec, ["a", "\u00e9"], {"a", "b"}, {"a": "1", "b": "\u00e9"})
+        self.assertRaises(TypeError, codec.encode, 1)
+
+    def test_codec_json(self):
+
+        codec = pcollections.codecs.JsonCodec()
+        self.helper_codec(codec, [1, "a", None, [1, {"b": 2.5}], {"c": True}],
+                          {1, "a", None, 2.5}, {"a": [1, 2], "1": {"b": None, "c": "d"}})
+        self.assertEqual(codec.encode({"b": 1, "a": 2}), codec.encode({"a": 2, "b": 1}))
+        self.assertRaises(TypeError, codec.encode, object())
+        self.assertRaises(TypeError, codec.encode, {1j: 1})
+
+    def test_codec_pickle(self):
+
+        codec = pcollections.codecs.PickleCodec()
+        self.helper_codec(codec, [(1, "a"), 2.5, None, ["b"]], {(1, "a"), 2, "b"},
+                          {(1, 2): [3], "a": {"b": 4}})
+
+    @unittest.skipIf(pcollections.codecs.msgpack is None, "msgpack not installed")
+    def test_codec_msgpack(self):
+
+        codec = pcollections.codecs.MsgpackCodec()
+        self.helper_codec(codec, [1, "a", None, b"b", [2.5]], {1, "a", b"b"},
+                          {"a": [1, 2], 1: {"b": None}})
+
+    def test_codec_int(self):
+
+        codec = pcollections.codecs.IntCodec()
+        self.helper_codec(codec, [1, -2, 3], {1, 2, 10**20}, {1: 2, -3: 4})
+        self.assertRaises(TypeError, codec.encode, "1")
+        self.assertRaises(TypeError, codec.encode, True)
+        self.assertRaises(TypeError, codec.encode, 1.5)
+
+    def test_codec_float(self):
+
+        codec = pcollections.codecs.FloatCodec()
+        self.helper_codec(codec, [0.1, -2.5, 1e100], {0.1, 2.0}, {0.5: 1.25})
+        self.assertEqual(2.0, codec.decode(codec.encode(2)))
+        self.assertRaises(TypeError, codec.encode, "1.5")
+
+    def test_codec_raw(self):
+
+        # Test Collections
+        codec = pcollections.codecs.RAW
+        self.helper_codec(codec, [b"\xff\x00", b"a"], {b"\xff", b"b"},
+                          {b"\x00k": b"\xffv", b"a": b"1"})
+        self.assertEqual(b"ab", codec.encode(bytearray(b"ab")))
+        self.assertEqual(b"ab", codec.encode(memoryview(b"ab")))
+        raw = b"\xff\x00"
+        self.assertIs(raw, codec.decode(raw))
+        self.assertRaises(TypeError, codec.encode, "a")
+        self.assertRaises(TypeError, codec.check, 1)
+
+        # Test Raw String
+        val = bytes(bytearray(range(256))) * 4
+        string = self.collection.String(self.generate_key(), create=val,
+                                        existing=False, codec=codec)
+        self.assertIsInstance(string.get_val(), bytes)
+        self.assertEqual(val, string.get_val())
+        self.assertEqual(len(val), len(string))
+        self.assertEqual(val[3], string[3])
+        self.assertEqual(val[-1], string[-1])
+        self.assertEqual(val[2:300], string[2:300])
+        self.assertEqual(val[-5:], string[-5:])
+        self.assertEqual(val[::3], string[::3])
+        self.assertRaises(IndexError, string.__getitem__, len(val))
+        self.assertTrue(b"\xfe\xff" in string)
+        self.assertTrue(255 in string)
+        self.assertFalse(b"\xff\xfe" in string)
+        self.assertEqual(list(val), list(string.iterate()))
+        self.assertRaises(TypeError, self.collection.MutableString, string.key,
+                          existing=True, codec=codec)
+
+        # Test Compressed Raw String
+        zipped = self.collection.String(self.generate_key(), create=val, existing=False,
+                                        codec=pcollections.codecs.ZlibCodec(codec, threshold=16))
+        self.assertEqual(val, zipped.get_val())
+        self.assertEqual(len(val), len(zipped))
+        self.assertEqual(val[3], zipped[3])
+        self.assertTrue(255 in zipped)
+
+        # Cleanup
+        string.rem()
+        zipped.rem()
+
+    def test_codec_zlib(self):
+
+        # Test Collections
+        codec = pcollections.codecs.ZlibCodec(pcollections.codecs.JsonCodec(), threshold=16)
+        big = {"a": ["x" * 100, 1], "b": None}
+        self.helper_codec(codec, [1, big, "y" * 100], {1, "a" * 100}, {"a": big, "b" * 50: 2})
+
+        # Test Headers
+        codec = pcollections.codecs.ZlibCodec(threshold=16)
+        self.assertEqual(b"\xff", codec.encode("x" * 100)[:1])
+        self.assertEqual(b"x" * 10, codec.encode("x" * 10))
+        self.assertEqual(b"\xfe\xff\x00", codec.encode(b"\xff\x00"))
+        self.assertEqual(b"\xfe\xfe", codec.encode(b"\xfe"))
+        self.assertEqual("\u00e9" * 100, codec.decode(codec.encode("\u00e9" * 100)))
+        self.assertEqual("abc", codec.decode(b"\xfeabc"))
+        self.assertRaises(TypeError, pcollections.codecs.ZlibCodec, "json")
+        self.assertRaises(ValueError, pcollections.codecs.ZlibCodec, threshold=-1)
+        self.assertRaises(ValueError, pcollections.codecs.ZlibCodec, level=10)
+
+        # Test Compressed String Reads Existing Text
+        val = "abc\u00e9" * 1000
+        plain = self.collection.MutableString(self.generate_key(), create=val, existing=False)
+        string = self.collection.MutableString(plain.key, existing=True, codec=codec)
+        self.assertEqual(val, string.get_val())
+
+        # Test Compressed String
+        string.set_val(val)
+        raw = self.collection.backend.driver.redis.get(string._redis_key)
+        self.assertEqual(b"\xff", raw[:1])
+        self.assertTrue(len(raw) < 100)
+        self.assertEqual(val, string.get_val())
+        self.assertEqual(len(val), len(string))
+        self.assertEqual(val[3], string[3])
+        self.assertEqual(val[2:6], string[2:6])
+        self.assertTrue("c\u00e9a" in string)
+        self.assertEqual(list(val[:8]), list(string.iterate())[:8])
+        string.append("z")
+        self.assertEqual("z", string.pop())
+        string[0] = "A"
+        self.assertEqual("A" + val[1:], string.get_val())
+        self.assertRaises(TypeError, self.collection.MutableString, self.generate_key(),
+                          codec=pcollections.codecs.ZlibCodec(pcollections.codecs.JsonCodec()))
+
+        # Cleanup
+        string.rem()
+
+    def test_codec_defaults(self):
+
+        # Test Collection Codec
+        backend = self.collection.backend
+        collection = pcollections.collections.PCollections(
+            backend, codec=pcollections.codecs.IntCodec())
+        lst = collection.MutableList(self.generate_key(), create=[1, 2], existing=False)
+        string = collection.MutableString(self.generate_key(), create="ab", existing=False)
+        self.assertEqual([1, 2], lst.get_val())
+        self.assertRaises(TypeError, lst.append, "3")
+        self.assertEqual("ab", string.get_val())
+
+        # Test Object Override
+        other = collection.MutableList(lst.key, existing=True,
+                                       codec=pcollections.codecs.Utf8Codec())
+        self.assertEqual(["1", "2"], other.get_val())
+
+        # Test Bad Codecs
+        self.assertRaises(TypeError, pcollections.collections.PCollections,
+                          backend, codec="json")
+        self.assertRaises(TypeError, backend.module.String, backend.driver,
+                          self.generate_key(), codec=pcollections.codecs.JsonCodec())
+
+        # Cleanup
+        lst.rem()
+        string.rem()
+
+class CountingCodec(pcollections.codecs.Utf8Codec):
+
+    def __init__(self):
+        super(CountingCodec, self).__init__()
+        self.encoded = 0
+        self.checked = 0
+
+    def encode(self, item):
+        self.encoded += 1
+        return super(CountingCodec, self).encode(item)
+
+    def check(self, item):
+        self.checked += 1
+        return super(CountingCodec, self).check(item)
+
+class EncodeOnceMixin(object):
+
+    def test_encode_once(self):
+
+        # Create Instances
+        codec = CountingCodec()
+        lst = self.collection.MutableList(self.generate_key(), create=[],
+                                          existing=False, codec=codec)
+        st = self.collection.MutableSet(self.generate_key(), create=set(),
+                                        existing=False, codec=codec)
+        dct = self.collection.MutableDictionary(self.generate_key(), create={},
+                                                existing=False, codec=codec)
+        itms = [str(i) for i in range(100)]
+
+        # Test Mutations Encode Each Item Once, Without a Separate Check
+        codec.encoded = 0
+        lst.extend(itms)
+        lst.append("a")
+        lst[0] = "b"
+        st.add_many(itms)
+        st |= itms
+        dct.update(zip(itms, itms))
+        dct["a"] = "c"
+        dct.delete_many(itms[:10])
+        self.assertEqual(100 + 1 + 1 + 100 + 100 + 200 + 2 + 10, codec.encoded)
+        self.assertEqual(0, codec.checked)
+        self.assertEqual(["b"] + itms[1:] + ["a"], lst.get_val())
+
+        # Cleanup
+        lst.rem()
+        st.rem()
+        dct.rem()